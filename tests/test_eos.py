@@ -21,7 +21,7 @@ SOFTWARE.
 '''
 
 from math import atanh as catanh
-from math import exp, log, log10, sqrt
+from math import exp, isnan, log, log10, sqrt
 
 import numpy as np
 import pytest
@@ -316,6 +316,84 @@ def test_PR_quick():
     T_analytical = PR_solve_T_analytical_orig(eos.P, eos.V_g, eos.Tc, eos.a, eos.b, eos.kappa)
     assert_close(T_analytical, eos.solve_T(P=eos.P, V=eos.V_g), rtol=1e-13)
 
+def test_PR_solve_T_both_roots():
+    eos = PR(Tc=658.0, Pc=1820000.0, omega=0.562, T=500., P=1e5)
+    V = 3.0*eos.b
+    T_low, T_high = eos.solve_T(1e7, V), eos.solve_T(1e7, V, solution='g')
+    assert T_low < 1000.0 < T_high
+    for T in (T_low, T_high):
+        assert_close(eos.to(T=T, V=V).P, 1e7, rtol=1e-11)
+    # No real temperature gives this pressure at this volume
+    with pytest.raises(ValueError):
+        eos.solve_T(1e9, V)
+
+def test_PR_from_TP_arrays():
+    Tc, Pc, omega = 507.6, 3025000.0, 0.2975
+    # The critical point itself is a triple root and too ill-conditioned to compare
+    Ts = np.array([200.0, 299.0, 400.0, 500.0, 510.0, 600.0, 2000.0])
+    Ps = np.array([1e3, 1e5, 1e6, 3e6, 3e7])
+    res = PR.from_TP_arrays(Tc, Pc, omega, Ts[:, None], Ps[None, :])
+    assert res['V_l'].shape == (7, 5)
+    for i, T in enumerate(Ts):
+        for j, P in enumerate(Ps):
+            eos = PR(Tc=Tc, Pc=Pc, omega=omega, T=T, P=P)
+            assert_close(res['a_alpha'][i, j], eos.a_alpha, rtol=1e-13)
+            assert_close(res['d2a_alpha_dT2'][i, j], eos.d2a_alpha_dT2, rtol=1e-13)
+            for suffix in ('_l', '_g'):
+                if not hasattr(eos, 'V' + suffix):
+                    assert np.isnan(res['V' + suffix][i, j])
+                    continue
+                for k in ('V', 'PIP', 'dP_dV', 'd2P_dTdV', 'Cv_dep'):
+                    assert_close(res[k + suffix][i, j], getattr(eos, k + suffix), rtol=1e-11)
+                for k in ('H_dep', 'S_dep', 'G_dep', 'Cp_dep'):
+                    assert_close(res[k + suffix][i, j], getattr(eos, k + suffix), rtol=1e-11, atol=1e-9)
+                for k in ('lnphi', 'phi', 'fugacity'):
+                    assert_close(res[k + suffix][i, j], getattr(eos, k + suffix), rtol=1e-9)
+    assert res['T'].shape == res['P'].shape == (7, 5)
+    assert all(v.flags['C_CONTIGUOUS'] for v in res.values())
+
+def test_PR_from_TP_cached():
+    PR.from_TP_cached.cache_clear()
+    base = PR.from_TP_cached(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    assert base is PR.from_TP_cached(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    assert base == PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    # Constructing normally never shares objects
+    assert PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5) is not PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    # Subclasses with a different alpha function must not share objects
+    twu = TWUPR.from_TP_cached(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    assert type(twu) is TWUPR and twu.a_alpha != base.a_alpha
+
+    PR.from_TP_cached.cache_clear()
+    assert PR.from_TP_cached(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5) is not base
+
+def test_PR_pure_TP_properties():
+    Tc, Pc, omega = 507.6, 3025000.0, 0.2975
+    for T in (200.0, 299.0, 400.0, 500.0, 510.0, 600.0, 2000.0):
+        for P in (1e3, 1e5, 1e6, 3e6, 3e7):
+            eos = PR(Tc=Tc, Pc=Pc, omega=omega, T=T, P=P)
+            a_alpha, da_alpha_dT, d2a_alpha_dT2, V_l, V_g, props_l, props_g = PR_pure_TP_properties(T, P, Tc, Pc, omega)
+            assert_close1d([a_alpha, da_alpha_dT, d2a_alpha_dT2],
+                           [eos.a_alpha, eos.da_alpha_dT, eos.d2a_alpha_dT2], rtol=1e-13)
+            for suffix, V, props in (('_l', V_l, props_l), ('_g', V_g, props_g)):
+                if not hasattr(eos, 'V' + suffix):
+                    assert isnan(V)
+                    assert all(isnan(v) for v in props)
+                    continue
+                assert V == getattr(eos, 'V' + suffix)
+                expect = [getattr(eos, k + suffix) for k in ('dP_dT', 'dP_dV', 'd2P_dT2', 'd2P_dV2',
+                                                             'd2P_dTdV', 'H_dep', 'S_dep', 'Cv_dep')]
+                assert_close1d(props, expect, rtol=1e-13)
+
+def test_PR_pure_TP_volumes():
+    Tc, Pc, omega = 507.6, 3025000.0, 0.2975
+    Ts = [200.0, 299.0, 400.0, 500.0, 510.0, 600.0, 2000.0]*5
+    Ps = [P for P in (1e3, 1e5, 1e6, 3e6, 3e7) for _ in range(7)]
+    V_ls, V_gs = PR_pure_TP_volumes(Ts, Ps, Tc, Pc, omega)
+    for T, P, V_l, V_g in zip(Ts, Ps, V_ls, V_gs):
+        ans = PR_pure_TP_properties(T, P, Tc, Pc, omega)
+        assert (V_l == ans[3]) or (isnan(V_l) and isnan(ans[3]))
+        assert (V_g == ans[4]) or (isnan(V_g) and isnan(ans[4]))
+
 def test_lnphi_l_low_TP():
     # Was failing because of an underflow
     eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=1.0, P=0.00013848863713938732)
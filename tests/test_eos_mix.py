@@ -4588,6 +4588,24 @@ def test_a_alpha_vectorized():
         a_alpha1 = obj.a_alpha_and_derivatives_vectorized(obj.T)[0]
         assert_close1d(a_alpha0, a_alpha1, rtol=1e-13)
 
+def test_a_alpha_and_derivatives_numpy():
+    eos = PRMIX(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.0403, 0.0115], zs=[0.5, 0.5], kijs=[[0,0.0289],[0.0289,0]])
+    calc = eos.a_alpha_and_derivatives_numpy(eos.a_alphas, eos.da_alpha_dTs, eos.d2a_alpha_dT2s, eos.T)
+    assert_close1d(calc, (eos.a_alpha, eos.da_alpha_dT, eos.d2a_alpha_dT2), rtol=1e-13)
+    assert_close(eos.a_alpha_and_derivatives_numpy(eos.a_alphas, eos.da_alpha_dTs, eos.d2a_alpha_dT2s, eos.T, full=False), eos.a_alpha, rtol=1e-13)
+    assert_close2d(eos.a_alpha_ijs, [[0.15396668784471504, 0.20696656897445628], [0.20696656897445628, 0.2950161049241185]], rtol=1e-12)
+
+def test_kijs_list_vectorized_converted():
+    kwargs = dict(T=115, P=1E6, Tcs=np.array([126.1, 190.6]), Pcs=np.array([33.94E5, 46.04E5]), omegas=np.array([0.0403, 0.0115]), zs=np.array([0.5, 0.5]))
+    kijs = [[0,0.0289],[0.0289,0]]
+    eos = PRMIX(kijs=kijs, **kwargs)
+    assert type(eos.kijs) is np.ndarray
+    assert type(eos.one_minus_kijs) is np.ndarray
+    assert eos.kijs.flags.c_contiguous
+    kijs_np = np.array(kijs)
+    assert PRMIX(kijs=kijs_np, **kwargs).kijs is kijs_np
+    assert_close(eos.a_alpha, PRMIX(kijs=kijs_np, **kwargs).a_alpha, rtol=1e-15)
+
 def test_MSRKMIXTranslated():
     eos = MSRKMIXTranslated(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.2, 0.8], kijs=[[0,0.03],[0.03,0]])
     assert_close1d(eos.a_alphas_vectorized(eos.T), eos.a_alphas, rtol=1e-13)
@@ -27,7 +27,7 @@ from thermo.eos import *
 from thermo.eos_alpha_functions import *
 from thermo.eos_mix import *
 from thermo.eos_mix_methods import *
-from thermo.eos_mix_methods import a_alpha_and_derivatives_quadratic_terms, a_alpha_quadratic_terms
+from thermo.eos_mix_methods import a_alpha_and_derivatives_quadratic_terms, a_alpha_quadratic_terms, a_alpha_quadratic_terms_parallel
 
 
 def test_a_alpha_quadratic_terms():
@@ -42,6 +42,16 @@ def test_a_alpha_quadratic_terms():
     a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, 299.0, zs, one_minus_kijs)
     assert_close1d(expect, a_alpha_j_rows, rtol=1e-14)
     assert_close(a_alpha, 11.996512274167202, rtol=1e-14)
+    assert_close(a_alpha_quadratic(a_alphas, a_alpha_roots, zs, one_minus_kijs), 11.996512274167202, rtol=1e-13)
+    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, 299.0, zs, None)
+    assert_close1d(expect, a_alpha_j_rows, rtol=1e-13)
+    assert_close(a_alpha, 11.996512274167202, rtol=1e-13)
+
+    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms_parallel(a_alphas, a_alpha_roots, 299.0, zs, one_minus_kijs)
+    assert_close1d(expect, a_alpha_j_rows, rtol=1e-13)
+    assert_close(a_alpha, 11.996512274167202, rtol=1e-13)
+    assert_close(a_alpha_quadratic(np.array(a_alphas), np.array(a_alpha_roots), np.array(zs), np.array(one_minus_kijs)),
+                 11.996512274167202, rtol=1e-13)
 
     # Small case but with constant kijs
     kijs = [[0,.083],[0.083,0]]
@@ -53,6 +63,15 @@ def test_a_alpha_quadratic_terms():
     a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, 299.0, zs, one_minus_kijs)
     assert_close1d([0.35469988173420947, 0.6160475723779467], a_alpha_j_rows, rtol=1e-14)
     assert_close(a_alpha, 0.5856213958288955, rtol=1e-14)
+    assert_close(a_alpha_quadratic(a_alphas, a_alpha_roots, zs, one_minus_kijs), 0.5856213958288955, rtol=1e-14)
+
+    # NumPy inputs take the matrix-vector product path
+    a_alpha_j_rows = np.zeros(2)
+    a_alpha, a_alpha_j_rows_calc = a_alpha_quadratic_terms(np.array(a_alphas), np.array(a_alpha_roots), 299.0,
+                                                           np.array(zs), np.array(one_minus_kijs), a_alpha_j_rows)
+    assert a_alpha_j_rows_calc is a_alpha_j_rows
+    assert_close1d([0.35469988173420947, 0.6160475723779467], a_alpha_j_rows, rtol=1e-14)
+    assert_close(a_alpha, 0.5856213958288955, rtol=1e-14)
 
 
 def test_a_alpha_and_derivatives_quadratic_terms():
@@ -76,6 +95,23 @@ def test_a_alpha_and_derivatives_quadratic_terms():
     assert_close(d2a_alpha_dT2, 5.9978809895526926e-05, rtol=1e-14)
     assert_close1d(da_alpha_dT_j_rows_expect, da_alpha_dT_j_rows, rtol=1e-14)
 
+    # NumPy inputs use matrix-vector products
+    a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows = a_alpha_and_derivatives_quadratic_terms(
+        np.array(a_alphas), np.array(a_alpha_roots), np.array(da_alpha_dTs), np.array(d2a_alpha_dT2s), 299.0, np.array(zs), np.array(one_minus_kijs))
+    assert_close1d(expect, a_alpha_j_rows, rtol=1e-13)
+    assert_close(a_alpha, 11.996512274167202, rtol=1e-13)
+    assert_close(da_alpha_dT, -0.0228875173310534, rtol=1e-13)
+    assert_close(d2a_alpha_dT2, 5.9978809895526926e-05, rtol=1e-13)
+    assert_close1d(da_alpha_dT_j_rows_expect, da_alpha_dT_j_rows, rtol=1e-13)
+
+    # No kijs at all
+    a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, None)
+    assert_close1d(expect, a_alpha_j_rows, rtol=1e-13)
+    assert_close(a_alpha, 11.996512274167202, rtol=1e-13)
+    assert_close(da_alpha_dT, -0.0228875173310534, rtol=1e-13)
+    assert_close(d2a_alpha_dT2, 5.9978809895526926e-05, rtol=1e-13)
+    assert_close1d(da_alpha_dT_j_rows_expect, da_alpha_dT_j_rows, rtol=1e-13)
+
 
     kijs = [[0,.083],[0.083,0]]
     one_minus_kijs = [[1.0 - kij for kij in row] for row in kijs]
@@ -96,6 +132,50 @@ def test_a_alpha_and_derivatives_quadratic_terms():
     assert_close1d(da_alpha_dT_j_rows, [-0.0006723873746135188, -0.0010642935017889568], rtol=1e-14)
 
 
+def test_a_alpha_and_derivatives_quadratic_terms_batched():
+    kwargs = dict(Tcs=[190.56400000000002, 305.32, 369.83, 126.2],
+                  Pcs=[4599000.0, 4872000.0, 4248000.0, 3394387.5],
+                  omegas=[0.008, 0.098, 0.152, 0.04],
+                  zs=[.1, .2, .3, .4],
+                  kijs=[[0.0, -0.0059, 0.0119, 0.0289], [-0.0059, 0.0, 0.0011, 0.0533], [0.0119, 0.0011, 0.0, 0.0878], [0.0289, 0.0533, 0.0878, 0.0]])
+    eos = PRMIX(T=200, P=1e5, **kwargs)
+    Ts = [150.0, 200.0, 300.0]
+    terms = [eos.a_alpha_and_derivatives_vectorized(T) for T in Ts]
+    a_alphas, da_alpha_dTs, d2a_alpha_dT2s = (np.array([t[k] for t in terms]) for k in range(3))
+    calc = a_alpha_and_derivatives_quadratic_terms_batched(a_alphas, np.sqrt(a_alphas), da_alpha_dTs, d2a_alpha_dT2s,
+                                                           np.array(eos.zs), np.array(eos.one_minus_kijs))
+    assert calc[0].shape == (3,) and calc[3].shape == (3, 4)
+    for m, T in enumerate(Ts):
+        expect = a_alpha_and_derivatives_quadratic_terms(terms[m][0], [v**0.5 for v in terms[m][0]], terms[m][1], terms[m][2],
+                                                         T, eos.zs, eos.one_minus_kijs)
+        for k in range(3):
+            assert_close(calc[k][m], expect[k], rtol=1e-13)
+        assert_close1d(calc[3][m], expect[3], rtol=1e-13)
+        assert_close1d(calc[4][m], expect[4], rtol=1e-13)
+
+
+def test_a_alpha_roots_and_root_invs():
+    a_alphas = [0.2491099357671155, 0.0, 0.6486495863528039]
+    a_alpha_roots, a_alpha_root_invs = a_alpha_roots_and_root_invs(a_alphas)
+    assert_close1d(a_alpha_roots, [0.4991091421393877, 0.0, 0.8053878484015039], rtol=1e-15)
+    assert_close1d(a_alpha_root_invs, [2.0035697917966147, 0.0, 1.2416378046735534], rtol=1e-15)
+
+    a_alpha_roots, a_alpha_root_invs = [1.0]*3, [1.0]*3
+    calc = a_alpha_roots_and_root_invs(a_alphas, a_alpha_roots, a_alpha_root_invs)
+    assert calc[0] is a_alpha_roots and calc[1] is a_alpha_root_invs
+    assert a_alpha_root_invs[1] == 0.0
+
+    # Precomputed inverses give the same derivatives
+    zs = [0.2, 0.3, 0.5]
+    one_minus_kijs = [[1.0, 0.9, 0.95], [0.9, 1.0, 0.98], [0.95, 0.98, 1.0]]
+    da_alpha_dTs = [-0.0005102028006086241, 0.0, -0.0011131153520304886]
+    d2a_alpha_dT2s = [1.8651128859234162e-06, 0.0, 3.884331923127011e-06]
+    expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, one_minus_kijs)
+    calc = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, one_minus_kijs,
+                                                   a_alpha_root_invs=a_alpha_root_invs)
+    assert calc == expect
+
+
 def test_a_alpha_aijs_composition_independent():
     kijs = [[0,.083],[0.083,0]]
     one_minus_kijs = [[1.0 - kij for kij in row] for row in kijs]
@@ -106,6 +186,28 @@ def test_a_alpha_aijs_composition_independent():
     assert_close1d(a_alpha_roots, [0.4991091421393877, 0.8053878484015039], rtol=1e-13)
     assert_close1d(a_alpha_ij_roots_inv,  [[4.014291910599931, 2.4877079977965977], [2.4877079977965977, 1.5416644379945614]], rtol=1e-13)
 
+    outs = (np.zeros((2, 2)), np.zeros(2), np.zeros((2, 2)))
+    calc = a_alpha_aijs_composition_independent(np.array(a_alphas), np.array(one_minus_kijs), *outs)
+    for v, out in zip(calc, outs):
+        assert v is out
+    assert_close2d(calc[0], [[0.2491099357671155, 0.3686123937424334], [0.3686123937424334, 0.6486495863528038]], rtol=1e-13)
+    assert_close1d(calc[1], [0.4991091421393877, 0.8053878484015039], rtol=1e-13)
+    assert_close2d(calc[2],  [[4.014291910599931, 2.4877079977965977], [2.4877079977965977, 1.5416644379945614]], rtol=1e-13)
+
+    # A zero a_alpha gets a zero inverse root, as in a_alpha_roots_and_root_invs
+    a_alphas = [0.0, 0.2491099357671155, 0.6486495863528039]
+    one_minus_kijs = [[1.0, 0.9, 0.95], [0.9, 1.0, 0.917], [0.95, 0.917, 1.0]]
+    da_alpha_dTs = [0.0, -0.0005102028006086241, -0.0011131153520304886]
+    d2a_alpha_dT2s = [0.0, 1.8651128859234162e-06, 3.884331923127011e-06]
+    zs = [0.0, 0.4, 0.6]
+    a_alpha_roots, a_alpha_root_invs = a_alpha_roots_and_root_invs(a_alphas)
+    expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, one_minus_kijs)
+    for arr in (list, np.array):
+        inv = a_alpha_aijs_composition_independent(arr(a_alphas), arr(one_minus_kijs))[2]
+        assert_close2d(inv, [[0.0, 0.0, 0.0], [0.0, 4.014291910599931, 2.4877079977965977], [0.0, 2.4877079977965977, 1.5416644379945614]], rtol=1e-13)
+        calc = a_alpha_and_derivatives_full(arr(a_alphas), arr(da_alpha_dTs), arr(d2a_alpha_dT2s), 299.0, arr(zs), arr(one_minus_kijs))
+        assert_close1d(calc[:3], expect[:3], rtol=1e-13)
+
 
 def test_PR_lnphis_fastest():
     kwargs = dict(Tcs=[190.56400000000002, 305.32, 369.83, 126.2],
@@ -121,3 +223,31 @@ def test_PR_lnphis_fastest():
     expect = eos.lnphis_g
     calc = PR_lnphis_fastest(eos.zs, eos.T, eos.P, 4, eos.one_minus_kijs, False, True, eos.bs, eos.a_alphas, eos.a_alpha_roots)
     assert_close1d(expect, calc, rtol=1e-14)
+
+    # NumPy inputs assemble the result with array operations
+    lnphis = np.zeros(4)
+    calc = PR_lnphis_fastest(np.array(eos.zs), eos.T, eos.P, 4, np.array(eos.one_minus_kijs), False, True, np.array(eos.bs),
+                             np.array(eos.a_alphas), np.array(eos.a_alpha_roots), lnphis=lnphis)
+    assert calc is lnphis
+    assert_close1d(expect, calc, rtol=1e-13)
+
+
+def test_SRK_VDW_lnphis_fastest_numpy():
+    kwargs = dict(Tcs=[190.56400000000002, 305.32, 369.83, 126.2],
+                  Pcs=[4599000.0, 4872000.0, 4248000.0, 3394387.5],
+                  omegas=[0.008, 0.098, 0.152, 0.04],
+                  zs=[.1, .2, .3, .4],
+                  kijs=[[0.0, -0.0059, 0.0119, 0.0289], [-0.0059, 0.0, 0.0011, 0.0533], [0.0119, 0.0011, 0.0, 0.0878], [0.0289, 0.0533, 0.0878, 0.0]])
+    for cls, func in ((SRKMIX, SRK_lnphis_fastest), (VDWMIX, VDW_lnphis_fastest)):
+        eos = cls(T=200, P=1e5, **kwargs)
+        lnphis = np.zeros(4)
+        calc = func(np.array(eos.zs), eos.T, eos.P, 4, np.array(eos.one_minus_kijs), False, True, np.array(eos.bs),
+                    np.array(eos.a_alphas), np.array(eos.a_alpha_roots), lnphis=lnphis)
+        assert calc is lnphis
+        assert_close1d(eos.lnphis_g, calc, rtol=1e-13)
+
+
+def test_PR_lnphis_zero_a_alpha():
+    lnphis = PR_lnphis(T=300.0, P=1e5, Z=1.0, b=0.0, a_alpha=0.0, bs=[0.0, 0.0, 0.0],
+                       a_alpha_j_rows=[0.0, 0.0, 0.0], N=3, lnphis=[1.0, 1.0, 1.0])
+    assert lnphis == [0.0, 0.0, 0.0]
@@ -146,3 +146,20 @@ hard_solutions[(222.04, 120.66, 12.736158671821732, 25.472317343643464, -162.209
 @pytest.mark.parametrize("solver", [volume_solutions_halley, GCEOS.volume_solutions])
 def test_hard_default_solver_volumes(solver, params):
     validate_volume(params, solver, rtol=1e-14)
+
+
+def test_volume_solutions_vectorized():
+    import numpy as np
+    Ts = np.array([150.0, 299.0, 400.0, 500.0, 2000.0])
+    Ps = np.array([1e-2, 1e5, 1e6, 3e7, 1e8])
+    eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+    a_alphas = np.array([eos.a_alpha_pure(T) for T in Ts])
+    Vs = volume_solutions_vectorized(Ts[:, None], Ps[None, :], eos.b, eos.delta, eos.epsilon, a_alphas[:, None])
+    assert Vs.shape == (5, 5, 3)
+    for i, T in enumerate(Ts):
+        for j, P in enumerate(Ps):
+            expect = [V for V in volume_solutions_halley(T, P, eos.b, eos.delta, eos.epsilon, a_alphas[i])
+                      if V.imag == 0.0 and V.real > eos.b]
+            calc = [V.real for V in Vs[i, j] if V.imag == 0.0 and V.real > eos.b]
+            assert_close(min(calc), min(expect), rtol=1e-13)
+            assert_close(max(calc), max(expect), rtol=1e-13)
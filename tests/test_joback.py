@@ -22,40 +22,50 @@ SOFTWARE.
 
 import os
 
+import numpy as np
 import pytest
-from chemicals.identifiers import pubchem_db
 from fluids.numerics import assert_close, assert_close1d
 
 from thermo.group_contribution.joback import *
-from thermo.group_contribution.joback import J_BIGGS_JOBACK_SMARTS_id_dict
+from thermo.group_contribution.group_contribution_base import smarts_element_mask
+from thermo.group_contribution.joback import J_BIGGS_JOBACK_SMARTS_element_masks, J_BIGGS_JOBACK_SMARTS_id_dict, load_joback_catalog
 
 folder = os.path.join(os.path.dirname(__file__), 'Data')
 
 try:
     import rdkit
+    from rdkit import Chem
 except:
     rdkit = None
 
 @pytest.mark.rdkit
 @pytest.mark.skipif(rdkit is None, reason="requires rdkit")
-def test_Joback_acetone():
-    from rdkit import Chem
-    for i in [Chem.MolFromSmiles('CC(=O)C'), 'CC(=O)C']:
-        ex = Joback(i) # Acetone example
-        assert_close(ex.Tb(ex.counts), 322.11)
-        assert_close(ex.Tm(ex.counts), 173.5)
-        assert_close(ex.Tc(ex.counts), 500.5590049525365)
-        assert_close(ex.Tc(ex.counts, 322.11), 500.5590049525365)
-        assert_close(ex.Pc(ex.counts, ex.atom_count), 4802499.604994407)
-        assert_close(ex.Vc(ex.counts), 0.0002095)
-        assert_close(ex.Hf(ex.counts), -217830)
-        assert_close(ex.Gf(ex.counts), -154540)
-        assert_close(ex.Hfus(ex.counts), 5125)
-        assert_close(ex.Hvap(ex.counts), 29018)
-        assert_close1d(ex.Cpig_coeffs(ex.counts),[7.52, 0.26084, -0.0001207, 1.546e-08] )
-        assert_close(ex.Cpig(300.0), 75.32642000000001)
-        assert_close1d(ex.mul_coeffs(ex.counts), [839.11, -14.99])
-        assert_close(ex.mul(300.0), 0.0002940378347162687)
+@pytest.mark.parametrize("from_mol", [True, False], ids=['mol', 'smiles'])
+def test_Joback_acetone(from_mol):
+    smiles = 'CC(=O)C'
+    if from_mol:
+        ex = Joback(Chem.MolFromSmiles(smiles)) # Acetone example
+    else:
+        ex = Joback(smiles)
+    counts, atom_count = ex.counts, ex.atom_count
+    calc = [ex.Tb(counts), ex.Tm(counts), ex.Tc(counts), ex.Tc(counts, 322.11),
+            ex.Pc(counts, atom_count), ex.Vc(counts), ex.Hf(counts),
+            ex.Gf(counts), ex.Hfus(counts), ex.Hvap(counts)]
+    assert_close1d(calc, [322.11, 173.5, 500.5590049525365, 500.5590049525365,
+                          4802499.604994407, 0.0002095, -217830, -154540, 5125, 29018])
+    assert_close1d(ex.Cpig_coeffs(counts),[7.52, 0.26084, -0.0001207, 1.546e-08] )
+    assert_close(ex.Cpig(300.0), 75.32642000000001)
+    assert_close1d(ex.mul_coeffs(counts), [839.11, -14.99])
+    assert_close(ex.mul(300.0), 0.0002940378347162687)
+    Ts = np.array([300.0, 400.0])
+    assert_close1d(ex.Cpig(Ts), [ex.Cpig(300.0), ex.Cpig(400.0)], rtol=1e-14)
+    assert_close1d(ex.mul(Ts), [ex.mul(300.0), ex.mul(400.0)], rtol=1e-14)
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_Joback_catalog_and_missing_groups():
+    # The compiled SMARTS patterns are shared between instances
+    assert load_joback_catalog() is load_joback_catalog()
 
     with pytest.raises(ValueError):
         # Raise an error if there are no groups matched
@@ -97,30 +107,58 @@ def test_Joback_2_methylphenol_PGL6():
     assert_close(estimates['Pc'], 5029928.072028569, rtol=1e-13)
     assert_close(estimates['Vc'], 0.0002855, rtol=1e-13)
 
+@pytest.fixture(scope="session")
+def pubchem_db_loaded():
+    # The full pubchem database is large; load it at most once per session
+    from chemicals.identifiers import pubchem_db
+    pubchem_db.autoload_main_db()
+    return pubchem_db
+
+def _joback_database_line(item):
+    CASs, smiles = item
+    try:
+        mol = Chem.MolFromSmiles(smiles)
+        parsed = smarts_fragment(rdkitmol=mol, catalog=load_joback_catalog(), deduplicate=False)
+        return f'{parsed[2]}\t{CASs}\t{smiles}\t{parsed[0]}\n'
+    except Exception as e:
+        return f'{CASs}\t{smiles}\t{e}\n'
+
+def test_smarts_element_mask():
+    C, N, O = 1 << 6, 1 << 7, 1 << 8
+    assert smarts_element_mask('[CX4H3]') == C
+    assert smarts_element_mask('[OX2H]-[C]=O') == C | O
+    assert smarts_element_mask('[#6X2]#[#7X1H0]') == C | N
+    assert smarts_element_mask('c1ccccc1Cl') == C | (1 << 17)
+    assert smarts_element_mask('[Si]') == 1 << 14
+    # Hydrogen counts and negations require nothing
+    assert smarts_element_mask('[C;H2]') == C
+    assert smarts_element_mask('[!#6]') == 0
+    assert smarts_element_mask('[!$(C=O)]') == 0
+    # Lists require only what every alternative requires
+    assert smarts_element_mask('[R;CX3H1,cX3H1]') == C
+    assert smarts_element_mask('[C,N]') == 0
+    # The atoms of recursive SMARTS must all be present
+    assert smarts_element_mask('[$([CX2H0](=*)=*)]') == C
+    assert smarts_element_mask('[$([#7X3,#7X3+][!#8])](=[O])~[O-]') == N | O
+
+    assert J_BIGGS_JOBACK_SMARTS_element_masks[16] == 1 << 9
+    assert J_BIGGS_JOBACK_SMARTS_element_masks[24] == C | O
+    # Every Biggs group names at least its anchor element
+    assert all(J_BIGGS_JOBACK_SMARTS_element_masks.values())
+
 @pytest.mark.fuzz
 @pytest.mark.slow
 @pytest.mark.rdkit
 @pytest.mark.skipif(rdkit is None, reason="requires rdkit")
-def test_Joback_database():
-    pubchem_db.autoload_main_db()
+def test_Joback_database(pubchem_db_loaded):
+    import multiprocessing
 
-    f = open(os.path.join(folder, 'joback_log.txt'), 'w')
-    from rdkit import Chem
-    catalog = unifac_smarts = {i: Chem.MolFromSmarts(j) for i, j in J_BIGGS_JOBACK_SMARTS_id_dict.items()}
-    lines = []
-    for key in sorted(pubchem_db.CAS_index):
-        chem_info = pubchem_db.CAS_index[key]
-        try:
-            mol = Chem.MolFromSmiles(chem_info.smiles)
-            parsed = smarts_fragment(rdkitmol=mol, catalog=catalog, deduplicate=False)
-            line = f'{parsed[2]}\t{chem_info.CASs}\t{chem_info.smiles}\t{parsed[0]}\n'
-        except Exception as e:
-            line = f'{chem_info.CASs}\t{chem_info.smiles}\t{e}\n'
-        lines.append(line)
-
-    [f.write(line) for line in sorted(lines)]
-    f.close()
-
-# Maybe use this again if more work is done on Joback
-del test_Joback_database
+    CAS_index = pubchem_db_loaded.CAS_index
+    items = [(CAS_index[key].CASs, CAS_index[key].smiles) for key in sorted(CAS_index)]
+    # Each molecule is independent; every worker compiles the catalog once
+    with multiprocessing.Pool(initializer=load_joback_catalog) as pool:
+        lines = list(pool.imap_unordered(_joback_database_line, items, chunksize=256))
+
+    with open(os.path.join(folder, 'joback_log.txt'), 'w') as f:
+        f.write(''.join(sorted(lines)))
 
@@ -274,6 +274,78 @@ def test_a_alpha_quadratic_terms_numba():
     assert_close(a_alpha, a_alpha_expect, rtol=1e-13)
     assert_close1d(a_alpha_j_rows, a_alpha_j_rows_expect, rtol=1e-13)
 
+    assert_close(thermo.numba.a_alpha_quadratic(a_alphas, a_alpha_roots, zs, one_minus_kijs), a_alpha_expect, rtol=1e-13)
+
+    a_alpha, a_alpha_j_rows = thermo.numba.a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, None)
+    a_alpha_expect, a_alpha_j_rows_expect = thermo.eos_mix_methods.a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, np.ones((2, 2)))
+    assert_close(a_alpha, a_alpha_expect, rtol=1e-13)
+    assert_close1d(a_alpha_j_rows, a_alpha_j_rows_expect, rtol=1e-13)
+
+@mark_as_numba
+def test_a_alpha_quadratic_terms_parallel_numba():
+    # Enough components to take the parallel path
+    N = 70
+    T = 299.0
+    a_alphas = np.linspace(0.1, 5.0, N)
+    a_alpha_roots = np.sqrt(a_alphas)
+    zs = np.linspace(1.0, 2.0, N)
+    zs /= zs.sum()
+    kijs = np.outer(np.linspace(0.0, 0.1, N), np.linspace(0.0, 0.1, N))
+    np.fill_diagonal(kijs, 0.0)
+    one_minus_kijs = 1.0 - kijs
+    a_alpha, a_alpha_j_rows = thermo.numba.a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, one_minus_kijs)
+    a_alpha_expect, a_alpha_j_rows_expect = thermo.eos_mix_methods.a_alpha_quadratic_terms(a_alphas.tolist(), a_alpha_roots.tolist(), T,
+                                                                                           zs.tolist(), one_minus_kijs.tolist())
+    assert_close(a_alpha, a_alpha_expect, rtol=1e-13)
+    assert_close1d(a_alpha_j_rows, a_alpha_j_rows_expect, rtol=1e-13)
+
+@mark_as_numba
+def test_a_alpha_and_derivatives_quadratic_terms_numba():
+    T = 299.0
+    kijs = np.array([[0,.083],[0.083,0]])
+    one_minus_kijs = 1.0 - kijs
+    zs = np.array([0.1164203, 0.8835797])
+    a_alphas = np.array([0.2491099357671155, 0.6486495863528039])
+    a_alpha_roots = np.sqrt(a_alphas)
+    da_alpha_dTs = np.array([-0.0005102028006086241, -0.0011131153520304886])
+    d2a_alpha_dT2s = np.array([1.8651128859234162e-06, 3.884331923127011e-06])
+    calc = thermo.numba.a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, T, zs, one_minus_kijs)
+    expect = thermo.eos_mix_methods.a_alpha_and_derivatives_quadratic_terms(a_alphas.tolist(), a_alpha_roots.tolist(), da_alpha_dTs.tolist(),
+                                                                            d2a_alpha_dT2s.tolist(), T, zs.tolist(), one_minus_kijs.tolist())
+    for v, v_expect in zip(calc[0:3], expect[0:3]):
+        assert_close(v, v_expect, rtol=1e-13)
+    assert_close1d(calc[3], expect[3], rtol=1e-13)
+    assert_close1d(calc[4], expect[4], rtol=1e-13)
+
+    a_alpha_j_rows, da_alpha_dT_j_rows = np.zeros(2), np.zeros(2)
+    calc = thermo.numba.a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, T, zs, one_minus_kijs,
+                                                                a_alpha_j_rows, da_alpha_dT_j_rows)
+    assert_close1d(a_alpha_j_rows, expect[3], rtol=1e-13)
+    assert_close1d(da_alpha_dT_j_rows, expect[4], rtol=1e-13)
+
+    calc = thermo.numba.a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, T, zs, None)
+    expect = thermo.eos_mix_methods.a_alpha_and_derivatives_quadratic_terms(a_alphas.tolist(), a_alpha_roots.tolist(), da_alpha_dTs.tolist(),
+                                                                            d2a_alpha_dT2s.tolist(), T, zs.tolist(), [[1.0, 1.0], [1.0, 1.0]])
+    for v, v_expect in zip(calc[0:3], expect[0:3]):
+        assert_close(v, v_expect, rtol=1e-13)
+    assert_close1d(calc[3], expect[3], rtol=1e-13)
+    assert_close1d(calc[4], expect[4], rtol=1e-13)
+
+
+@mark_as_numba
+def test_PR_lnphis_fastest_numba():
+    kwargs = dict(Tcs=np.array([190.56400000000002, 305.32, 369.83, 126.2]),
+                  Pcs=np.array([4599000.0, 4872000.0, 4248000.0, 3394387.5]),
+                  omegas=np.array([0.008, 0.098, 0.152, 0.04]),
+                  zs=np.array([.1, .2, .3, .4]),
+                  kijs=np.array([[0.0, -0.0059, 0.0119, 0.0289], [-0.0059, 0.0, 0.0011, 0.0533], [0.0119, 0.0011, 0.0, 0.0878], [0.0289, 0.0533, 0.0878, 0.0]]))
+    eos = PRMIX(T=200, P=1e5, **kwargs)
+    calc = thermo.numba.PR_lnphis_fastest(eos.zs, eos.T, eos.P, 4, eos.one_minus_kijs, True, False, eos.bs, eos.a_alphas, eos.a_alpha_roots)
+    assert_close1d(calc, eos.lnphis_l, rtol=1e-13)
+    calc = thermo.numba.PR_lnphis_fastest(eos.zs, eos.T, eos.P, 4, eos.one_minus_kijs, False, True, eos.bs, eos.a_alphas, eos.a_alpha_roots)
+    assert_close1d(calc, eos.lnphis_g, rtol=1e-13)
+
+
 @mark_as_numba
 def test_a_alpha_and_derivatives_full():
     kijs = np.array([[0,.083],[0.083,0]])
@@ -365,6 +437,26 @@ def test_RegularSolution_gammas_numba():
 
 
 
+@mark_as_numba
+def test_PR_pure_TP_properties_numba():
+    for T, P in ((299.0, 1e5), (600.0, 1e5), (200.0, 3e7)):
+        expect = thermo.eos.PR_pure_TP_properties(T, P, 507.6, 3025000.0, 0.2975)
+        calc = thermo.numba.PR_pure_TP_properties(T, P, 507.6, 3025000.0, 0.2975)
+        assert_close1d(calc[:5], expect[:5], rtol=1e-13)
+        assert_close1d(calc[5], expect[5], rtol=1e-13)
+        assert_close1d(calc[6], expect[6], rtol=1e-13)
+
+
+@mark_as_numba
+def test_PR_pure_TP_volumes_numba():
+    Ts = np.array([200.0, 299.0, 600.0, 510.0])
+    Ps = np.array([3e7, 1e5, 1e5, 3e6])
+    expect = thermo.eos.PR_pure_TP_volumes(Ts.tolist(), Ps.tolist(), 507.6, 3025000.0, 0.2975)
+    calc = thermo.numba.PR_pure_TP_volumes(Ts, Ps, 507.6, 3025000.0, 0.2975)
+    assert_close1d(calc[0], expect[0], rtol=1e-13)
+    assert_close1d(calc[1], expect[1], rtol=1e-13)
+
+
 @mark_as_numba
 def test_volume_numba_solvers():
 
@@ -121,6 +121,20 @@ def test_VolumeGas():
     H2.method_P = CRC_VIRIAL
     assert_close(H2.TP_dependent_property(300, 1E5), 0.024958843346854165)
 
+@pytest.mark.meta_T_dept
+def test_VolumeGas_Tabular_P_spline():
+    # With at least 5 points in T and P the interpolation is a cubic spline
+    EtOH = VolumeGas(MW=46.06844, Tc=514.0, Pc=6137000.0, omega=0.635, dipole=1.44, CASRN='64-17-5')
+    EtOH.method_P = TSONOPOULOS_EXTENDED
+    Ts = [400, 450, 500, 550, 600, 650]
+    Ps = [5E3, 1E4, 2E4, 3E4, 4E4, 5E4]
+    TP_data = [[EtOH.TP_dependent_property(T, P) for T in Ts] for P in Ps]
+    expect = EtOH.TP_dependent_property(425.0, 1.5E4)
+    EtOH.add_tabular_data_P(Ts, Ps, TP_data, name='CPdata')
+    assert_close(EtOH.TP_dependent_property(425.0, 1.5E4), expect, rtol=1e-5)
+    recalc_pts = [[EtOH.TP_dependent_property(T, P) for T in Ts] for P in Ps]
+    assert_close2d(TP_data, recalc_pts, rtol=1e-13)
+
 @pytest.mark.meta_T_dept
 def test_VolumeGas_Tabular_json_eval():
     obj = VolumeGas(MW=46.06844, Tc=514.0, Pc=6137000.0, omega=0.635, dipole=1.44, CASRN='64-17-5')
@@ -159,6 +173,20 @@ def test_VolumeLiquid_CoolProp():
 
 
 
+@pytest.mark.meta_T_dept
+def test_VolumeLiquid_call_cache():
+    obj = VolumeLiquid(CASRN='64-17-5', MW=46.06844, Tb=351.39, Tc=514.0, Pc=6137000.0, Vc=0.000168,
+                       Zc=0.24125, omega=0.635, dipole=1.44)
+    obj.method_P = 'NEGLECT_P'
+    obj.method = 'RACKETT'
+    V_300, V_310 = obj(300.0, 1e5), obj(310.0, 1e5)
+    # Alternating points are both kept
+    assert obj(300.0, 1e5) == V_300 == obj.TP_dependent_property(300.0, 1e5)
+    assert obj(310.0, 1e5) == V_310
+    # NEGLECT_P depends on the low-pressure method, so changing it resets the cache
+    obj.method = 'YEN_WOODS_SAT'
+    assert obj(300.0, 1e5) == obj.T_dependent_property(300.0) != V_300
+
 @pytest.mark.meta_T_dept
 def test_VolumeLiquid():
     # Ethanol, test all methods at once
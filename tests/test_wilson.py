@@ -822,6 +822,71 @@ def test_Wilson_numpy_output_correct_array_internal_ownership():
         assert obj.flags.owndata
 
 
+def test_Wilson_numpy_lambdas_list_coefficients():
+    T = 331.42
+    A = [[0.0, 3.870101271243586, 0.07939943395502425],
+         [-6.491263271243587, 0.0, -3.276991837288562],
+         [0.8542855660449756, 6.906801837288562, 0.0]]
+    B = [[0.0, -375.2835, -31.1208], [1722.58, 0.0, 1140.79], [-747.217, -3596.17, -0.0]]
+    D = [[-0.0, -0.00791073, -0.000868371], [0.00747788, -0.0, -3.1e-05], [0.00124796, -3e-05, -0.0]]
+    F = [[0.0, 1e-07, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+    xs = [0.229, 0.175, 0.596]
+    model = Wilson(T=T, xs=xs, ABCDEF=(A, B, None, D, None, F))
+    # List coefficients with array mole fractions are stored as arrays
+    modelnp = Wilson(T=T, xs=np.array(xs), ABCDEF=(A, B, None, D, None, F))
+    assert type(modelnp.lambda_bs) is np.ndarray
+    assert type(modelnp.lambdas()) is np.ndarray
+    assert_close2d(modelnp.lambdas(), model.lambdas(), rtol=1e-15)
+    assert_close2d(modelnp.to_T_xs(T=350.0, xs=np.array(xs)).lambdas(),
+                   model.to_T_xs(T=350.0, xs=xs).lambdas(), rtol=1e-15)
+    assert_close1d(modelnp.gammas(), model.gammas(), rtol=1e-13)
+
+    # Temperature derivatives with all six coefficients set
+    C = [[0.0, 0.1, -0.2], [0.3, 0.0, 0.05], [-0.1, 0.2, 0.0]]
+    E = [[0.0, 1e3, -2e3], [5e2, 0.0, 1e3], [-1e3, 2e2, 0.0]]
+    model = Wilson(T=T, xs=xs, ABCDEF=(A, B, C, D, E, F))
+    modelnp = Wilson(T=T, xs=np.array(xs), ABCDEF=(A, B, C, D, E, F))
+    for name in ('lambdas', 'dlambdas_dT', 'd2lambdas_dT2', 'd3lambdas_dT3'):
+        assert_close2d(getattr(modelnp, name)(), getattr(model, name)(), rtol=1e-13)
+    for name in ('xj_Lambda_ijs', 'xj_dLambda_dTijs', 'xj_d2Lambda_dT2ijs', 'xj_d3Lambda_dT3ijs'):
+        assert_close1d(getattr(modelnp, name)(), getattr(model, name)(), rtol=1e-13)
+
+    # Two-parameter form
+    model_AB = Wilson(T=T, xs=xs, ABCDEF=(A, B))
+    assert_close2d(model_AB.lambdas(), [[exp(a + b/T) for a, b in zip(As, Bs)] for As, Bs in zip(A, B)], rtol=1e-15)
+    assert_close2d(model_AB.lambdas(), Wilson(T=T, xs=np.array(xs), ABCDEF=(A, B)).lambdas(), rtol=1e-15)
+
+    d2GE_dxixjs = modelnp.d2GE_dxixjs()
+    assert_close2d(d2GE_dxixjs, model.d2GE_dxixjs(), rtol=1e-12)
+    assert_close2d(d2GE_dxixjs, d2GE_dxixjs.T, rtol=1e-12)
+
+    d3GE_dxixjxks = modelnp.d3GE_dxixjxks()
+    assert_close3d(d3GE_dxixjxks, model.d3GE_dxixjxks(), rtol=1e-12)
+    assert_close3d(d3GE_dxixjxks, d3GE_dxixjxks.transpose(1, 2, 0), rtol=1e-12)
+
+
+def test_Wilson_GE_from_arrays():
+    A = [[0.0, 3.870101271243586, 0.07939943395502425],
+         [-6.491263271243587, 0.0, -3.276991837288562],
+         [0.8542855660449756, 6.906801837288562, 0.0]]
+    B = [[0.0, -375.2835, -31.1208], [1722.58, 0.0, 1140.79], [-747.217, -3596.17, -0.0]]
+    C = [[0.0, 0.1, -0.2], [0.3, 0.0, 0.05], [-0.1, 0.2, 0.0]]
+    D = [[-0.0, -0.00791073, -0.000868371], [0.00747788, -0.0, -3.1e-05], [0.00124796, -3e-05, -0.0]]
+    E = [[0.0, 1e3, -2e3], [5e2, 0.0, 1e3], [-1e3, 2e2, 0.0]]
+    F = [[0.0, 1e-07, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+    Ts = [300.0, 331.42, 360.0]
+    xss = [[0.229, 0.175, 0.596], [0.5, 0.25, 0.25], [0.1, 0.8, 0.1]]
+    GEs = Wilson.GE_from_arrays(Ts, xss, lambda_as=A, lambda_bs=B, lambda_cs=C,
+                                lambda_ds=D, lambda_es=E, lambda_fs=F)
+    expect = [Wilson(T=T, xs=xs, ABCDEF=(A, B, C, D, E, F)).GE() for T, xs in zip(Ts, xss)]
+    assert_close1d(GEs, expect, rtol=1e-13)
+
+    # Missing coefficient matrices are zero
+    GEs = Wilson.GE_from_arrays(Ts, xss, lambda_as=A, lambda_bs=B)
+    expect = [Wilson(T=T, xs=xs, ABCDEF=(A, B)).GE() for T, xs in zip(Ts, xss)]
+    assert_close1d(GEs, expect, rtol=1e-13)
+
+
 def test_Wilson_one_component():
     GE = Wilson(T=300, xs=[1], ABCDEF=([[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]]))
     for s in GE._point_properties:
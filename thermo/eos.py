@@ -259,11 +259,13 @@ __all__ = ['GCEOS', 'PR', 'SRK', 'PR78', 'PRSV', 'PRSV2', 'VDW', 'RK',
 'PRTranslatedTwu', 'PRTranslatedPoly',
 'main_derivatives_and_departures',
                 'main_derivatives_and_departures_VDW',
+                'main_derivatives_and_departures_numpy',
+                'PR_pure_TP_properties', 'PR_pure_TP_volumes',
                 'eos_lnphi'
 ]
 
-from cmath import log as clog
-from math import isinf, isnan, log1p, log10
+from functools import lru_cache
+from math import copysign, isinf, isnan, log1p, log10
 
 from chemicals.flash_basic import Wilson_K_value
 from chemicals.utils import hash_any_primitive, object_data
@@ -294,7 +296,14 @@ from fluids.numerics import (
 from fluids.numerics import numpy as np
 
 from thermo.eos_alpha_functions import Mathias_Copeman_poly_a_alpha, Poly_a_alpha, Soave_1979_a_alpha, Twu91_a_alpha, TwuPR95_a_alpha, TwuSRK95_a_alpha
-from thermo.eos_volume import volume_solutions_halley, volume_solutions_ideal, volume_solutions_mpmath, volume_solutions_mpmath_float, volume_solutions_NR
+from thermo.eos_volume import (
+    volume_solutions_halley,
+    volume_solutions_ideal,
+    volume_solutions_mpmath,
+    volume_solutions_mpmath_float,
+    volume_solutions_NR,
+    volume_solutions_vectorized,
+)
 from thermo.serialize import JsonOptEncodable
 
 R2 = R*R
@@ -321,19 +330,15 @@ def main_derivatives_and_departures(T, P, V, b, delta, epsilon, a_alpha,
     except:
         # Needed for ideal gas model
         x11 = 0.0
-    x11_half = 0.5*x11
 
 #    hard_input = x11*x5
 #    arg2 = (hard_input + 1.0)/(hard_input - 1.0)
 #    fancy = 0.25*log(arg2*arg2)
 #    x12 = 2.*x11*fancy # Possible to use a catan, but then a complex division and sq root is needed too
     hard_input = x11*x5
-    hard_term = catanh(hard_input).real # numba: delete
-#    hard_term = 0.25*log1p(4.*hard_input/((1.0-hard_input)*(1.0-hard_input))) # numba: uncomment
+    # Real part of catanh(hard_input) without complex arithmetic, as in eos_lnphi
+    hard_term = 0.25*log1p(4.*hard_input/((1.0-hard_input)*(1.0-hard_input)))
     x12 = 2.*x11*hard_term # Possible to use a catan, but then a complex division and sq root is needed too
-    x14 = 0.5*x5
-    x15 = epsilon2*x11
-    x16 = x11_half*x9
     x17 = x5*x6
     dP_dT = R*x0 - da_alpha_dT*x1
     dP_dV = x5*x7 - x3*x4
@@ -348,12 +353,290 @@ def main_derivatives_and_departures(T, P, V, b, delta, epsilon, a_alpha,
     t1 = (x3*x0/P)
     S_dep = -R*log(t1) + da_alpha_dT*x12  # Consider Real part of the log only via log(x**2)/2 = Re(log(x))
 #        S_dep = -R_2*log(t1*t1) + da_alpha_dT*x12  # Consider Real part of the log only via log(x**2)/2 = Re(log(x))
-    x18 = x16 - x15
-    x19 = (x14 + x18)/(x14 - x18)
-    Cv_dep = T*d2a_alpha_dT2*x11*(log(x19)) # Consider Real part of the log only via log(x**2)/2 = Re(log(x))
+    # x12 = x11*log((x5*x11 + 1)/(x5*x11 - 1)), the same integral as H_dep
+    Cv_dep = T*d2a_alpha_dT2*x12
     return dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep
 
 
+def main_derivatives_and_departures_numpy(T, P, V, b, delta, epsilon, a_alpha,
+                                          da_alpha_dT, d2a_alpha_dT2):
+    r'''NumPy version of :obj:`main_derivatives_and_departures`, accepting
+    arrays for any of the inputs. The real part of the inverse hyperbolic
+    tangent is evaluated with a logarithm as in :obj:`eos_lnphi`, so no
+    complex numbers are involved.
+
+    Parameters
+    ----------
+    T : float or ndarray
+        Temperature, [K]
+    P : float or ndarray
+        Pressure, [Pa]
+    V : float or ndarray
+        Molar volume, [m^3/mol]
+    b : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or ndarray
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    da_alpha_dT : float or ndarray
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float or ndarray
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+
+    Returns
+    -------
+    dP_dT : float or ndarray
+        First temperature derivative of pressure at constant volume, [Pa/K]
+    dP_dV : float or ndarray
+        First volume derivative of pressure at constant temperature,
+        [Pa*mol/m^3]
+    d2P_dT2 : float or ndarray
+        Second temperature derivative of pressure at constant volume,
+        [Pa/K^2]
+    d2P_dV2 : float or ndarray
+        Second volume derivative of pressure at constant temperature,
+        [Pa*mol^2/m^6]
+    d2P_dTdV : float or ndarray
+        Second derivative of pressure with respect to temperature and volume,
+        [Pa*mol/(K*m^3)]
+    H_dep : float or ndarray
+        Departure enthalpy, [J/mol]
+    S_dep : float or ndarray
+        Departure entropy, [J/(mol*K)]
+    Cv_dep : float or ndarray
+        Departure constant-volume heat capacity, [J/(mol*K)]
+
+    Notes
+    -----
+    The inputs are broadcast against each other, so the liquid and gas roots
+    of a :obj:`GCEOS` can be evaluated together by passing both volumes in
+    one array.
+
+    Examples
+    --------
+    >>> eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=300.0, P=1e5)
+    >>> Vs = np.array([eos.V_l, eos.V_g])
+    >>> res = main_derivatives_and_departures_numpy(eos.T, eos.P, Vs, eos.b, eos.delta,
+    ...        eos.epsilon, eos.a_alpha, eos.da_alpha_dT, eos.d2a_alpha_dT2)
+    >>> res[0].tolist(), res[5].tolist()
+    ([573411.52297, 368.05395797], [-31163.9946468, -394.147667467])
+    '''
+    epsilon2 = epsilon + epsilon
+    x0 = 1.0/(V - b)
+    x1 = 1.0/(V*(V + delta) + epsilon)
+    x3 = R*T
+    x4 = x0*x0
+    x5 = V + V + delta
+    x6 = x1*x1
+    x7 = a_alpha*x6
+    x8 = P*V
+    x9 = delta*delta
+    x10 = x9 - epsilon2 - epsilon2
+    x11 = 1.0/np.sqrt(x10)
+
+    hard_input = x11*x5
+    hard_term = 0.25*np.log1p(4.0*hard_input/((1.0 - hard_input)*(1.0 - hard_input)))
+    x12 = 2.*x11*hard_term
+    x17 = x5*x6
+    dP_dT = R*x0 - da_alpha_dT*x1
+    dP_dV = x5*x7 - x3*x4
+    d2P_dT2 = -d2a_alpha_dT2*x1
+
+    d2P_dV2 = (x7 + x3*x4*x0 - a_alpha*x5*x17*x1)
+    d2P_dV2 = d2P_dV2 + d2P_dV2
+
+    d2P_dTdV = da_alpha_dT*x17 - R*x4
+    H_dep = x12*(T*da_alpha_dT - a_alpha) - x3 + x8
+
+    S_dep = -R*np.log(x3*x0/P) + da_alpha_dT*x12
+    Cv_dep = T*d2a_alpha_dT2*x12
+    return dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep
+
+
+def PR_pure_TP_properties(T, P, Tc, Pc, omega):
+    r'''Solve the Peng-Robinson EOS for a pure compound at a specified
+    temperature and pressure, and return the main derivatives and departures
+    of each phase. This is a flat function of floats which gives the same
+    numbers as a :obj:`PR` object, and compiles under :obj:`thermo.numba`
+    without needing any object.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    Tc : float
+        Critical temperature, [K]
+    Pc : float
+        Critical pressure, [Pa]
+    omega : float
+        Acentric factor, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    V_l : float
+        Liquid molar volume; NaN if there is no liquid root, [m^3/mol]
+    V_g : float
+        Gas molar volume; NaN if there is no gas root, [m^3/mol]
+    props_l : tuple[float, 8]
+        `dP_dT`, `dP_dV`, `d2P_dT2`, `d2P_dV2`, `d2P_dTdV`, `H_dep`, `S_dep`
+        and `Cv_dep` of the liquid as returned by
+        :obj:`main_derivatives_and_departures`; all NaN if there is no
+        liquid root, [various]
+    props_g : tuple[float, 8]
+        The same properties for the gas, [various]
+
+    Notes
+    -----
+    Phases are assigned as in :obj:`GCEOS.set_from_PT`. The special handling
+    of a state exactly at the critical point is not reproduced.
+
+    Examples
+    --------
+    >>> ans = PR_pure_TP_properties(299.0, 1e5, 507.6, 3025000.0, 0.2975)
+    >>> ans[3], ans[4]
+    (0.000130471, 0.0233642)
+    >>> ans[5][5], ans[6][5]
+    (-31208.8, -396.227)
+    '''
+    b = 0.0777960739038884559718447100373331839711*R*Tc/Pc
+    a = 0.4572355289213821893834601962251837888504*R*R*Tc*Tc/Pc
+    kappa = omega*(-0.26992*omega + 1.54226) + 0.37464
+    delta, epsilon = 2.0*b, -b*b
+
+    x0 = sqrt(T)
+    x1 = 1.0/sqrt(Tc)
+    x2 = kappa*(x0*x1 - 1.) - 1.
+    x3 = a*kappa
+    x4 = x1*x2/x0
+    a_alpha = a*x2*x2
+    da_alpha_dT = x4*x3
+    d2a_alpha_dT2 = 0.5*x3*(kappa*x1*x1 - x4)/T
+
+    Vmin = 1e100
+    Vmax = -1e100
+    for V in volume_solutions_halley(T, P, b, delta, epsilon, a_alpha):
+        if V > b:
+            if V < Vmin:
+                Vmin = V
+            if V > Vmax:
+                Vmax = V
+    if Vmax < Vmin:
+        raise ValueError('No acceptable roots were found')
+
+    nan = float('nan')
+    missing = (nan, nan, nan, nan, nan, nan, nan, nan)
+    props_l = main_derivatives_and_departures(T, P, Vmin, b, delta, epsilon, a_alpha,
+                                              da_alpha_dT, d2a_alpha_dT2)
+    if Vmin == Vmax:
+        # phase_identification_parameter from dP_dT, dP_dV, d2P_dV2 and d2P_dTdV
+        PIP = Vmin*(props_l[4]/props_l[0] - props_l[3]/props_l[1])
+        if PIP > 1.00000000000001:
+            return a_alpha, da_alpha_dT, d2a_alpha_dT2, Vmin, nan, props_l, missing
+        return a_alpha, da_alpha_dT, d2a_alpha_dT2, nan, Vmin, missing, props_l
+    props_g = main_derivatives_and_departures(T, P, Vmax, b, delta, epsilon, a_alpha,
+                                              da_alpha_dT, d2a_alpha_dT2)
+    return a_alpha, da_alpha_dT, d2a_alpha_dT2, Vmin, Vmax, props_l, props_g
+
+
+def PR_pure_TP_volumes(Ts, Ps, Tc, Pc, omega, V_ls=None, V_gs=None):
+    r'''Solve the Peng-Robinson EOS for a pure compound at many sets of
+    temperature and pressure, and return only the liquid and gas molar
+    volumes of each. Phases are assigned as in :obj:`PR_pure_TP_properties`.
+    Under :obj:`thermo.numba` the loop over the conditions runs in parallel,
+    so rather than raising, both volumes are NaN for any conditions where no
+    acceptable root is found.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures, [K]
+    Ps : list[float]
+        Pressures, [Pa]
+    Tc : float
+        Critical temperature, [K]
+    Pc : float
+        Critical pressure, [Pa]
+    omega : float
+        Acentric factor, [-]
+    V_ls : list[float], optional
+        Array to store the liquid molar volumes in, [m^3/mol]
+    V_gs : list[float], optional
+        Array to store the gas molar volumes in, [m^3/mol]
+
+    Returns
+    -------
+    V_ls : list[float]
+        Liquid molar volumes; NaN where there is no liquid root, [m^3/mol]
+    V_gs : list[float]
+        Gas molar volumes; NaN where there is no gas root, [m^3/mol]
+
+    Examples
+    --------
+    >>> PR_pure_TP_volumes([299.0, 600.0], [1e5, 1e5], 507.6, 3025000.0, 0.2975)
+    ([0.000130471, nan], [0.0233642, 0.0495288])
+    '''
+    N = len(Ts)
+    if V_ls is None:
+        V_ls = [0.0]*N # numba: delete
+#        V_ls = np.zeros(N) # numba: uncomment
+    if V_gs is None:
+        V_gs = [0.0]*N # numba: delete
+#        V_gs = np.zeros(N) # numba: uncomment
+    b = 0.0777960739038884559718447100373331839711*R*Tc/Pc
+    a = 0.4572355289213821893834601962251837888504*R*R*Tc*Tc/Pc
+    kappa = omega*(-0.26992*omega + 1.54226) + 0.37464
+    delta, epsilon = 2.0*b, -b*b
+    x1 = 1.0/sqrt(Tc)
+    x3 = a*kappa
+    nan = float('nan')
+    for i in range(N): # numba: prange
+        T, P = Ts[i], Ps[i]
+        x0 = sqrt(T)
+        x2 = kappa*(x0*x1 - 1.) - 1.
+        a_alpha = a*x2*x2
+
+        Vmin = 1e100
+        Vmax = -1e100
+        for V in volume_solutions_halley(T, P, b, delta, epsilon, a_alpha):
+            if V > b:
+                if V < Vmin:
+                    Vmin = V
+                if V > Vmax:
+                    Vmax = V
+        if Vmax < Vmin:
+            V_ls[i], V_gs[i] = nan, nan
+        elif Vmin != Vmax:
+            V_ls[i], V_gs[i] = Vmin, Vmax
+        else:
+            # Only a single root - the derivatives are needed to identify it
+            x4 = x1*x2/x0
+            da_alpha_dT = x4*x3
+            d2a_alpha_dT2 = 0.5*x3*(kappa*x1*x1 - x4)/T
+            props = main_derivatives_and_departures(T, P, Vmin, b, delta, epsilon, a_alpha,
+                                                    da_alpha_dT, d2a_alpha_dT2)
+            PIP = Vmin*(props[4]/props[0] - props[3]/props[1])
+            if PIP > 1.00000000000001:
+                V_ls[i], V_gs[i] = Vmin, nan
+            else:
+                V_ls[i], V_gs[i] = nan, Vmin
+    return V_ls, V_gs
+
+
 def main_derivatives_and_departures_VDW(T, P, V, b, delta, epsilon, a_alpha,
                                     da_alpha_dT, d2a_alpha_dT2):
     '''Re-implementation of derivatives and excess property calculations,
@@ -389,7 +672,8 @@ def main_derivatives_and_departures_VDW(T, P, V, b, delta, epsilon, a_alpha,
     d2P_dV2 = 2.0*(R*T*Vmb_inv*Vmb_inv*Vmb_inv - 3.0*a_alpha*V_inv2*V_inv2) # Causes issues at low T when V fourth power fails
     d2P_dTdV = -R*Vmb_inv*Vmb_inv
     H_dep = P*V - R*T - a_alpha*V_inv
-    S_dep = R*(-log(V) + log(Vmb)) + R*log(P*V/(R*T))
+    # The three logarithms of the symbolic result combine into one
+    S_dep = R*log(P*Vmb/(R*T))
     Cv_dep = 0.0
     return (dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep)
 
@@ -1138,12 +1422,14 @@ class GCEOS:
         elif self.T is None or self.P is None:
             raise ValueError("Two specs are required")
         else:
+            T = self.T
             if full_alphas:
-                self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2 = self.a_alpha_and_derivatives(self.T, pure_a_alphas=pure_a_alphas)
+                a_alpha, da_alpha_dT, d2a_alpha_dT2 = self.a_alpha_and_derivatives(T, pure_a_alphas=pure_a_alphas)
+                self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2 = a_alpha, da_alpha_dT, d2a_alpha_dT2
             else:
-                self.a_alpha = self.a_alpha_and_derivatives(self.T, full=False, pure_a_alphas=pure_a_alphas)
+                self.a_alpha = a_alpha = self.a_alpha_and_derivatives(T, full=False, pure_a_alphas=pure_a_alphas)
                 self.da_alpha_dT, self.d2a_alpha_dT2 = -5e-3, 1.5e-5
-            self.raw_volumes = Vs = self.volume_solutions(self.T, self.P, self.b, self.delta, self.epsilon, self.a_alpha)
+            self.raw_volumes = Vs = self.volume_solutions(T, self.P, self.b, self.delta, self.epsilon, a_alpha)
         self.set_from_PT(Vs, only_l=only_l, only_g=only_g)
 
     def resolve_full_alphas(self):
@@ -1221,51 +1507,46 @@ class GCEOS:
 #        good_roots = [i.real for i in Vs if (i.real > 0.0 and (i.real == 0.0 or abs(i.imag) < 1E-9))]
         # good_root_count = len(good_roots)
 
+        T, P, delta, epsilon = self.T, self.P, self.delta, self.epsilon
+        a_alpha, da_alpha_dT, d2a_alpha_dT2 = self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2
         if good_root_count == 1 or Vmin == Vmax:
             V = Vmin if Vmin != 1e100 else Vmax
-            self.phase = self.set_properties_from_solution(self.T, self.P,
-                                                           V, b,
-                                                           self.delta, self.epsilon,
-                                                           self.a_alpha, self.da_alpha_dT,
-                                                           self.d2a_alpha_dT2)
+            self.phase = self.set_properties_from_solution(T, P, V, b, delta, epsilon,
+                                                           a_alpha, da_alpha_dT,
+                                                           d2a_alpha_dT2)
 
             if self.N == 1 and (
                     (self.multicomponent and (self.Tcs[0] == self.T and self.Pcs[0] == self.P))
-                    or (not self.multicomponent and self.Tc == self.T and self.Pc == self.P)):
+                    or (not self.multicomponent and self.Tc == T and self.Pc == P)):
                 # Do not have any tests for this - not good!
 
                 force_l = not self.phase == 'l'
                 force_g = not self.phase == 'g'
                 V = Vmin if Vmin != 1e100 else Vmax
-                self.set_properties_from_solution(self.T, self.P,
-                                                  V, b,
-                                                  self.delta, self.epsilon,
-                                                  self.a_alpha, self.da_alpha_dT,
-                                                  self.d2a_alpha_dT2,
+                self.set_properties_from_solution(T, P, V, b, delta, epsilon,
+                                                  a_alpha, da_alpha_dT,
+                                                  d2a_alpha_dT2,
                                                   force_l=force_l,
                                                   force_g=force_g)
                 self.phase = 'l/g'
         elif good_root_count > 1:
             if not only_g:
-                self.set_properties_from_solution(self.T, self.P, Vmin, b,
-                                                   self.delta, self.epsilon,
-                                                   self.a_alpha, self.da_alpha_dT,
-                                                   self.d2a_alpha_dT2,
-                                                   force_l=True)
+                self.set_properties_from_solution(T, P, Vmin, b, delta, epsilon,
+                                                  a_alpha, da_alpha_dT,
+                                                  d2a_alpha_dT2, force_l=True)
             if not only_l:
-                self.set_properties_from_solution(self.T, self.P, Vmax, b,
-                                                   self.delta, self.epsilon,
-                                                   self.a_alpha, self.da_alpha_dT,
-                                                   self.d2a_alpha_dT2, force_g=True)
+                self.set_properties_from_solution(T, P, Vmax, b, delta, epsilon,
+                                                  a_alpha, da_alpha_dT,
+                                                  d2a_alpha_dT2, force_g=True)
             self.phase = 'l/g'
         else:
             # Even in the case of three real roots, it is still the min/max that make sense
-            print([self.T, self.P, b, self.delta, self.epsilon, self.a_alpha, 'coordinates of failure'])
+            print([T, P, b, delta, epsilon, a_alpha, 'coordinates of failure'])
             if self.multicomponent:
                 extra = f', zs is {self.zs}'
             else:
                 extra = ''
-            raise ValueError(f'No acceptable roots were found; the roots are {Vs!s}, T is {self.T!s} K, P is {self.P!s} Pa, a_alpha is {[self.a_alpha]!s}, b is {[self.b]!s}{extra}')
+            raise ValueError(f'No acceptable roots were found; the roots are {Vs!s}, T is {T!s} K, P is {P!s} Pa, a_alpha is {[a_alpha]!s}, b is {[b]!s}{extra}')
 
 
     def set_properties_from_solution(self, T, P, V, b, delta, epsilon, a_alpha,
@@ -2659,7 +2940,22 @@ class GCEOS:
 #            return PIPs, fig
 
     def derivatives_and_departures(self, T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2, quick=True):
+        r'''Calculate the first and second derivatives of `P`, `V` and `T`
+        with respect to each other, and the `H`, `S` and `Cv` departures, at
+        the specified volume. All values come from one call to
+        `main_derivatives_and_departures`.
+
+        The `quick` argument has no effect and is kept so existing callers
+        continue to work. When only the volumes are wanted, call
+        :obj:`GCEOS.volume_solutions` directly instead of creating an object.
 
+        Returns
+        -------
+        (dP_dT, dP_dV, dV_dT, dV_dP, dT_dV, dT_dP, d2P_dT2, d2P_dV2, d2V_dT2,
+        d2V_dP2, d2T_dV2, d2T_dP2, d2V_dPdT, d2P_dTdV, d2T_dPdV, H_dep, S_dep,
+        Cv_dep) : tuple[float, 18]
+            Derivatives and departures, [various]
+        '''
         dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep = (
         self.main_derivatives_and_departures(T, P, V, b, delta, epsilon,
                                              a_alpha, da_alpha_dT,
@@ -5166,7 +5462,9 @@ class GCEOS:
             -V^2\frac{\partial^2 P}{\partial V^2} - 2V \frac{\partial P}{\partial V}
             \right)
         '''
-        return -self.V_l**2*(-self.V_l**2*self.d2P_dV2_l - 2*self.V_l*self.dP_dV_l)
+        V = self.V_l
+        V2 = V*V
+        return V2*(V2*self.d2P_dV2_l + 2.0*V*self.dP_dV_l)
 
     @property
     def d2P_drho2_g(self):
@@ -5178,7 +5476,9 @@ class GCEOS:
             -V^2\frac{\partial^2 P}{\partial V^2} - 2V \frac{\partial P}{\partial V}
             \right)
         '''
-        return -self.V_g**2*(-self.V_g**2*self.d2P_dV2_g - 2*self.V_g*self.dP_dV_g)
+        V = self.V_g
+        V2 = V*V
+        return V2*(V2*self.d2P_dV2_g + 2.0*V*self.dP_dV_g)
 
     @property
     def d2rho_dP2_l(self):
@@ -5190,7 +5490,9 @@ class GCEOS:
             -\frac{\partial^2 V}{\partial P^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial P}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dP2_l/self.V_l**2 + 2*self.dV_dP_l**2/self.V_l**3
+        V_inv = 1.0/self.V_l
+        dV_dP = self.dV_dP_l
+        return V_inv*V_inv*(2.0*dV_dP*dV_dP*V_inv - self.d2V_dP2_l)
 
     @property
     def d2rho_dP2_g(self):
@@ -5202,7 +5504,9 @@ class GCEOS:
             -\frac{\partial^2 V}{\partial P^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial P}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dP2_g/self.V_g**2 + 2*self.dV_dP_g**2/self.V_g**3
+        V_inv = 1.0/self.V_g
+        dV_dP = self.dV_dP_g
+        return V_inv*V_inv*(2.0*dV_dP*dV_dP*V_inv - self.d2V_dP2_g)
 
 
     @property
@@ -5234,7 +5538,9 @@ class GCEOS:
             \frac{\partial^2 T}{\partial \rho^2} =
             -V^2(-V^2 \frac{\partial^2 T}{\partial V^2} -2V \frac{\partial T}{\partial V}  )
         '''
-        return -self.V_l**2*(-self.V_l**2*self.d2T_dV2_l - 2*self.V_l*self.dT_dV_l)
+        V = self.V_l
+        V2 = V*V
+        return V2*(V2*self.d2T_dV2_l + 2.0*V*self.dT_dV_l)
 
     @property
     def d2T_drho2_g(self):
@@ -5245,7 +5551,9 @@ class GCEOS:
             \frac{\partial^2 T}{\partial \rho^2} =
             -V^2(-V^2 \frac{\partial^2 T}{\partial V^2} -2V \frac{\partial T}{\partial V}  )
         '''
-        return -self.V_g**2*(-self.V_g**2*self.d2T_dV2_g - 2*self.V_g*self.dT_dV_g)
+        V = self.V_g
+        V2 = V*V
+        return V2*(V2*self.d2T_dV2_g + 2.0*V*self.dT_dV_g)
 
 
     @property
@@ -5280,7 +5588,9 @@ class GCEOS:
             -\frac{\partial^2 V}{\partial T^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial T}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dT2_l/self.V_l**2 + 2*self.dV_dT_l**2/self.V_l**3
+        V_inv = 1.0/self.V_l
+        dV_dT = self.dV_dT_l
+        return V_inv*V_inv*(2.0*dV_dT*dV_dT*V_inv - self.d2V_dT2_l)
 
     @property
     def d2rho_dT2_g(self):
@@ -5292,7 +5602,9 @@ class GCEOS:
             -\frac{\partial^2 V}{\partial T^2}\frac{1}{V^2}
             + 2 \left(\frac{\partial V}{\partial T}\right)^2\frac{1}{V^3}
         '''
-        return -self.d2V_dT2_g/self.V_g**2 + 2*self.dV_dT_g**2/self.V_g**3
+        V_inv = 1.0/self.V_g
+        dV_dT = self.dV_dT_g
+        return V_inv*V_inv*(2.0*dV_dT*dV_dT*V_inv - self.d2V_dT2_g)
 
     @property
     def d2P_dTdrho_l(self):
@@ -5350,7 +5662,8 @@ class GCEOS:
             \left(\frac{\partial V}{\partial P}\right)
             \frac{1}{V^3}
         '''
-        return -self.d2V_dPdT_l/self.V_l**2 + 2*self.dV_dT_l*self.dV_dP_l/self.V_l**3
+        V_inv = 1.0/self.V_l
+        return V_inv*V_inv*(2.0*self.dV_dT_l*self.dV_dP_l*V_inv - self.d2V_dPdT_l)
 
     @property
     def d2rho_dPdT_g(self):
@@ -5364,7 +5677,8 @@ class GCEOS:
             \left(\frac{\partial V}{\partial P}\right)
             \frac{1}{V^3}
         '''
-        return -self.d2V_dPdT_g/self.V_g**2 + 2*self.dV_dT_g*self.dV_dP_g/self.V_g**3
+        V_inv = 1.0/self.V_g
+        return V_inv*V_inv*(2.0*self.dV_dT_g*self.dV_dP_g*V_inv - self.d2V_dPdT_g)
 
     @property
     def dH_dep_dT_l(self):
@@ -5779,7 +6093,8 @@ class GCEOS:
             x4 = 1.0/(self.delta*self.delta - 4.0*self.epsilon)
         except ZeroDivisionError:
             x4 = 1e50
-        return (-x1*x3 - 4.0*x2*x4*self.da_alpha_dT/(x4*(self.delta + 2*x0)**2
+        x5 = self.delta + 2.0*x0
+        return (-x1*x3 - 4.0*x2*x4*self.da_alpha_dT/(x4*x5*x5
                 - 1) - x3/(self.b - x0) + R*x1*(self.P*x2 + x0)/self.P)
 
     @property
@@ -5806,7 +6121,8 @@ class GCEOS:
             x4 = 1.0/(self.delta*self.delta - 4.0*self.epsilon)
         except ZeroDivisionError:
             x4 = 1e200
-        ans = (-x1*x3 - 4.0*x2*x4*self.da_alpha_dT/(x4*(self.delta + 2*x0)**2
+        x5 = self.delta + 2.0*x0
+        ans = (-x1*x3 - 4.0*x2*x4*self.da_alpha_dT/(x4*x5*x5
                 - 1) - x3/(self.b - x0) + R*x1*(self.P*x2 + x0)/self.P)
         return ans
 
@@ -7483,6 +7799,152 @@ class PR(GCEOS):
         self.delta, self.epsilon = 2.0*b, -b*b
         self.solve()
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def from_TP_cached(cls, Tc, Pc, omega, T, P):
+        r'''Construct an EOS object at a specified temperature and pressure,
+        reusing the object from a previous call with the same inputs. This is
+        an explicit opt-in for workloads which evaluate the same compound at
+        the same conditions many times; constructing the class normally is
+        never cached.
+
+        Parameters
+        ----------
+        Tc : float
+            Critical temperature, [K]
+        Pc : float
+            Critical pressure, [Pa]
+        omega : float
+            Acentric factor, [-]
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        eos : PR
+            EOS object, shared with every other caller using the same inputs;
+            it must not be modified, [-]
+
+        Notes
+        -----
+        The 1024 most recently used objects are kept, separately for each
+        class. Objects already in the cache are not solved again if
+        :obj:`GCEOS.volume_solutions` is replaced afterwards; call
+        `PR.from_TP_cached.cache_clear()` to discard them.
+
+        Examples
+        --------
+        >>> eos = PR.from_TP_cached(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+        >>> eos is PR.from_TP_cached(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+        True
+        '''
+        return cls(Tc=Tc, Pc=Pc, omega=omega, T=T, P=P)
+
+    @classmethod
+    def from_TP_arrays(cls, Tc, Pc, omega, T, P):
+        r'''Solve the PR EOS for a pure compound at many temperatures and
+        pressures at once, using NumPy arrays instead of creating one object
+        per point. The volumes are found with
+        :obj:`thermo.eos_volume.volume_solutions_vectorized` and the
+        derivatives and departures with
+        :obj:`main_derivatives_and_departures_numpy`.
+
+        Parameters
+        ----------
+        Tc : float
+            Critical temperature, [K]
+        Pc : float
+            Critical pressure, [Pa]
+        omega : float
+            Acentric factor, [-]
+        T : float or ndarray
+            Temperatures, [K]
+        P : float or ndarray
+            Pressures, [Pa]
+
+        Returns
+        -------
+        results : dict[str, ndarray]
+            Arrays of `T`, `P`, `a_alpha`, `da_alpha_dT` and `d2a_alpha_dT2`,
+            and of `V`, `Z`, `PIP`, `dP_dT`, `dP_dV`, `d2P_dT2`, `d2P_dV2`,
+            `d2P_dTdV`, `H_dep`, `S_dep`, `G_dep`, `Cp_dep`, `Cv_dep`,
+            `lnphi`, `phi` and `fugacity` suffixed with `_l` and `_g` in the
+            same way as the attributes of a :obj:`PR` object; NaN where that
+            phase does not exist, [various]
+
+        Notes
+        -----
+        Phases are assigned as in :obj:`GCEOS.set_from_PT`; if there are two
+        volumes the smaller is the liquid and the larger the gas, and a single
+        volume is classified with the phase identification parameter.
+
+        Every array in `results` is a separate C-contiguous array of the
+        broadcast shape, so reading one property across all the conditions
+        does not touch any of the others.
+
+        Examples
+        --------
+        >>> res = PR.from_TP_arrays(Tc=507.6, Pc=3025000.0, omega=0.2975, T=np.array([299.0, 500.0]), P=1e5)
+        >>> res['V_l'], res['V_g']
+        (array([0.00013047, nan]), array([0.02336426, 0.04102177]))
+        '''
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+        b = cls.c2R*Tc/Pc
+        a = b*Tc*cls.c1R2_c2R
+        kappa = omega*(-0.26992*omega + 1.54226) + 0.37464
+        delta, epsilon = 2.0*b, -b*b
+
+        # Same expressions as a_alpha_and_derivatives_pure
+        x0 = np.sqrt(T)
+        x1 = 1.0/sqrt(Tc)
+        x2 = kappa*(x0*x1 - 1.) - 1.
+        x3 = a*kappa
+        x4 = x1*x2/x0
+        a_alpha = a*x2*x2
+        da_alpha_dT = x4*x3
+        d2a_alpha_dT2 = 0.5*x3*(kappa*x1*x1 - x4)/T
+
+        Vs = volume_solutions_vectorized(T, P, b, delta, epsilon, a_alpha)
+        valid = (Vs.imag == 0.0) & (Vs.real > b)
+        Vmin = np.where(valid, Vs.real, inf).min(axis=-1)
+        Vmax = np.where(valid, Vs.real, -inf).max(axis=-1)
+        Vmin = np.where(np.isinf(Vmin), np.nan, Vmin)
+        Vmax = np.where(np.isinf(Vmax), np.nan, Vmax)
+
+        results = {'T': np.ascontiguousarray(T), 'P': np.ascontiguousarray(P),
+                   'a_alpha': a_alpha, 'da_alpha_dT': da_alpha_dT, 'd2a_alpha_dT2': d2a_alpha_dT2}
+        phase_properties = []
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for V in (Vmin, Vmax):
+                dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep = (
+                    main_derivatives_and_departures_numpy(T, P, V, b, delta, epsilon,
+                                                          a_alpha, da_alpha_dT, d2a_alpha_dT2))
+                dV_dP = 1.0/dP_dV
+                dV_dT = -dP_dT*dV_dP
+                PIP = V*(d2P_dTdV/dP_dT - d2P_dV2*dV_dP)
+                G_dep = H_dep - T*S_dep
+                lnphi = G_dep*R_inv/T
+                phi = np.exp(lnphi)
+                phase_properties.append({'V': V, 'Z': P*V*R_inv/T, 'PIP': PIP,
+                                         'dP_dT': dP_dT, 'dP_dV': dP_dV,
+                                         'd2P_dT2': d2P_dT2, 'd2P_dV2': d2P_dV2,
+                                         'd2P_dTdV': d2P_dTdV, 'H_dep': H_dep,
+                                         'S_dep': S_dep, 'G_dep': G_dep,
+                                         'Cp_dep': T*dP_dT*dV_dT + Cv_dep - R,
+                                         'Cv_dep': Cv_dep, 'lnphi': lnphi,
+                                         'phi': phi, 'fugacity': P*phi})
+
+        single = Vmin == Vmax
+        single_liquid = single & (phase_properties[0]['PIP'] > 1.00000000000001)
+        has_l = ~single | single_liquid
+        has_g = ~single | ~single_liquid
+        for suffix, props, present in (('_l', phase_properties[0], has_l), ('_g', phase_properties[1], has_g)):
+            for k, v in props.items():
+                results[k + suffix] = np.where(present, v, np.nan)
+        return results
+
     def a_alpha_pure(self, T):
         r'''Method to calculate :math:`a \alpha` for this EOS. Uses the set values of
         `Tc`, `kappa`, and `a`.
@@ -7663,7 +8125,10 @@ class PR(GCEOS):
             Tc, a, b, kappa = self.Tc, self.a, self.b, self.kappa
         except:
             Tc, a, b, kappa = self.Tcs[0], self.ais[0], self.bs[0], self.kappas[0]
-        P_max = (-R*Tc*a*(kappa**2 + 2*kappa + 1)/(R*Tc*V**2 + 2*R*Tc*V*b - R*Tc*b**2 - V*a*kappa**2 + a*b*kappa**2))
+        RTc = R*Tc
+        a_kappa2 = a*kappa*kappa
+        kappa_1 = kappa + 1.0
+        P_max = -RTc*a*kappa_1*kappa_1/(RTc*(V*(V + 2.0*b) - b*b) + a_kappa2*(b - V))
         if P_max < 0.0:
             # No positive pressure - it's negative
             return None
@@ -7696,22 +8161,18 @@ class PR(GCEOS):
 
         Notes
         -----
-        The exact solution can be derived as follows, and is excluded for
-        breviety.
+        In terms of :math:`y = \sqrt{T}`, the EOS is a quadratic equation
+        which is solved exactly:
 
-        >>> from sympy import *
-        >>> P, T, V = symbols('P, T, V')
-        >>> Tc, Pc, omega = symbols('Tc, Pc, omega')
-        >>> R, a, b, kappa = symbols('R, a, b, kappa')
-        >>> a_alpha = a*(1 + kappa*(1-sqrt(T/Tc)))**2
-        >>> PR_formula = R*T/(V-b) - a_alpha/(V*(V+b)+b*(V-b)) - P
-        >>> #solve(PR_formula, T)
+        .. math::
+            P = \frac{R}{V-b}y^2 - \frac{a}{V(V+b)+b(V-b)}\left(1 + \kappa
+            - \frac{\kappa}{\sqrt{T_c}} y\right)^2
 
-        After careful evaluation of the results of the analytical formula,
-        it was discovered, that numerical precision issues required several
-        NR refinement iterations; at at times, when the analytical value is
-        extremely erroneous, a call to a full numerical solver not using the
-        analytical solution at all is required.
+        Only positive roots in :math:`y` are valid. The lower one is returned
+        unless a gas solution is requested. Two Newton steps then refine the
+        answer; when the analytical value is extremely erroneous, a full
+        numerical solver not using the analytical solution at all is called
+        instead.
 
         Examples
         --------
@@ -7721,237 +8182,59 @@ class PR(GCEOS):
         '''
         self.no_T_spec = True
         Tc, a, b, kappa = self.Tc, self.a, self.b, self.kappa
-        # Needs to be improved to do a NR or two at the end!
-        x0 = V*V
-        x1 = R*Tc
-        x2 = x0*x1
-        x3 = kappa*kappa
-        x4 = a*x3
-        x5 = b*x4
-        x6 = 2.*V*b
-        x7 = x1*x6
-        x8 = b*b
-        x9 = x1*x8
-        x10 = V*x4
-        thing = (x2 - x10 + x5 + x7 - x9)
-        x11 = thing*thing
-        x12 = x0*x0
-        x13 = R*R
-        x14 = Tc*Tc
-        x15 = x13*x14
-        x16 = x8*x8
-        x17 = a*a
-        x18 = x3*x3
-        x19 = x17*x18
-        x20 = x0*V
-        x21 = 2.*R*Tc*a*x3
-        x22 = x8*b
-        x23 = 4.*V*x22
-        x24 = 4.*b*x20
-        x25 = a*x1
-        x26 = x25*x8
-        x27 = x26*x3
-        x28 = x0*x25
-        x29 = x28*x3
-        x30 = 2.*x8
-        x31 = (6.*V*x27 - 2.*b*x29 + x0*x13*x14*x30 + x0*x19 + x12*x15
-               + x15*x16 - x15*x23 + x15*x24 - x19*x6 + x19*x8 - x20*x21
-               - x21*x22)
+        # With y = sqrt(T), P = c1*y^2 - c2*(A - B*y)^2 is a quadratic in y
         V_m_b = V - b
-        x33 = 2.*(R*Tc*a*kappa)
-        x34 = P*x2
-        x35 = P*x5
-        x36 = x25*x3
-        x37 = P*x10
-        x38 = P*R*Tc
-        x39 = V*x17
-        x40 = 2.*kappa*x3
-        x41 = b*x17
-        x42 = P*a*x3
-
-        # 2.*a*kappa - add a negative sign to get the high temperature solution
-        # sometimes it is complex!
-#            try:
-        root_term = sqrt(V_m_b**3*(x0 + x6 - x8)*(P*x7 -
-                                          P*x9 + x25 + x33 + x34 + x35
-                                          + x36 - x37))
-#            except ValueError:
-#                # negative number in sqrt
-#                return super(PR, self).solve_T(P, V)
-
-        x100 = 2.*a*kappa*x11*(root_term*(kappa + 1.))
-        x101 = (x31*V_m_b*((4.*V)*(R*Tc*a*b*kappa) + x0*x33 - x0*x35 + x12*x38
-                     + x16*x38 + x18*x39 - x18*x41 - x20*x42 - x22*x42
-                     - x23*x38 + x24*x38 + x25*x6 - x26 - x27 + x28 + x29
-                     + x3*x39 - x3*x41 + x30*x34 - x33*x8 + x36*x6
-                     + 3*x37*x8 + x39*x40 - x40*x41))
-        x102 = -Tc/(x11*x31)
-
-        T_calc = (x102*(x100 - x101)) # Normally the correct root
-        if T_calc < 0.0:
+        c1, c2 = R/V_m_b, a/(V*(V+b) + b*V_m_b)
+        A = 1.0 + kappa
+        B = kappa/sqrt(Tc)
+        x0 = c2*A
+        x1 = c1 - c2*B*B # quadratic coefficient
+        x2 = x0*B # half the linear coefficient
+        x3 = x0*A + P # negative of the constant term
+        disc = x2*x2 + x1*x3
+        if disc < 0.0:
+            raise ValueError(f"No real temperature solution exists for P={P!s} Pa and V={V!s} m^3/mol")
+        # Numerically stable pair of roots; only positive ones are valid
+        x4 = x2 + copysign(sqrt(disc), x2)
+        y_low = y_high = -1.0
+        if x4 != 0.0:
+            y_low = x3/x4
+        if x1 != 0.0:
+            y_high = -x4/x1
+        if y_low > y_high:
+            y_low, y_high = y_high, y_low
+        if y_high <= 0.0:
             # Ruined, call the numerical method; sometimes it happens
             return super().solve_T(P, V, solution=solution)
+        if y_low <= 0.0 or (solution is not None and solution == 'g'):
+            y_low = y_high
+        T_calc = y_low*y_low
 
         Tc_inv = 1.0/Tc
+        rt = sqrt(T_calc*Tc_inv)
+        alpha_root = (1.0 + kappa*(1.0-rt))
+        err = c1*T_calc - alpha_root*alpha_root*c2 - P
+        if abs(err/P) > 1e-2:
+            # Numerical issue - such a bad solution we cannot converge
+            return super().solve_T(P, V, solution=solution)
 
-        T_calc_high = (x102*(-x100 - x101))
-        if solution is not None and solution == 'g':
-            T_calc = T_calc_high
-        if True:
-            c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
-
-            rt = (T_calc*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-            if abs(err/P) > 1e-2:
-                # Numerical issue - such a bad solution we cannot converge
-                return super().solve_T(P, V, solution=solution)
-
-            # Newton step - might as well compute it
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-            if derr == 0.0:
-                return T_calc
-            T_calc = T_calc - err/derr
-
-            # Step 2 - cannot find occasion to need more steps, most of the time
-            # this does nothing!
-            rt = (T_calc*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-            T_calc = T_calc - err/derr
-
-            return T_calc
-
-
-            c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
-
-            rt = (T_calc_high*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc_high - alpha_root*alpha_root*c2 - P
-
-            # Newton step - might as well compute it
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc_high
-            T_calc_high = T_calc_high - err/derr
-
-            # Step 2 - cannot find occasion to need more steps, most of the time
-            # this does nothing!
-            rt = (T_calc_high*Tc_inv)**0.5
-            alpha_root = (1.0 + kappa*(1.0-rt))
-            err = c1*T_calc_high - alpha_root*alpha_root*c2 - P
-            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc_high
-            T_calc_high = T_calc_high - err/derr
-
-
-
-
-
-            delta, epsilon = self.delta, self.epsilon
-            w0 = 1.0*(delta*delta - 4.0*epsilon)**-0.5
-            w1 = delta*w0
-            w2 = 2.0*w0
-
-#            print(T_calc, T_calc_high)
-
-            a_alpha_low = a*(1.0 + kappa*(1.0-(T_calc/Tc)**0.5))**2.0
-            a_alpha_high = a*(1.0 + kappa*(1.0-(T_calc_high/Tc)**0.5))**2.0
-
-            err_low = abs(R*T_calc/(V-b) - a_alpha_low/(V*V + delta*V + epsilon) - P)
-            err_high = abs(R*T_calc_high/(V-b) - a_alpha_high/(V*V + delta*V + epsilon) - P)
-#                print(err_low, err_high, T_calc, T_calc_high, a_alpha_low, a_alpha_high)
-
-            RT_low = R*T_calc
-            G_dep_low = (P*V - RT_low - RT_low*clog(P/RT_low*(V-b)).real
-                        - w2*a_alpha_low*catanh(2.0*V*w0 + w1).real)
-
-            RT_high = R*T_calc_high
-            G_dep_high = (P*V - RT_high - RT_high*clog(P/RT_high*(V-b)).real
-                        - w2*a_alpha_high*catanh(2.0*V*w0 + w1).real)
-
-#                print(G_dep_low, G_dep_high)
-            # ((err_low > err_high*2)) and
-            if  (T_calc.imag != 0.0 and T_calc_high.imag == 0.0) or (G_dep_high < G_dep_low and (err_high < err_low)):
-                T_calc = T_calc_high
-
+        # Newton step - might as well compute it
+        derr = c1 + c2*kappa*rt*alpha_root/T_calc
+        if derr == 0.0:
             return T_calc
-
-
-#            if err_high < err_low:
-#                T_calc = T_calc_high
-
-#            for Ti in (T_calc, T_calc_high):
-#                a_alpha = a*(1.0 + kappa*(1.0-(Ti/Tc)**0.5))**2.0
-#
-#
-#                # Compute P, and the difference?
-#                self.P = float(R*self.T/(V-self.b) - self.a_alpha/(V*V + self.delta*V + self.epsilon)
-#
-#
-#
-#                RT = R*Ti
-#                print(RT, V-b, P/RT*(V-b))
-#                G_dep = (P*V - RT - RT*log(P/RT*(V-b))
-#                            - w2*a_alpha*catanh(2.0*V*w0 + w1).real)
-#                print(G_dep)
-#                if G_dep < G_dep_base:
-#                    T = Ti
-#                    G_dep_base = G_dep
-#            T_calc = T
-
-#            print(T_calc, T_calc_high)
-
-
-#            T_calc = (-Tc*(2.*a*kappa*x11*sqrt(V_m_b**3*(x0 + x6 - x8)*(P*x7 -
-#                                              P*x9 + x25 + x33 + x34 + x35
-#                                              + x36 - x37))*(kappa + 1.) -
-#                x31*V_m_b*((4.*V)*(R*Tc*a*b*kappa) + x0*x33 - x0*x35 + x12*x38
-#                         + x16*x38 + x18*x39 - x18*x41 - x20*x42 - x22*x42
-#                         - x23*x38 + x24*x38 + x25*x6 - x26 - x27 + x28 + x29
-#                         + x3*x39 - x3*x41 + x30*x34 - x33*x8 + x36*x6
-#                         + 3*x37*x8 + x39*x40 - x40*x41))/(x11*x31))
-#            print(T_calc2/T_calc)
-
-            # Validation code - although the solution is analytical some issues
-            # with floating points can still occur
-            # Although 99.9 % of points anyone would likely want are plenty good,
-            # there are some edge cases as P approaches T or goes under it.
-
-#            c1, c2 = R/(V_m_b), a/(V*(V+b) + b*V_m_b)
-#
-#            rt = (T_calc*Tc_inv)**0.5
-#            alpha_root = (1.0 + kappa*(1.0-rt))
-#            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-#
-#            # Newton step - might as well compute it
-#            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-#            T_calc = T_calc - err/derr
-#
-#            # Step 2 - cannot find occasion to need more steps, most of the time
-#            # this does nothing!
-#            rt = (T_calc*Tc_inv)**0.5
-#            alpha_root = (1.0 + kappa*(1.0-rt))
-#            err = c1*T_calc - alpha_root*alpha_root*c2 - P
-#            derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-#            T_calc = T_calc - err/derr
-##            print(T_calc)
-#            return T_calc
-
-#            P_inv = 1.0/P
-#            if abs(err/P) < 1e-6:
-#                return T_calc
-##            print(abs(err/P))
-##            return GCEOS.solve_T(self, P, V)
-#            for i in range(7):
-#                rt = (T_calc*Tc_inv)**0.5
-#                alpha_root = (1.0 + kappa*(1.0-rt))
-#                err = c1*T_calc - alpha_root*alpha_root*c2 - P
-#                derr = c1 + c2*kappa*rt*(kappa*(1.0 -rt) + 1.0)/T_calc
-#
-#                T_calc = T_calc - err/derr
-#                print(err/P, T_calc, derr)
-#                if abs(err/P) < 1e-12:
-#                    return T_calc
-#            return T_calc
+        T_calc = T_calc - err/derr
+
+        # Step 2 - cannot find occasion to need more steps, most of the time
+        # this does nothing!
+        rt = sqrt(T_calc*Tc_inv)
+        alpha_root = (1.0 + kappa*(1.0-rt))
+        err = c1*T_calc - alpha_root*alpha_root*c2 - P
+        if abs(err/P) > 1e-6:
+            # Extremely high temperature roots are too ill-conditioned to polish
+            return super().solve_T(P, V, solution=solution)
+        derr = c1 + c2*kappa*rt*alpha_root/T_calc
+        T_calc = T_calc - err/derr
+        return T_calc
 
 
     # starts at 0.0008793111898930736
@@ -279,13 +279,14 @@ from thermo.eos_mix_methods import (
     a_alpha_and_derivatives_full,
     a_alpha_and_derivatives_quadratic_terms,
     a_alpha_quadratic_terms,
+    a_alpha_roots_and_root_invs,
     eos_mix_dV_dzs,
 )
 from thermo.serialize import JsonOptEncodable
 
 try:
-    (zeros, array, npexp, npsqrt, empty, full, npwhere, npmin, npmax, ndarray, dot, prodsum) = (
-        np.zeros, np.array, np.exp, np.sqrt, np.empty, np.full, np.where, np.min, np.max, np.ndarray, np.dot, np.dot)
+    (zeros, array, npexp, npsqrt, empty, full, npwhere, npmin, npmax, ndarray, dot, prodsum, ascontiguousarray) = (
+        np.zeros, np.array, np.exp, np.sqrt, np.empty, np.full, np.where, np.min, np.max, np.ndarray, np.dot, np.dot, np.ascontiguousarray)
 except:
     pass
 
@@ -1039,17 +1040,23 @@ class GCEOSMIX(GCEOS):
         >>> diff(a_alpha_ij, T)  # doctest:+SKIP
         >>> diff(a_alpha_ij, T, T)  # doctest:+SKIP
         '''
+        a_alpha_root_invs = None
         if pure_a_alphas:
             if full:
                 a_alphas, da_alpha_dTs, d2a_alpha_dT2s = self.a_alpha_and_derivatives_vectorized(T)
                 self.a_alphas, self.da_alpha_dTs, self.d2a_alpha_dT2s = a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+                if self.vectorized:
+                    self.a_alpha_roots = npsqrt(a_alphas)
+                else:
+                    # The inverse roots are needed by the derivatives; get both in one pass
+                    self.a_alpha_roots, a_alpha_root_invs = a_alpha_roots_and_root_invs(a_alphas)
             else:
                 self.a_alphas = a_alphas = self.a_alphas_vectorized(T)
                 da_alpha_dTs = d2a_alpha_dT2s = None
-            if self.vectorized:
-                self.a_alpha_roots = npsqrt(a_alphas)
-            else:
-                self.a_alpha_roots = [sqrt(i) for i in a_alphas]
+                if self.vectorized:
+                    self.a_alpha_roots = npsqrt(a_alphas)
+                else:
+                    self.a_alpha_roots = [sqrt(i) for i in a_alphas]
         else:
             try:
                 a_alphas, da_alpha_dTs, d2a_alpha_dT2s,  = self.a_alphas, self.da_alpha_dTs, self.d2a_alpha_dT2s
@@ -1070,7 +1077,8 @@ class GCEOSMIX(GCEOS):
             a_alpha, da_alpha_dT, d2a_alpha_dT2, self.a_alpha_j_rows, self.da_alpha_dT_j_rows = (
                     a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs,
                                                             d2a_alpha_dT2s, T, zs, one_minus_kijs,
-                                                            a_alpha_j_rows, da_alpha_dT_j_rows))
+                                                            a_alpha_j_rows, da_alpha_dT_j_rows,
+                                                            a_alpha_root_invs))
             return a_alpha, da_alpha_dT, d2a_alpha_dT2
 
         else:
@@ -1148,10 +1156,12 @@ class GCEOSMIX(GCEOS):
 
 
     def a_alpha_and_derivatives_numpy(self, a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=True):
-        zs, kijs = self.zs, np.array(self.kijs)
-        a_alphas = np.array(a_alphas)
-        da_alpha_dTs = np.array(da_alpha_dTs)
-        one_minus_kijs = 1.0 - kijs
+        # one_minus_kijs is computed once when the object is created
+        # asarray does not copy inputs that are already arrays, as in vectorized EOSs
+        zs, one_minus_kijs = np.asarray(self.zs), np.asarray(self.one_minus_kijs)
+        a_alphas = np.asarray(a_alphas)
+        da_alpha_dTs = np.asarray(da_alpha_dTs)
+        d2a_alpha_dT2s = np.asarray(d2a_alpha_dT2s)
 
         x0 = np.einsum('i,j', a_alphas, a_alphas)
         x0_05 = npsqrt(x0)
@@ -1160,9 +1170,9 @@ class GCEOSMIX(GCEOS):
         a_alpha = np.einsum('ij,ji', a_alpha_ijs, z_products)
 
         if self.vectorized:
-            self.a_alpha_ijs = a_alpha_ijs
+            self._a_alpha_ijs = a_alpha_ijs
         else:
-            self.a_alpha_ijs = a_alpha_ijs.tolist()
+            self._a_alpha_ijs = a_alpha_ijs.tolist()
 
         if full:
             term0 = np.einsum('j,i', a_alphas, da_alpha_dTs)
@@ -1178,7 +1188,7 @@ class GCEOSMIX(GCEOS):
             main6 = -0.5*np.einsum('i, j', da_alpha_dTs, da_alpha_dTs)
 
             # Needed for fugacity temperature derivative
-            self.da_alpha_dT_ijs = (0.5*(term7)*(term2 + term0)).tolist()
+            self._da_alpha_dT_ijs = (0.5*(term7)*(term2 + term0)).tolist()
 
             d2a_alpha_dT2 = (z_products*(term1*(main3 + main4 + main6))).sum()
 
@@ -6275,6 +6285,8 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
             self.zeros2d = zeros2d = [[0.0]*N for _ in range(N)]
         if kijs is None:
             kijs = zeros2d
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -6529,6 +6541,8 @@ class RKMIX(EpsilonZeroMixingRules, GCEOSMIX, RK):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -6628,7 +6642,7 @@ class RKMIX(EpsilonZeroMixingRules, GCEOSMIX, RK):
         '''
         N = self.N
         if self.vectorized:
-            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((3, N))
         else:
             a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
         return RK_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais,
@@ -6875,6 +6889,8 @@ class PRMIX(GCEOSMIX, PR):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -6974,7 +6990,7 @@ class PRMIX(GCEOSMIX, PR):
         '''
         N = self.N
         if self.vectorized:
-            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((3, N))
         else:
             a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
         return PR_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.kappas, a_alphas=a_alphas,
@@ -7916,6 +7932,8 @@ class PRMIXTranslated(PRMIX):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in range(N)]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.T = T
@@ -8319,6 +8337,8 @@ class PRMIXTranslatedPPJP(PRMIXTranslated):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.T = T
@@ -8490,6 +8510,8 @@ class PRMIXTranslatedConsistent(Twu91_a_alpha, PRMIXTranslated):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.T = T
@@ -8677,6 +8699,8 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -8767,7 +8791,7 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
         '''
         N = self.N
         if self.vectorized:
-            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((3, N))
         else:
             a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
         return SRK_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.ms,
@@ -9051,6 +9075,8 @@ class SRKMIXTranslated(SRKMIX):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs, 'cs': cs}
@@ -9462,6 +9488,8 @@ class SRKMIXTranslatedConsistent(Twu91_a_alpha, SRKMIXTranslated):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in range(N)]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.T = T
@@ -9669,6 +9697,8 @@ class MSRKMIXTranslated(Soave_1979_a_alpha, SRKMIXTranslatedConsistent):
         self.vectorized = vectorized = type(zs) is ndarray
         if kijs is None:
             kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.T = T
@@ -9818,6 +9848,8 @@ class PSRK(Mathias_Copeman_poly_a_alpha, PSRKMixingRules, SRKMIXTranslated):
         self.vectorized = vectorized = type(zs) is ndarray
         if kijs is None:
             kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         if cs is None:
             cs = [0.0]*N
         self.kijs = kijs
@@ -9983,6 +10015,8 @@ class PR78MIX(PRMIX):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in range(N)]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -10114,6 +10148,8 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*self.N for i in range(N)]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -10584,6 +10620,8 @@ class PRSVMIX(PRMIX, PRSV):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0]*self.N for i in range(N)]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
 
@@ -10702,7 +10740,7 @@ class PRSVMIX(PRMIX, PRSV):
         '''
         N = self.N
         if self.vectorized:
-            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((3, N))
         else:
             a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
         return PRSV_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.kappa0s, self.kappa1s,
@@ -10831,6 +10869,8 @@ class PRSV2MIX(PRMIX, PRSV2):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
 
@@ -10962,7 +11002,7 @@ class PRSV2MIX(PRMIX, PRSV2):
         '''
         N = self.N
         if self.vectorized:
-            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((3, N))
         else:
             a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
         return PRSV2_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.kappa0s, self.kappa1s, self.kappa2s, self.kappa3s,
@@ -11084,6 +11124,8 @@ class TWUPRMIX(TwuPR95_a_alpha, PRMIX):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -11240,6 +11282,8 @@ class TWUSRKMIX(TwuSRK95_a_alpha, SRKMIX):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in range(N)]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -11385,6 +11429,8 @@ class APISRKMIX(SRKMIX, APISRK):
                 kijs = zeros((N, N))
             else:
                 kijs = [[0.0]*N for i in cmps]
+        elif vectorized:
+            kijs = ascontiguousarray(kijs, dtype=float)
         self.kijs = kijs
         self.one_minus_kijs = one_minus_kijs(kijs)
         self.kwargs = {'kijs': kijs}
@@ -11480,7 +11526,7 @@ class APISRKMIX(SRKMIX, APISRK):
         '''
         N = self.N
         if self.vectorized:
-            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros(N), zeros(N), zeros(N)
+            a_alphas, da_alpha_dTs, d2a_alpha_dT2s = zeros((3, N))
         else:
             a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [0.0]*N, [0.0]*N, [0.0]*N
         return APISRK_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.S1s, self.S2s,
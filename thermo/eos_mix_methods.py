@@ -46,8 +46,12 @@ Compute only the alpha term itself:
 
 Faster implementations which do not store N^2 matrices:
 
+.. autofunction:: a_alpha_roots_and_root_invs
+.. autofunction:: a_alpha_quadratic
 .. autofunction:: a_alpha_quadratic_terms
+.. autofunction:: a_alpha_quadratic_terms_parallel
 .. autofunction:: a_alpha_and_derivatives_quadratic_terms
+.. autofunction:: a_alpha_and_derivatives_quadratic_terms_batched
 '''
 
 # Direct fugacity calls
@@ -62,7 +66,11 @@ Faster implementations which do not store N^2 matrices:
 # .. autofunction:: PR_lnphis_fastest
 __all__ = ['a_alpha_aijs_composition_independent',
            'a_alpha_and_derivatives', 'a_alpha_and_derivatives_full',
-           'a_alpha_quadratic_terms', 'a_alpha_and_derivatives_quadratic_terms',
+           'a_alpha_roots_and_root_invs',
+           'a_alpha_quadratic', 'a_alpha_quadratic_terms',
+           'a_alpha_quadratic_terms_parallel',
+           'a_alpha_and_derivatives_quadratic_terms',
+           'a_alpha_and_derivatives_quadratic_terms_batched',
            'PR_lnphis', 'VDW_lnphis', 'SRK_lnphis', 'eos_mix_lnphis_general',
 
            'VDW_lnphis_fastest', 'PR_lnphis_fastest',
@@ -102,6 +110,7 @@ from math import log, sqrt
 
 from fluids.constants import R
 from fluids.numerics import catanh
+from fluids.numerics import numpy as np
 
 from thermo.eos import eos_G_dep, eos_lnphi
 from thermo.eos_volume import volume_solutions_halley
@@ -113,6 +122,19 @@ root_two = sqrt(2.)
 root_two_m1 = root_two - 1.0
 root_two_p1 = root_two + 1.0
 
+# Below this many components the NumPy call overhead of
+# `a_alpha_and_derivatives_quadratic_terms_numpy` exceeds the cost of the loops
+quadratic_terms_numpy_min_N = 5
+# In the numba build, mixtures with at least this many components compute the
+# rows of `a_alpha_quadratic_terms` in parallel
+quadratic_terms_parallel_min_N = 64
+
+try:
+    ndarray, dot, npmultiply, npdivide, zeros = np.ndarray, np.dot, np.multiply, np.divide, np.zeros
+    npsqrt, npouter = np.sqrt, np.outer
+except:
+    pass
+
 def a_alpha_aijs_composition_independent(a_alphas, one_minus_kijs, a_alpha_ijs=None,
 a_alpha_roots=None, a_alpha_ij_roots_inv=None):
     r'''Calculates the matrix :math:`(a\alpha)_{ij}` as well as the array
@@ -152,6 +174,12 @@ a_alpha_roots=None, a_alpha_ij_roots_inv=None):
 
     Notes
     -----
+    When `one_minus_kijs` is a NumPy array, the matrices are formed as outer
+    products of the root vectors.
+
+    As in :obj:`a_alpha_roots_and_root_invs`, a component with an `a_alpha`
+    of zero is given an inverse root of zero, so every entry of
+    `a_alpha_ij_roots_inv` in its row and column is zero.
 
     Examples
     --------
@@ -167,6 +195,14 @@ a_alpha_roots=None, a_alpha_ij_roots_inv=None):
     [[4.0142919105, 2.487707997796], [2.487707997796, 1.54166443799]]
     '''
     N = len(a_alphas)
+    if type(one_minus_kijs) is ndarray: # numba: delete
+        a_alpha_roots = npsqrt(a_alphas, out=a_alpha_roots if type(a_alpha_roots) is ndarray else None) # numba: delete
+        a_alpha_root_invs = npdivide(1.0, a_alpha_roots, out=zeros(N), where=a_alpha_roots != 0.0) # numba: delete
+        a_alpha_ijs = npouter(a_alpha_roots, a_alpha_roots, out=a_alpha_ijs if type(a_alpha_ijs) is ndarray else None) # numba: delete
+        a_alpha_ijs *= one_minus_kijs # numba: delete
+        a_alpha_ij_roots_inv = npouter(a_alpha_root_invs, a_alpha_root_invs, # numba: delete
+                                       out=a_alpha_ij_roots_inv if type(a_alpha_ij_roots_inv) is ndarray else None) # numba: delete
+        return a_alpha_ijs, a_alpha_roots, a_alpha_ij_roots_inv # numba: delete
     _sqrt = sqrt
 
     if a_alpha_ijs is None:
@@ -174,8 +210,11 @@ a_alpha_roots=None, a_alpha_ij_roots_inv=None):
 #        a_alpha_ijs = np.zeros((N, N)) # numba: uncomment
     if a_alpha_roots is None:
         a_alpha_roots = [0.0]*N
+    # Roots and their inverses once per component, not per pair
+    a_alpha_root_invs = [0.0]*N
     for i in range(N):
-        a_alpha_roots[i] = _sqrt(a_alphas[i])
+        a_alpha_roots[i] = root = _sqrt(a_alphas[i])
+        a_alpha_root_invs[i] = 1.0/root if root != 0.0 else 0.0
 
     if a_alpha_ij_roots_inv is None:
         a_alpha_ij_roots_inv = [[0.0]*N for _ in range(N)] # numba: comment
@@ -187,13 +226,10 @@ a_alpha_roots=None, a_alpha_ij_roots_inv=None):
         a_alpha_ij_roots_i_inv = a_alpha_ij_roots_inv[i]
         # Using range like this saves 20% of the comp time for 44 components!
         a_alpha_i_root_i = a_alpha_roots[i]
+        a_alpha_i_root_inv_i = a_alpha_root_invs[i]
         for j in range(i, N):
-            term = a_alpha_i_root_i*a_alpha_roots[j]
-            try:
-                a_alpha_ij_roots_i_inv[j] = a_alpha_ij_roots_inv[j][i] = 1.0/term
-            except:
-                a_alpha_ij_roots_i_inv[j] = 1e100
-            a_alpha_ijs_is[j] = a_alpha_ijs[j][i] = one_minus_kijs_i[j]*term
+            a_alpha_ij_roots_i_inv[j] = a_alpha_ij_roots_inv[j][i] = a_alpha_i_root_inv_i*a_alpha_root_invs[j]
+            a_alpha_ijs_is[j] = a_alpha_ijs[j][i] = one_minus_kijs_i[j]*(a_alpha_i_root_i*a_alpha_roots[j])
     return a_alpha_ijs, a_alpha_roots, a_alpha_ij_roots_inv
 
 
@@ -374,21 +410,24 @@ def a_alpha_and_derivatives_full(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, zs,
 
     d2a_alpha_dT2_ij = 0.0
 
+    # Halving is exact, so this gives the same results with one less multiply per pair
+    d2a_alpha_dT2s_half = [0.0]*N
+    for i in range(N):
+        d2a_alpha_dT2s_half[i] = 0.5*d2a_alpha_dT2s[i]
+
     for i in range(N):
         one_minus_kijs_i = one_minus_kijs[i]
         a_alphai = a_alphas[i]
         z_products_i = z_products[i]
         da_alpha_dT_i = da_alpha_dTs[i]
-        d2a_alpha_dT2_i = d2a_alpha_dT2s[i]
+        d2a_alpha_dT2_half_i = d2a_alpha_dT2s_half[i]
         a_alpha_ij_roots_inv_i = a_alpha_ij_roots_inv[i]
         da_alpha_dT_ijs_i = da_alpha_dT_ijs[i]
+        d2a_alpha_dT2_ijs_i = d2a_alpha_dT2_ijs[i]
 
         if zs[i] > 0.0:
-            for j in range(N):
-    #        for j in range(0, i+1):
-                if j < i:
-    #                # skip the duplicates
-                    continue
+            # The matrices are symmetric; only the upper triangle is computed
+            for j in range(i, N):
                 a_alphaj = a_alphas[j]
                 x0_05_inv = a_alpha_ij_roots_inv_i[j]
                 zi_zj = z_products_i[j]
@@ -411,9 +450,9 @@ def a_alpha_and_derivatives_full(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, zs,
                 x0 = a_alphai*a_alphaj
 
                 d2a_alpha_dT2_ij = kij_m1*(  (x0*(
-                -0.5*(a_alphai*d2a_alpha_dT2s[j] + a_alphaj*d2a_alpha_dT2_i)
+                -(a_alphai*d2a_alpha_dT2s_half[j] + a_alphaj*d2a_alpha_dT2_half_i)
                 - da_alpha_dT_i*da_alpha_dT_j) +.25*x1_x2*x1_x2)/(x0_05_inv*x0*x0))
-                d2a_alpha_dT2_ijs[i][j] = d2a_alpha_dT2_ijs[j][i] = d2a_alpha_dT2_ij
+                d2a_alpha_dT2_ijs_i[j] = d2a_alpha_dT2_ijs[j][i] = d2a_alpha_dT2_ij
 
                 d2a_alpha_dT2_ij *= zi_zj
 
@@ -454,8 +493,8 @@ def a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, one_minus_kijs,
         Temperature, not used, [K]
     zs : list[float]
         Mole fractions of each species
-    one_minus_kijs : list[list[float]]
-        One minus the constant kijs, [-]
+    one_minus_kijs : list[list[float]] or None
+        One minus the constant kijs; None if all kijs are zero, [-]
     a_alpha_j_rows : list[float], optional
         EOS attractive term row destimation vector (does not need
         to be zeroed, should be provided to prevent allocations),
@@ -474,7 +513,11 @@ def a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, one_minus_kijs,
     Notes
     -----
     Tried moving the i=j loop out, no difference in speed, maybe got a bit slower
-    in PyPy.
+    in PyPy. Binary mixtures are handled with the loops unrolled.
+
+    When `one_minus_kijs` is a NumPy array (as for vectorized mixture EOSs),
+    the row sums are computed as a single matrix-vector product instead of
+    with Python loops.
 
     Examples
     --------
@@ -487,10 +530,45 @@ def a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, one_minus_kijs,
     >>> a_alpha, a_alpha_j_rows
     (0.58562139582, [0.35469988173, 0.61604757237])
     '''
+    if type(one_minus_kijs) is ndarray: # numba: delete
+        vec0 = npmultiply(a_alpha_roots, zs, out=vec0 if type(vec0) is ndarray else None) # numba: delete
+        one_minus_kijs_diag = one_minus_kijs.diagonal() # numba: delete
+        # Use a_alphas on the diagonal rather than the squared roots, as the loops do # numba: delete
+        a_alpha_j_rows = npmultiply(a_alpha_roots, dot(one_minus_kijs, vec0) - one_minus_kijs_diag*vec0, # numba: delete
+                                    out=a_alpha_j_rows if type(a_alpha_j_rows) is ndarray else None) # numba: delete
+        a_alpha_j_rows += one_minus_kijs_diag*npmultiply(a_alphas, zs) # numba: delete
+        return float(dot(zs, a_alpha_j_rows)), a_alpha_j_rows # numba: delete
     N = len(a_alphas)
     if a_alpha_j_rows is None:
         a_alpha_j_rows = [0.0]*N
 
+#    if N >= quadratic_terms_parallel_min_N and one_minus_kijs is not None: # numba: uncomment
+#        return a_alpha_quadratic_terms_parallel(a_alphas, a_alpha_roots, T, zs, one_minus_kijs, a_alpha_j_rows) # numba: uncomment
+
+    if one_minus_kijs is None:
+        # No interaction parameters; every row is a multiple of the same sum
+        a_alpha_roots_zs_sum = 0.0
+        for i in range(N):
+            a_alpha_roots_zs_sum += a_alpha_roots[i]*zs[i]
+        a_alpha = 0.0
+        for i in range(N):
+            a_alpha_j_rows[i] = a_alpha_roots[i]*a_alpha_roots_zs_sum
+            a_alpha += a_alpha_j_rows[i]*zs[i]
+        return float(a_alpha), a_alpha_j_rows
+
+    if N == 2:
+        # Binary mixtures are common enough to unroll; same operation order as the loops
+        one_minus_kijs0, one_minus_kijs1 = one_minus_kijs[0], one_minus_kijs[1]
+        one_minus_kij, one_minus_kii0, one_minus_kii1 = one_minus_kijs1[0], one_minus_kijs0[0], one_minus_kijs1[1]
+        z0, z1 = zs[0], zs[1]
+        root0, root1 = a_alpha_roots[0], a_alpha_roots[1]
+        a_alpha0, a_alpha1 = a_alphas[0], a_alphas[1]
+        a_alpha_j_row0 = one_minus_kij*(root1*z1)*root0 + one_minus_kii0*a_alpha0*z0
+        a_alpha_j_row1 = one_minus_kij*(root0*z0)*root1 + one_minus_kii1*a_alpha1*z1
+        a_alpha_j_rows[0] = a_alpha_j_row0
+        a_alpha_j_rows[1] = a_alpha_j_row1
+        return float(a_alpha_j_row0*z0 + a_alpha_j_row1*z1), a_alpha_j_rows
+
     for i in range(N):
         a_alpha_j_rows[i] = 0.0
 
@@ -542,10 +620,188 @@ def a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, one_minus_kijs,
     """
 
 
+def a_alpha_roots_and_root_invs(a_alphas, a_alpha_roots=None, a_alpha_root_invs=None):
+    r'''Calculates the square roots of the pure component `a_alpha` terms and
+    their inverses in a single pass.
+
+    Components with an `a_alpha` of zero are given an inverse root of zero,
+    not infinity, so they drop out of the temperature derivative mixing
+    rules. :obj:`a_alpha_aijs_composition_independent` follows the same
+    convention.
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float], optional
+        Destination vector for the square roots, [J/mol/Pa^0.5]
+    a_alpha_root_invs : list[float], optional
+        Destination vector for the inverse square roots, [mol*Pa^0.5/J]
+
+    Returns
+    -------
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`, [J/mol/Pa^0.5]
+    a_alpha_root_invs : list[float]
+        Inverses of the square roots of `a_alphas`, [mol*Pa^0.5/J]
+
+    Examples
+    --------
+    >>> a_alpha_roots_and_root_invs([0.2491099357671155, 0.0])
+    ([0.49910914213, 0.0], [2.0035697918, 0.0])
+    '''
+    N = len(a_alphas)
+    if a_alpha_roots is None:
+        a_alpha_roots = [0.0]*N
+    if a_alpha_root_invs is None:
+        a_alpha_root_invs = [0.0]*N
+    for i in range(N):
+        a_alpha_root = sqrt(a_alphas[i])
+        a_alpha_roots[i] = a_alpha_root
+        if a_alpha_root != 0.0:
+            a_alpha_root_invs[i] = 1.0/a_alpha_root
+        else:
+            a_alpha_root_invs[i] = 0.0
+    return a_alpha_roots, a_alpha_root_invs
+
+
+def a_alpha_quadratic(a_alphas, a_alpha_roots, zs, one_minus_kijs):
+    r'''Calculates only the `a_alpha` term for an equation of state, without
+    the row sums needed for fugacities. Useful in routines that only require
+    the mixture's attractive term, such as volume iterations.
+
+    .. math::
+        a \alpha = \sum_i \sum_j z_i z_j {(a\alpha)}_{ij}
+
+    .. math::
+        (a\alpha)_{ij} = (1-k_{ij})\sqrt{(a\alpha)_{i}(a\alpha)_{j}}
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    zs : list[float]
+        Mole fractions of each species
+    one_minus_kijs : list[list[float]]
+        One minus the constant kijs, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+
+    Notes
+    -----
+    Only the lower triangle of `one_minus_kijs` is read. When `one_minus_kijs`
+    is a NumPy array, the quadratic form is evaluated with two dot products.
+
+    Examples
+    --------
+    >>> kijs = [[0,.083],[0.083,0]]
+    >>> one_minus_kijs = [[1.0 - kij for kij in row] for row in kijs]
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> a_alpha_quadratic(a_alphas, a_alpha_roots, zs, one_minus_kijs)
+    0.58562139582
+    '''
+    if type(one_minus_kijs) is ndarray: # numba: delete
+        vec0 = npmultiply(a_alpha_roots, zs) # numba: delete
+        one_minus_kijs_diag = one_minus_kijs.diagonal() # numba: delete
+        a_alpha = dot(vec0, dot(one_minus_kijs, vec0)) - dot(one_minus_kijs_diag*vec0, vec0) # numba: delete
+        a_alpha += dot(one_minus_kijs_diag*npmultiply(a_alphas, zs), zs) # numba: delete
+        return float(a_alpha) # numba: delete
+    N = len(a_alphas)
+    a_alpha_off = 0.0
+    a_alpha_diag = 0.0
+    for i in range(N):
+        one_minus_kijs_i = one_minus_kijs[i]
+        vec0_i = a_alpha_roots[i]*zs[i]
+        row = 0.0
+        for j in range(i):
+            row += one_minus_kijs_i[j]*a_alpha_roots[j]*zs[j]
+        a_alpha_off += row*vec0_i
+        a_alpha_diag += one_minus_kijs_i[i]*a_alphas[i]*zs[i]*zs[i]
+    return a_alpha_off + a_alpha_off + a_alpha_diag
+
+
+def a_alpha_quadratic_terms_parallel(a_alphas, a_alpha_roots, T, zs, one_minus_kijs,
+                                     a_alpha_j_rows=None):
+    r'''Calculates the `a_alpha` term for an equation of state along with the
+    vector quantities needed to compute the fugacities of the mixture, with
+    rows that can be computed independently of each other. The results are
+    the same as those of :obj:`a_alpha_quadratic_terms`.
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    one_minus_kijs : list[list[float]]
+        One minus the constant kijs, [-]
+    a_alpha_j_rows : list[float], optional
+        EOS attractive term row destimation vector (does not need
+        to be zeroed, should be provided to prevent allocations),
+        [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+
+    Notes
+    -----
+    Each row is summed over the whole of `one_minus_kijs` rather than over
+    one triangle of it, which doubles the work. That only pays off in the
+    numba build, where the outer loop runs in parallel;
+    :obj:`a_alpha_quadratic_terms` calls this function there for mixtures of
+    at least `quadratic_terms_parallel_min_N` components that have kijs.
+    `a_alpha` itself is summed serially so it does not depend on the number
+    of threads.
+
+    Examples
+    --------
+    >>> kijs = [[0,.083],[0.083,0]]
+    >>> one_minus_kijs = [[1.0 - kij for kij in row] for row in kijs]
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms_parallel(a_alphas, a_alpha_roots, 299.0, zs, one_minus_kijs)
+    >>> a_alpha, a_alpha_j_rows
+    (0.58562139582, [0.35469988173, 0.61604757237])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+    for i in range(N): # numba: prange
+        one_minus_kijs_i = one_minus_kijs[i]
+        row = 0.0
+        for j in range(i):
+            row += one_minus_kijs_i[j]*a_alpha_roots[j]*zs[j]
+        for j in range(i+1, N):
+            row += one_minus_kijs_i[j]*a_alpha_roots[j]*zs[j]
+        a_alpha_j_rows[i] = row*a_alpha_roots[i] + one_minus_kijs_i[i]*a_alphas[i]*zs[i]
+
+    # Sum serially so the result does not depend on the thread count
+    a_alpha = 0.0
+    for i in range(N):
+        a_alpha += a_alpha_j_rows[i]*zs[i]
+    return float(a_alpha), a_alpha_j_rows
+
+
 def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
                                             da_alpha_dTs, d2a_alpha_dT2s, T,
                                             zs, one_minus_kijs, a_alpha_j_rows=None,
-                                            da_alpha_dT_j_rows=None):
+                                            da_alpha_dT_j_rows=None, a_alpha_root_invs=None):
     r'''Calculates the `a_alpha` term, and its first two temperature
     derivatives, for an equation of state along with the
     vector quantities needed to compute the fugacitie and temperature
@@ -625,8 +881,20 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
         Temperature, not used, [K]
     zs : list[float]
         Mole fractions of each species
-    one_minus_kijs : list[list[float]]
-        One minus the constant kijs, [-]
+    one_minus_kijs : list[list[float]] or None
+        One minus the constant kijs; None if all kijs are zero, [-]
+    a_alpha_j_rows : list[float], optional
+        EOS attractive term row destimation vector (does not need
+        to be zeroed, should be provided to prevent allocations),
+        [J^2/mol^2/Pa]
+    da_alpha_dT_j_rows : list[float], optional
+        Temperature derivative of EOS attractive term row destimation vector
+        (does not need to be zeroed, should be provided to prevent
+        allocations), [J^2/mol^2/Pa/K]
+    a_alpha_root_invs : list[float], optional
+        Inverses of `a_alpha_roots`, zero where `a_alphas` is zero, as from
+        :obj:`a_alpha_roots_and_root_invs`; computed if not provided,
+        [mol*Pa^0.5/J]
 
     Returns
     -------
@@ -645,6 +913,10 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
 
     Notes
     -----
+    When `one_minus_kijs` is a NumPy array and there are enough components
+    for it to be worthwhile, the sums are evaluated with matrix-vector and
+    dot products instead of Python loops. Passing the other vectors as
+    float arrays as well avoids converting them on each call.
 
     Examples
     --------
@@ -658,6 +930,10 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
     >>> a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, one_minus_kijs)
     (0.58562139582, -0.001018667672, 3.56669817856e-06, [0.35469988173, 0.61604757237], [-0.000672387374, -0.001064293501])
     '''
+    if type(one_minus_kijs) is ndarray and len(a_alphas) >= quadratic_terms_numpy_min_N: # numba: delete
+        return a_alpha_and_derivatives_quadratic_terms_numpy(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, # numba: delete
+                                                             zs, one_minus_kijs, a_alpha_j_rows, da_alpha_dT_j_rows, # numba: delete
+                                                             a_alpha_root_invs) # numba: delete
     N = len(a_alphas)
     a_alpha = da_alpha_dT = d2a_alpha_dT2 = 0.0
 
@@ -666,24 +942,59 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
     if da_alpha_dT_j_rows is None:
         da_alpha_dT_j_rows = [0.0]*N
 
-    # If d2a_alpha_dT2s were all halved, could save one more multiply
+    # One division per component instead of one per pair
+    if a_alpha_root_invs is None:
+        a_alpha_root_invs = [0.0]*N
+        for i in range(N):
+            if a_alphas[i] != 0.0:
+                a_alpha_root_invs[i] = 1.0/a_alpha_roots[i]
+
+    if one_minus_kijs is None:
+        # No interaction parameters; the double sums factor into single sums
+        a_alpha_roots_zs_sum = da_alpha_dT_root_invs_zs_sum = 0.0
+        for i in range(N):
+            a_alpha_roots_zs_sum += a_alpha_roots[i]*zs[i]
+            da_alpha_dT_root_invs_zs_sum += zs[i]*da_alpha_dTs[i]*a_alpha_root_invs[i]
+        for i in range(N):
+            zi, a_alpha_i_root_i, a_alpha_i_root_inv_i = zs[i], a_alpha_roots[i], a_alpha_root_invs[i]
+            da_alpha_dT_i, d2a_alpha_dT2_i = da_alpha_dTs[i], d2a_alpha_dT2s[i]
+            wi = zi*a_alpha_i_root_i
+            vi = zi*da_alpha_dT_i*a_alpha_i_root_inv_i
+            a_alpha_j_rows[i] = a_alpha_i_root_i*a_alpha_roots_zs_sum
+            da_alpha_dT_j_rows[i] = 0.5*(a_alpha_i_root_i*da_alpha_dT_root_invs_zs_sum
+                                         + da_alpha_dT_i*a_alpha_i_root_inv_i*a_alpha_roots_zs_sum)
+            a_alpha += a_alpha_j_rows[i]*zi
+            da_alpha_dT += da_alpha_dT_j_rows[i]*zi
+            if a_alphas[i] != 0.0:
+                d2a_alpha_dT2 += ((zi*d2a_alpha_dT2_i - 0.5*vi*da_alpha_dT_i*a_alpha_i_root_inv_i)*a_alpha_i_root_inv_i*(a_alpha_roots_zs_sum - wi)
+                                  + 0.5*vi*(da_alpha_dT_root_invs_zs_sum - vi) + zi*zi*d2a_alpha_dT2_i)
+        return float(a_alpha), float(da_alpha_dT), float(d2a_alpha_dT2), a_alpha_j_rows, da_alpha_dT_j_rows
+
+    # Halving is exact in floating point, so folding the 0.5 of the pair
+    # average into the vector saves a multiply per pair with identical results
+    d2a_alpha_dT2s_half = [0.0]*N
+    for i in range(N):
+        d2a_alpha_dT2s_half[i] = 0.5*d2a_alpha_dT2s[i]
+
     for i in range(N):
         one_minus_kijs_i = one_minus_kijs[i]
         a_alpha_i_root_i = a_alpha_roots[i]
+        a_alpha_i_root_inv_i = a_alpha_root_invs[i]
 
         # delete these references?
         a_alphai = a_alphas[i]
         da_alpha_dT_i = da_alpha_dTs[i]
         d2a_alpha_dT2_i = d2a_alpha_dT2s[i]
-        workingd1 = workings2 = 0.0
-        if a_alphai == 0.0 or zs[i] == 0.0:
+        d2a_alpha_dT2_half_i = d2a_alpha_dT2s_half[i]
+        zi = zs[i]
+        workings2 = 0.0
+        if a_alphai == 0.0 or zi == 0.0:
             continue
 
         for j in range(i):
-            # TODO: optimize this, compute a_alpha after
             v0 = a_alpha_i_root_i*a_alpha_roots[j]
             a_alpha_ijs_ij = (one_minus_kijs_i[j])*v0
-            t200 = a_alpha_ijs_ij*zs[i]
+            t200 = a_alpha_ijs_ij*zi
             a_alpha_j_rows[j] += t200
             a_alpha_j_rows[i] += zs[j]*a_alpha_ijs_ij
             t200 *= zs[j]
@@ -693,7 +1004,7 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
             if a_alphaj == 0.0:
                 continue
             da_alpha_dT_j = da_alpha_dTs[j]
-            zi_zj = zs[i]*zs[j]
+            zi_zj = zi*zs[j]
 
             x1 = a_alphai*da_alpha_dT_j
             x2 = a_alphaj*da_alpha_dT_i
@@ -701,44 +1012,173 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
 
             kij_m1 = -one_minus_kijs_i[j]
 
-            v0_inv = 1.0/v0
+            v0_inv = a_alpha_i_root_inv_i*a_alpha_root_invs[j]
             v1 = kij_m1*v0_inv
             da_alpha_dT_ij = x1_x2*v1
 #             da_alpha_dT_ij = -0.5*x1_x2*v1 # Factor the -0.5 out, apply at end
-            da_alpha_dT_j_rows[j] += zs[i]*da_alpha_dT_ij
+            da_alpha_dT_j_rows[j] += zi*da_alpha_dT_ij
             da_alpha_dT_j_rows[i] += zs[j]*da_alpha_dT_ij
 
-            da_alpha_dT_ij *= zi_zj
-
             x0 = a_alphai*a_alphaj
 
             # Technically could use a second list of double a_alphas, probably not used
             d2a_alpha_dT2_ij =  v0_inv*v0_inv*v1*(  x0*(
-                              -0.5*(a_alphai*d2a_alpha_dT2s[j] + a_alphaj*d2a_alpha_dT2_i)
+                              -(a_alphai*d2a_alpha_dT2s_half[j] + a_alphaj*d2a_alpha_dT2_half_i)
                               - da_alpha_dT_i*da_alpha_dT_j) +.25*x1_x2*x1_x2)
 
-            d2a_alpha_dT2_ij *= zi_zj
-            workingd1 += da_alpha_dT_ij
-            workings2 += d2a_alpha_dT2_ij
-            # 23 multiplies, 1 divide in this loop
+            workings2 += d2a_alpha_dT2_ij*zi_zj
+            # 21 multiplies, 1 divide in this loop
 
 
         # Simplifications for j=i, kij is always 0 by definition.
-        t200 = a_alphas[i]*zs[i]
+        t200 = a_alphai*zi
         a_alpha_j_rows[i] += t200
-        a_alpha += t200*zs[i]
-        zi_zj = zs[i]*zs[i]
-        da_alpha_dT_ij = -da_alpha_dT_i - da_alpha_dT_i#da_alpha_dT_i*-2.0
-        da_alpha_dT_j_rows[i] += zs[i]*da_alpha_dT_ij
-        da_alpha_dT_ij *= zi_zj
-        da_alpha_dT -= 0.5*(da_alpha_dT_ij + (workingd1 + workingd1))
-        d2a_alpha_dT2 += d2a_alpha_dT2_i*zi_zj + (workings2 + workings2)
+        a_alpha += t200*zi
+        da_alpha_dT_j_rows[i] += zi*(-da_alpha_dT_i - da_alpha_dT_i)#da_alpha_dT_i*-2.0
+        d2a_alpha_dT2 += d2a_alpha_dT2_i*zi*zi + (workings2 + workings2)
+
+    # da_alpha_dT is a reduction of its row sums; computing it here keeps
+    # its accumulation out of the pair loop
     for i in range(N):
         da_alpha_dT_j_rows[i] *= -0.5
+        da_alpha_dT += da_alpha_dT_j_rows[i]*zs[i]
 
     return float(a_alpha), float(da_alpha_dT), float(d2a_alpha_dT2), a_alpha_j_rows, da_alpha_dT_j_rows
 
+def a_alpha_and_derivatives_quadratic_terms_numpy(a_alphas, a_alpha_roots,
+                                                  da_alpha_dTs, d2a_alpha_dT2s,
+                                                  zs, one_minus_kijs, a_alpha_j_rows=None,
+                                                  da_alpha_dT_j_rows=None, a_alpha_root_invs=None):
+    # Same quantities as `a_alpha_and_derivatives_quadratic_terms`, rewritten
+    # so every double sum is a matrix-vector product followed by a dot
+    # product. With p = a_alpha'/a_alpha, q = a_alpha''/a_alpha and w = z*root,
+    # the i != j terms are
+    #   da_alpha_dT_j_rows = 0.5*(root*(K@(z*a_alpha'/root)) + (a_alpha'/root)*(K@w))
+    #   d2a_alpha_dT2 = 2*(w*(q/2 - p^2/4)).(K@w) + 0.5*(w*p).(K@(w*p))
+    # The diagonal is removed from each product and added back exactly as the
+    # loops do, which keeps single component mixtures identical.
+    # Components with a zero a_alpha contribute nothing, as in the loops.
+    a_alphas, a_alpha_roots, zs = np.asarray(a_alphas), np.asarray(a_alpha_roots), np.asarray(zs)
+    if a_alpha_root_invs is None:
+        root_invs = npdivide(1.0, a_alpha_roots, out=zeros(a_alpha_roots.shape), where=a_alphas != 0.0)
+    else:
+        root_invs = np.asarray(a_alpha_root_invs)
+    a_alpha_invs = root_invs*root_invs
+    K_diag = one_minus_kijs.diagonal()
+
+    ws = zs*a_alpha_roots
+    K_ws = dot(one_minus_kijs, ws) - K_diag*ws
+    a_alpha_j_rows = npmultiply(a_alpha_roots, K_ws,
+                                out=a_alpha_j_rows if type(a_alpha_j_rows) is ndarray else None)
+    a_alpha_j_rows += a_alphas*zs
+
+    da_alpha_dT_root_invs = npmultiply(da_alpha_dTs, root_invs)
+    vec0 = zs*da_alpha_dT_root_invs
+    da_alpha_dT_j_rows = npmultiply(a_alpha_roots, dot(one_minus_kijs, vec0) - K_diag*vec0,
+                                    out=da_alpha_dT_j_rows if type(da_alpha_dT_j_rows) is ndarray else None)
+    da_alpha_dT_j_rows += da_alpha_dT_root_invs*K_ws
+    da_alpha_dT_j_rows *= 0.5
+    da_alpha_dT_j_rows += zs*da_alpha_dTs
+
+    ps = npmultiply(da_alpha_dTs, a_alpha_invs)
+    qs = npmultiply(d2a_alpha_dT2s, a_alpha_invs)
+    ws_ps = ws*ps
+    d2a_alpha_dT2 = (2.0*dot(ws*(0.5*qs - 0.25*ps*ps), K_ws)
+                     + 0.5*dot(ws_ps, dot(one_minus_kijs, ws_ps) - K_diag*ws_ps)
+                     + dot(zs*zs, d2a_alpha_dT2s))
+    return (float(dot(zs, a_alpha_j_rows)), float(dot(zs, da_alpha_dT_j_rows)), float(d2a_alpha_dT2),
+            a_alpha_j_rows, da_alpha_dT_j_rows)
+
+def a_alpha_and_derivatives_quadratic_terms_batched(a_alphas, a_alpha_roots,
+                                                    da_alpha_dTs, d2a_alpha_dT2s,
+                                                    zs, one_minus_kijs):
+    r'''Calculates the `a_alpha` term, and its first two temperature
+    derivatives, at several temperatures at once for a mixture of fixed
+    composition. Each row of the inputs holds the pure component terms at one
+    temperature; the results are the same as calling
+    :obj:`a_alpha_and_derivatives_quadratic_terms` once per row. Requires
+    NumPy.
+
+    Parameters
+    ----------
+    a_alphas : ndarray[float]
+        EOS attractive terms, shape (M, N), [J^2/mol^2/Pa]
+    a_alpha_roots : ndarray[float]
+        Square roots of `a_alphas`, shape (M, N), [J/mol/Pa^0.5]
+    da_alpha_dTs : ndarray[float]
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, shape (M, N), [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2s : ndarray[float]
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, shape (M, N), [J^2/mol^2/Pa/K**2]
+    zs : ndarray[float]
+        Mole fractions of each species, shape (N,)
+    one_minus_kijs : ndarray[float]
+        One minus the constant kijs, shape (N, N), [-]
+
+    Returns
+    -------
+    a_alpha : ndarray[float]
+        EOS attractive term at each temperature, shape (M,), [J^2/mol^2/Pa]
+    da_alpha_dT : ndarray[float]
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, shape (M,), [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : ndarray[float]
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, shape (M,), [J^2/mol^2/Pa/K**2]
+    a_alpha_j_rows : ndarray[float]
+        EOS attractive term row sums, shape (M, N), [J^2/mol^2/Pa]
+    da_alpha_dT_j_rows : ndarray[float]
+        Temperature derivative of EOS attractive term row sums, shape (M, N),
+        [J^2/mol^2/Pa/K]
+
+    Notes
+    -----
+    The sums over components become matrix-matrix products, so the cost of
+    each NumPy call is shared by all the temperatures. `one_minus_kijs` must
+    be symmetric.
 
+    Examples
+    --------
+    >>> import numpy as np
+    >>> one_minus_kijs = np.array([[1.0, 0.917], [0.917, 1.0]])
+    >>> zs = np.array([0.1164203, 0.8835797])
+    >>> a_alphas = np.array([[0.2491099357671155, 0.6486495863528039]])
+    >>> da_alpha_dTs = np.array([[-0.0005102028006086241, -0.0011131153520304886]])
+    >>> d2a_alpha_dT2s = np.array([[1.8651128859234162e-06, 3.884331923127011e-06]])
+    >>> res = a_alpha_and_derivatives_quadratic_terms_batched(a_alphas, np.sqrt(a_alphas), da_alpha_dTs, d2a_alpha_dT2s, zs, one_minus_kijs)
+    >>> [float(v[0]) for v in res[0:3]]
+    [0.58562139582, -0.001018667672, 3.56669817856e-06]
+    '''
+    # Same expressions as `a_alpha_and_derivatives_quadratic_terms_numpy`
+    # with a leading temperature axis
+    a_alphas, a_alpha_roots, zs = np.asarray(a_alphas), np.asarray(a_alpha_roots), np.asarray(zs)
+    da_alpha_dTs, d2a_alpha_dT2s = np.asarray(da_alpha_dTs), np.asarray(d2a_alpha_dT2s)
+    one_minus_kijs = np.asarray(one_minus_kijs)
+    root_invs = npdivide(1.0, a_alpha_roots, out=zeros(a_alpha_roots.shape), where=a_alphas != 0.0)
+    a_alpha_invs = root_invs*root_invs
+    K_diag = one_minus_kijs.diagonal()
+
+    ws = zs*a_alpha_roots
+    K_ws = dot(ws, one_minus_kijs) - K_diag*ws
+    a_alpha_j_rows = a_alpha_roots*K_ws
+    a_alpha_j_rows += a_alphas*zs
+
+    da_alpha_dT_root_invs = da_alpha_dTs*root_invs
+    vec0 = zs*da_alpha_dT_root_invs
+    da_alpha_dT_j_rows = a_alpha_roots*(dot(vec0, one_minus_kijs) - K_diag*vec0)
+    da_alpha_dT_j_rows += da_alpha_dT_root_invs*K_ws
+    da_alpha_dT_j_rows *= 0.5
+    da_alpha_dT_j_rows += zs*da_alpha_dTs
+
+    ps = da_alpha_dTs*a_alpha_invs
+    qs = d2a_alpha_dT2s*a_alpha_invs
+    ws_ps = ws*ps
+    d2a_alpha_dT2 = (2.0*(ws*(0.5*qs - 0.25*ps*ps)*K_ws).sum(axis=-1)
+                     + 0.5*(ws_ps*(dot(ws_ps, one_minus_kijs) - K_diag*ws_ps)).sum(axis=-1)
+                     + dot(d2a_alpha_dT2s, zs*zs))
+    return (dot(a_alpha_j_rows, zs), dot(da_alpha_dT_j_rows, zs), d2a_alpha_dT2,
+            a_alpha_j_rows, da_alpha_dT_j_rows)
 
 
 def eos_mix_dV_dzs(T, P, Z, b, delta, epsilon, a_alpha, db_dzs, ddelta_dzs,
@@ -1309,8 +1749,13 @@ def PR_lnphis(T, P, Z, b, a_alpha, bs, a_alpha_j_rows, N, lnphis=None):
     else:
         for i in range(N):
             lnphis[i] = 0.0
-            return lnphis
+        return lnphis
     t51 = (x4 + (Z - 1.0)*two_root_two_B)/(b*two_root_two_B)
+    if type(a_alpha_j_rows) is ndarray: # numba: delete
+        lnphis = npmultiply(bs, t51, out=lnphis if type(lnphis) is ndarray else None) # numba: delete
+        lnphis -= x0 # numba: delete
+        lnphis -= t50*a_alpha_j_rows # numba: delete
+        return lnphis # numba: delete
     for i in range(N):
         lnphis[i] = bs[i]*t51 - x0 - t50*a_alpha_j_rows[i]
     return lnphis
@@ -1331,6 +1776,11 @@ def SRK_lnphis(T, P, Z, b, a_alpha, bs, a_alpha_j_rows, N, lnphis=None):
     x0 = A_B*B_inv*t3
     x1 = A_B*two_over_a_alpha*t3
     x2 = (Z_minus_one_over_B + x0)*P_RT
+    if type(a_alpha_j_rows) is ndarray: # numba: delete
+        lnphis = npmultiply(bs, x2, out=lnphis if type(lnphis) is ndarray else None) # numba: delete
+        lnphis -= t0 # numba: delete
+        lnphis -= x1*a_alpha_j_rows # numba: delete
+        return lnphis # numba: delete
     for i in range(N):
         lnphis[i] = bs[i]*x2 - t0 - x1*a_alpha_j_rows[i]
     return lnphis
@@ -1344,6 +1794,11 @@ def VDW_lnphis(T, P, Z, b, a_alpha, bs, a_alpha_roots, N, lnphis=None):
     t1 = log(Z*(1. - b/V))
     t2 = 2.0*sqrt_a_alpha/(R*T*V)
     t3 = 1.0/(V - b)
+    if type(a_alpha_roots) is ndarray: # numba: delete
+        lnphis = npmultiply(bs, t3, out=lnphis if type(lnphis) is ndarray else None) # numba: delete
+        lnphis -= t1 # numba: delete
+        lnphis -= t2*a_alpha_roots # numba: delete
+        return lnphis # numba: delete
     for i in range(N):
         lnphis[i] = (bs[i]*t3 - t1 - t2*a_alpha_roots[i])
     return lnphis
@@ -64,6 +64,7 @@ Numerical Solvers
 .. autofunction:: volume_solutions_halley
 .. autofunction:: volume_solutions_NR
 .. autofunction:: volume_solutions_NR_low_P
+.. autofunction:: volume_solutions_vectorized
 
 Higher-Precision Solvers
 ------------------------
@@ -77,7 +78,7 @@ __all__ = ['volume_solutions_mpmath', 'volume_solutions_mpmath_float',
            'volume_solutions_NR', 'volume_solutions_NR_low_P', 'volume_solutions_halley',
            'volume_solutions_fast', 'volume_solutions_Cardano', 'volume_solutions_a1',
            'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal',
-           'volume_solutions_doubledouble_float',
+           'volume_solutions_doubledouble_float', 'volume_solutions_vectorized',
            'volume_solution_polish', 'volume_solutions_sympy']
 
 
@@ -867,9 +868,10 @@ def volume_solutions_halley(T, P, b, delta, epsilon, a_alpha):
     thetas = a_alpha*P_RT_inv*RT_inv
     epsilons = epsilon*P_RT_inv*P_RT_inv
 
+    B_1 = B + 1.0
     b2 = (deltas - B - 1.0)
-    c2 = (thetas + epsilons - deltas*(B + 1.0))
-    d2 = -(epsilons*(B + 1.0) + thetas*etas)
+    c2 = (thetas + epsilons - deltas*B_1)
+    d2 = -(epsilons*B_1 + thetas*etas)
     RT_P = RT*P_inv
 
     low_V, high_V = b*(1.0+8e-16), -RT_P*d2/c2
@@ -932,7 +934,7 @@ def volume_solutions_halley(T, P, b, delta, epsilon, a_alpha):
         # If the molar volume converged on is such that the second term can be added to the
         # first term and it is still the first term, we are *extremely* ideal
         # and we should just quit
-        main0 = R*T/(V - b)
+        main0 = RT/(V - b)
         main1 = a_alpha/(V*V + delta*V + epsilon)
         # In these checks, atetmpt to evaluate if we are highly ideal
         # and there is only one solution
@@ -1149,9 +1151,9 @@ def volume_solutions_Cardano(T, P, b, delta, epsilon, a_alpha):
     b = (deltas - B - 1.0)
     c = (thetas + epsilons - deltas*(B + 1.0))
     d = -(epsilons*(B + 1.0) + thetas*etas)
-    roots = list(roots_cubic(1.0, b, c, d))
+    x0, x1, x2 = roots_cubic(1.0, b, c, d)
     RT_P = R*T/P
-    return [V*RT_P for V in roots]
+    return [x0*RT_P, x1*RT_P, x2*RT_P]
 
 def volume_solutions_a1(T, P, b, delta, epsilon, a_alpha):
     r'''Solution of this form of the cubic EOS in terms of volumes. Returns
@@ -1320,6 +1322,91 @@ def volume_solutions_numpy(T, P, b, delta, epsilon, a_alpha):
     RT_P = R*T/P
     return [V*RT_P for V in roots]
 
+def volume_solutions_vectorized(T, P, b, delta, epsilon, a_alpha, polish=2):
+    r'''Calculate the molar volume solutions to a cubic equation of state for
+    arrays of conditions at once. The roots of every cubic are found together
+    as the eigenvalues of a stack of companion matrices (the same approach
+    as NumPy's `roots`), after which the real roots are polished with
+    `polish` vectorized Halley steps.
+
+    Parameters
+    ----------
+    T : float or ndarray
+        Temperature, [K]
+    P : float or ndarray
+        Pressure, [Pa]
+    b : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or ndarray
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+    polish : int, optional
+        Number of Halley steps to take on each real root, [-]
+
+    Returns
+    -------
+    Vs : ndarray
+        Three possible molar volumes for each set of conditions, with the
+        shape of the broadcast inputs plus a trailing axis of length 3;
+        complex, [m^3/mol]
+
+    Notes
+    -----
+    The inputs are broadcast against each other. This is intended for large
+    grids of conditions where the per-call overhead of
+    :obj:`volume_solutions_halley` dominates; it is not as rigorously tested
+    as that method.
+
+    Examples
+    --------
+    >>> Vs = volume_solutions_vectorized(np.array([300.0, 400.0]), 1e6, 2.67e-5, 5.34e-5, -7.13e-10, 0.4)
+    >>> Vs.shape
+    (2, 3)
+    '''
+    T, P, b, delta, epsilon, a_alpha = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (T, P, b, delta, epsilon, a_alpha)])
+    shape = T.shape
+    RT = R*T
+    RT_inv = R_inv/T
+    P_RT_inv = P*RT_inv
+    B = b*P_RT_inv
+    deltas = delta*P_RT_inv
+    thetas = a_alpha*P_RT_inv*RT_inv
+    epsilons = epsilon*P_RT_inv*P_RT_inv
+    B_1 = B + 1.0
+
+    companion = np.zeros(shape + (3, 3))
+    companion[..., 0, 0] = -(deltas - B - 1.0)
+    companion[..., 0, 1] = -(thetas + epsilons - deltas*B_1)
+    companion[..., 0, 2] = epsilons*B_1 + thetas*B
+    companion[..., 1, 0] = 1.0
+    companion[..., 2, 1] = 1.0
+    Vs = np.linalg.eigvals(companion)*(RT/P)[..., None]
+
+    # Polish the real roots only, with the same steps as volume_solutions_halley
+    V = Vs.real
+    real = (Vs.imag == 0.0) | (np.abs(Vs.imag) < 1e-12*np.abs(V))
+    polishable = real & (V > b[..., None])
+    RT, P, b, delta, epsilon, a_alpha = (v[..., None] for v in (RT, P, b, delta, epsilon, a_alpha))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(polish):
+            x0_inv = 1.0/(V - b)
+            x1_inv = 1.0/(V*(V + delta) + epsilon)
+            x2 = V + V + delta
+            fval = -P + RT*x0_inv - a_alpha*x1_inv
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alpha*x1_inv2
+            fder = x2*x3 - RT*x0_inv2
+            fder2 = 2.0*RT*x0_inv2*x0_inv - 2.0*a_alpha*x2*x2*x1_inv2*x1_inv + x3 + x3
+            step = fval/fder
+            V_new = V - step/(1.0 - 0.5*step*fder2/fder)
+            V = np.where(polishable & np.isfinite(V_new), V_new, V)
+    return np.where(real, V + 0.0j, Vs)
+
 def volume_solutions_ideal(T, P, b=0.0, delta=0.0, epsilon=0.0, a_alpha=0.0):
     r'''Calculate the ideal-gas molar volume in a format compatible with the
     other cubic EOS solvers. The ideal gas volume is the first element; and the
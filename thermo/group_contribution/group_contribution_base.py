@@ -20,10 +20,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 '''
-from chemicals.elements import simple_formula_parser
+from chemicals.elements import periodic_table, simple_formula_parser
 
 __all__ = ['str_group_assignment_to_dict', 'group_assignment_to_str',
-           'smarts_fragment_priority', 'smarts_fragment']
+           'smarts_fragment_priority', 'smarts_fragment', 'smarts_element_mask']
 
 rdkit_missing = 'RDKit is not installed; it is required to use this functionality'
 
@@ -112,6 +112,129 @@ def str_group_assignment_to_dict(counts, pair_separator=',', key_val_separator='
 
 
 
+smarts_organic_subset = {'Cl': 17, 'Br': 35, 'B': 5, 'C': 6, 'N': 7, 'O': 8, 'P': 15,
+                         'S': 16, 'F': 9, 'I': 53, 'b': 5, 'c': 6, 'n': 7, 'o': 8,
+                         'p': 15, 's': 16}
+smarts_aromatic_symbols = {'c': 6, 'n': 7, 'o': 8, 'p': 15, 's': 16, 'b': 5,
+                           'se': 34, 'as': 33, 'te': 52}
+
+def _split_smarts_top_level(expr, separator):
+    # Split an atom expression, ignoring separators inside recursive SMARTS
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(expr):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(expr[start:i])
+            start = i + 1
+    parts.append(expr[start:])
+    return parts
+
+def _smarts_primitive_mask(part):
+    # Elements required by a single primitive of a bracket atom
+    if not part or part[0] == '!':
+        return 0
+    if part[0] == '$':
+        # Every atom of a recursive SMARTS has to be present as well
+        if part[1:2] == '(' and part[-1] == ')':
+            return smarts_element_mask(part[2:-1])
+        return 0
+    Z = 0
+    if part[0] == '#':
+        digits = ''
+        for char in part[1:]:
+            if not char.isdigit():
+                break
+            digits += char
+        if digits:
+            Z = int(digits)
+    elif part[:2] in smarts_aromatic_symbols:
+        Z = smarts_aromatic_symbols[part[:2]]
+    elif part[0] in smarts_aromatic_symbols:
+        Z = smarts_aromatic_symbols[part[0]]
+    elif part[0].isupper():
+        if part[:2] in periodic_table:
+            Z = periodic_table[part[:2]].number
+        elif part[0] in periodic_table:
+            Z = periodic_table[part[0]].number
+    # H is also the hydrogen count primitive, and hydrogens are
+    # usually implicit in the molecule anyway
+    return 1 << Z if Z > 1 else 0
+
+def _smarts_bracket_mask(expr):
+    # Elements required by every atom matching the bracket atom `expr`
+    mask = 0
+    for low_part in _split_smarts_top_level(expr, ';'):
+        common = None
+        for alternative in _split_smarts_top_level(low_part, ','):
+            alternative_mask = 0
+            for part in _split_smarts_top_level(alternative, '&'):
+                alternative_mask |= _smarts_primitive_mask(part)
+            # Of a list, only what every alternative requires is required
+            common = alternative_mask if common is None else common & alternative_mask
+        mask |= common
+    return mask
+
+def smarts_element_mask(smarts):
+    r'''Computes a bitmask of the elements which a molecule must contain
+    for the SMARTS pattern `smarts` to match it; bit `Z` is set for each
+    required atomic number `Z`. Only atoms which unambiguously specify an
+    element contribute, so the mask is conservative. A pattern can only match
+    a molecule if `(mol_mask & mask) == mask`.
+
+    Parameters
+    ----------
+    smarts : str
+        SMARTS pattern, [-]
+
+    Returns
+    -------
+    mask : int
+        Bitmask of the atomic numbers required, [-]
+
+    Notes
+    -----
+    The atoms of recursive SMARTS are required, as are elements common to
+    every alternative of a list; negated elements and hydrogen are not.
+    This does not need rdkit.
+
+    Examples
+    --------
+    >>> smarts_element_mask('[OX2H]-[C]=O') == (1 << 6) | (1 << 8)
+    True
+    >>> smarts_element_mask('[R;CX4H2]') == 1 << 6
+    True
+    >>> smarts_element_mask('[$([CX2H0](=*)=*)]') == 1 << 6
+    True
+    >>> smarts_element_mask('[C,N]')
+    0
+    '''
+    mask = 0
+    i, N = 0, len(smarts)
+    while i < N:
+        char = smarts[i]
+        if char == '[':
+            depth = 1
+            j = i + 1
+            while j < N and depth:
+                if smarts[j] == '[':
+                    depth += 1
+                elif smarts[j] == ']':
+                    depth -= 1
+                j += 1
+            mask |= _smarts_bracket_mask(smarts[i+1:j-1])
+            i = j
+        elif smarts[i:i+2] in ('Cl', 'Br'):
+            mask |= 1 << smarts_organic_subset[smarts[i:i+2]]
+            i += 2
+        else:
+            if char in smarts_organic_subset:
+                mask |= 1 << smarts_organic_subset[char]
+            i += 1
+    return mask
+
 def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
     r'''Fragments a molecule into a set of unique groups and counts as
     specified by the `catalog`, which is a list of objects containing
@@ -331,7 +454,8 @@ def run_match(catalog_by_priority, all_matches, ignore_matches, all_atom_idxs,
 
 
 
-def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
+def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True,
+                    element_masks=None):
     r'''Fragments a molecule into a set of unique groups and counts as
     specified by the `catalog`. The molecule can either be an rdkit
     molecule object, or a smiles string which will be parsed by rdkit.
@@ -346,6 +470,13 @@ def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
         Molecule as rdkit object, [-]
     smi : str, optional
         Smiles string representing a chemical, [-]
+    deduplicate : bool, optional
+        Whether or not to try to remove overlapping matches, [-]
+    element_masks : dict, optional
+        Dictionary indexed by the same keys as `catalog` of the elements each
+        pattern requires, as computed by :obj:`smarts_element_mask`; patterns
+        requiring an element the molecule does not have are not searched
+        for, [-]
 
     Returns
     -------
@@ -361,7 +492,11 @@ def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
     Notes
     -----
     Raises an exception if rdkit is not installed, or `smi` or `rdkitmol` is
-    not defined.
+    not defined. Patterns with more atoms than the molecule cannot match and
+    are not searched for. The catalog order is preserved, as the duplicate
+    cleanup depends on it; pass compiled patterns (such as from
+    :obj:`thermo.group_contribution.joback.load_joback_catalog`) to avoid
+    parsing the SMARTS strings on every call.
 
     Examples
     --------
@@ -396,13 +531,25 @@ def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
     status = 'OK'
     success = True
 
+    if element_masks is not None:
+        mol_mask = 0
+        for atom in rdkitmol.GetAtoms():
+            mol_mask |= 1 << atom.GetAtomicNum()
+
     counts = {}
     all_matches = {}
     for key, smart in catalog.items():
+        if element_masks is not None:
+            mask = element_masks[key]
+            if mol_mask & mask != mask:
+                continue
         if isinstance(smart, str):
             patt = Chem.MolFromSmarts(smart)
         else:
             patt = smart
+        if patt.GetNumAtoms() > atom_count:
+            # Each query atom needs a distinct atom in the molecule; skip the search
+            continue
         hits = list(rdkitmol.GetSubstructMatches(patt))
         if hits:
             all_matches[key] = hits
@@ -42,6 +42,8 @@ please use the `GitHub issue tracker <https://github.com/CalebBell/thermo/>`_.
 
 .. autodata:: J_BIGGS_JOBACK_SMARTS
 .. autodata:: J_BIGGS_JOBACK_SMARTS_id_dict
+.. autodata:: J_BIGGS_JOBACK_SMARTS_element_masks
+.. autofunction:: load_joback_catalog
 
 
 
@@ -49,11 +51,19 @@ please use the `GitHub issue tracker <https://github.com/CalebBell/thermo/>`_.
 
 
 __all__ = ['Joback', 'J_BIGGS_JOBACK_SMARTS',
-           'J_BIGGS_JOBACK_SMARTS_id_dict']
+           'J_BIGGS_JOBACK_SMARTS_id_dict', 'J_BIGGS_JOBACK_SMARTS_element_masks',
+           'load_joback_catalog']
 
-from fluids.numerics import exp, horner
+from fluids.numerics import exp
+from fluids.numerics import numpy as np
 
-from thermo.group_contribution.group_contribution_base import smarts_fragment
+from thermo.group_contribution.group_contribution_base import smarts_element_mask, smarts_fragment
+
+try:
+    ndarray, npexp = np.ndarray, np.exp
+except:
+    # No NumPy; no temperature can be an array
+    ndarray = None
 
 rdkit_missing = 'RDKit is not installed; it is required to use this functionality'
 
@@ -129,6 +139,43 @@ second is the group symbol; and the third is the SMARTS matching string.
 
 J_BIGGS_JOBACK_SMARTS_id_dict = {i+1: j[2] for i, j in enumerate(J_BIGGS_JOBACK_SMARTS)}
 J_BIGGS_JOBACK_SMARTS_str_dict = {i[1]: i[2] for i in J_BIGGS_JOBACK_SMARTS}
+J_BIGGS_JOBACK_SMARTS_element_masks = {i: smarts_element_mask(s) for i, s in J_BIGGS_JOBACK_SMARTS_id_dict.items()}
+"""Elements required by each Joback group, keyed by the group ids of
+:obj:`J_BIGGS_JOBACK_SMARTS_id_dict`. Each value is a bitmask from
+:obj:`thermo.group_contribution.group_contribution_base.smarts_element_mask`;
+a group is only searched for in molecules containing all of its elements.
+"""
+
+J_BIGGS_JOBACK_SMARTS_rdkit_dict = None
+def load_joback_catalog():
+    '''Returns :obj:`J_BIGGS_JOBACK_SMARTS_id_dict` with the SMARTS strings
+    compiled into rdkit query molecules. The patterns are only compiled the
+    first time this is called; later calls return the same dictionary.
+
+    Returns
+    -------
+    catalog : dict[int, rdkit.Chem.rdchem.Mol]
+        Compiled Joback group patterns, keyed by the group ids of
+        :obj:`J_BIGGS_JOBACK_SMARTS_id_dict`, [-]
+
+    Notes
+    -----
+    The dictionary is shared by every caller and must not be modified. When
+    fragmenting many molecules in a process pool, this function can be used
+    as the worker initializer so that each worker compiles the patterns once.
+
+    Examples
+    --------
+    >>> catalog = load_joback_catalog() # doctest:+SKIP
+    >>> catalog is load_joback_catalog() # doctest:+SKIP
+    True
+    '''
+    global J_BIGGS_JOBACK_SMARTS_rdkit_dict
+    if J_BIGGS_JOBACK_SMARTS_rdkit_dict is None:
+        if not loaded_rdkit:
+            load_rdkit_modules()
+        J_BIGGS_JOBACK_SMARTS_rdkit_dict = {i: Chem.MolFromSmarts(s) for i, s in J_BIGGS_JOBACK_SMARTS_id_dict.items()}
+    return J_BIGGS_JOBACK_SMARTS_rdkit_dict
 
 # Shi Chenyang's JRGUI code indicates he left the following list of smarts in
 # favor of those above by J Biggs
@@ -419,7 +466,8 @@ class Joback:
         else:
             self.MW = MW
 
-        self.counts, self.success, self.status = smarts_fragment(J_BIGGS_JOBACK_SMARTS_id_dict, rdkitmol=self.rdkitmol)
+        self.counts, self.success, self.status = smarts_fragment(load_joback_catalog(), rdkitmol=self.rdkitmol,
+                                                                 element_masks=J_BIGGS_JOBACK_SMARTS_element_masks)
 
         if Tb is None:
             self.Tb_estimated = self.Tb(self.counts)
@@ -939,12 +987,12 @@ class Joback:
 
         Parameters
         ----------
-        T : float
+        T : float or ndarray
             Temperature, [K]
 
         Returns
         -------
-        Cpig : float
+        Cpig : float or ndarray
             Ideal-gas heat capacity, [J/mol/K]
 
         Examples
@@ -956,8 +1004,8 @@ class Joback:
         try:
             if self.calculated_Cpig_coeffs is None:
                 self.calculated_Cpig_coeffs = Joback.Cpig_coeffs(self.counts)
-            coeffs = list(reversed(self.calculated_Cpig_coeffs))
-            return horner(coeffs, T)
+            a, b, c, d = self.calculated_Cpig_coeffs
+            return a + T*(b + T*(c + T*d))
         except:
             return None
 
@@ -972,12 +1020,12 @@ class Joback:
 
         Parameters
         ----------
-        T : float
+        T : float or ndarray
             Temperature, [K]
 
         Returns
         -------
-        mul : float
+        mul : float or ndarray
             Liquid viscosity, [Pa*s]
 
         Examples
@@ -990,6 +1038,11 @@ class Joback:
             if self.calculated_mul_coeffs is None:
                 self.calculated_mul_coeffs = Joback.mul_coeffs(self.counts)
             a, b = self.calculated_mul_coeffs
+        except:
+            return None
+        if type(T) is ndarray:
+            return self.MW*npexp(a/T + b)
+        try:
             return self.MW*exp(a/T + b)
         except:
             return None
@@ -119,9 +119,11 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
     for mod in new_mods:
         mod.__dict__.update(__funcs)
 
-    to_change = ['eos.volume_solutions_halley',
+    to_change = ['eos.volume_solutions_halley', 'eos.PR_pure_TP_volumes',
 
-                 'eos_mix_methods.a_alpha_quadratic_terms',
+                 'eos_mix_methods.a_alpha_roots_and_root_invs',
+                 'eos_mix_methods.a_alpha_quadratic_terms_parallel',
+                 'eos_mix_methods.a_alpha_quadratic', 'eos_mix_methods.a_alpha_quadratic_terms',
 
                  'eos_mix_methods.a_alpha_and_derivatives_quadratic_terms',
                  'eos_mix_methods.a_alpha_aijs_composition_independent',
@@ -1614,7 +1614,7 @@ class TDependentProperty:
         try:
             self.all_methods_P = set(self.all_methods_P)
             self.tabular_data_interpolators_P = {}
-            self.TP_cached = None
+            self.TP_cached = {}
         except:
             pass
         self.T_limits = {k: tuple(v) for k, v in self.T_limits.items()}
@@ -2323,6 +2323,9 @@ class TDependentProperty:
             raise ValueError(f"Method '{method}' is not available for this chemical; "
                              f"available methods are {self.all_methods}")
         self.T_cached = None
+        if self.P_dependent:
+            # The low-pressure method is used by NEGLECT_P and when P is None
+            self.TP_cached = {}
         self._method = method
 
     def valid_methods(self, T=None):
@@ -20,7 +20,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
-from fluids.numerics import derivative, linspace
+from fluids.numerics import derivative, interp2d_linear, linspace
 from fluids.numerics import numpy as np
 
 from thermo.utils.functional import has_matplotlib
@@ -81,6 +81,10 @@ class TPDependentProperty(TDependentProperty):
     P_dependent = True
     interpolation_P = None
 
+    TP_cached_max = 128
+    """Maximum number of (T, P) points whose results are kept by
+    :obj:`__call__`."""
+
     P_correlation_models = {
         'Tait': {'custom': True},
     }
@@ -88,6 +92,7 @@ class TPDependentProperty(TDependentProperty):
 
     P_correlation_parameters = {k: k + '_parameters' for k in P_correlation_models.keys()}
     P_correlation_keys_to_parameters = {v: k for k, v in P_correlation_parameters.items()}
+    P_correlation_keys_to_parameters_items = tuple(P_correlation_keys_to_parameters.items())
 
     def __init__(self, extrapolation, **kwargs):
         self.tabular_data_P = {}
@@ -96,8 +101,10 @@ class TPDependentProperty(TDependentProperty):
 
         self.tabular_data_interpolators_P = {}
         """tabular_data_interpolators_P, dict: Stored (extrapolator,
-        spline) tuples which are interp2d instances for each set of tabular
-        data; indexed by tuple of (name, interpolation_T, interpolation_P,
+        spline) tuples for each set of tabular data, where extrapolator is the
+        transformed and sorted (Ts, Ps, properties) grid used for linear
+        interpolation and spline is a `RectBivariateSpline` (or None);
+        indexed by tuple of (name, interpolation_T, interpolation_P,
         interpolation_property, interpolation_property_inv) to ensure that
         if an interpolation transform is altered, the old interpolator which
         had been created is no longer used."""
@@ -110,12 +117,12 @@ class TPDependentProperty(TDependentProperty):
         """Pressure limits on a per-component basis. Not currently used."""
 
         if kwargs:
-            P_correlation_keys_to_parameters = self.P_correlation_keys_to_parameters
-            # Iterate over all the dictionaries in reverse such that the first one is left as the default
-            for key in reversed(list(kwargs.keys())):
-                if key in P_correlation_keys_to_parameters:
+            # There are far fewer pressure correlation models than keyword
+            # arguments, so look each model up rather than scanning kwargs;
+            # iterate in reverse such that the first one is left as the default
+            for key, P_correlation_name in reversed(self.P_correlation_keys_to_parameters_items):
+                if key in kwargs:
                     P_correlation_dict = kwargs.pop(key)
-                    P_correlation_name = P_correlation_keys_to_parameters[key]
                     # Probably need to reverse this too
                     for corr_i, corr_kwargs in P_correlation_dict.items():
                         self.add_P_correlation(name=corr_i, model=P_correlation_name,
@@ -178,14 +185,15 @@ class TPDependentProperty(TDependentProperty):
     def method_P(self, method_P):
         if method_P not in self.all_methods_P and method_P is not None:
             raise ValueError("The given methods is not available for this chemical")
-        self.TP_cached = None
+        self.TP_cached = {}
         self._method_P = method_P
 
     def __call__(self, T, P):
         r'''Convenience method to calculate the property; calls
-        :obj:`TP_dependent_property <thermo.utils.TPDependentProperty.TP_dependent_property>`. Caches previously calculated value,
-        which is an overhead when calculating many different values of
-        a property. See :obj:`TP_dependent_property <thermo.utils.TPDependentProperty.TP_dependent_property>` for more details as to the
+        :obj:`TP_dependent_property <thermo.utils.TPDependentProperty.TP_dependent_property>`. Caches up to
+        :obj:`TP_cached_max` previously calculated values, which is an overhead
+        when calculating many different values of a property; the cache is
+        reset whenever the method is changed. See :obj:`TP_dependent_property <thermo.utils.TPDependentProperty.TP_dependent_property>` for more details as to the
         calculation procedure.
 
         Parameters
@@ -200,15 +208,18 @@ class TPDependentProperty(TDependentProperty):
         prop : float
             Calculated property, [`units`]
         '''
-        if (T, P) == self.TP_cached:
-            return self.prop_cached
+        cache = self.TP_cached
+        key = (T, P)
+        if key in cache:
+            return cache[key]
+        if P is not None:
+            prop = self.TP_dependent_property(T, P)
         else:
-            if P is not None:
-                self.prop_cached = self.TP_dependent_property(T, P)
-            else:
-                self.prop_cached = self.T_dependent_property(T)
-            self.TP_cached = (T, P)
-            return self.prop_cached
+            prop = self.T_dependent_property(T)
+        if len(cache) >= self.TP_cached_max:
+            cache.clear()
+        cache[key] = prop
+        return prop
 
     def valid_methods_P(self, T=None, P=None):
         r'''Method to obtain a sorted list of high-pressure methods that have
@@ -367,9 +378,14 @@ class TPDependentProperty(TDependentProperty):
         '''
         # Ts must be in increasing order.
         if check_properties:
-            for p in np.array(properties).ravel():
-                if not self.test_property_validity(p):
-                    raise ValueError('One of the properties specified are not feasible')
+            props = np.asarray(properties)
+            if props.dtype.kind in 'iuf':
+                # Same bounds as test_property_validity, checked all at once
+                valid = not ((props < self.property_min).any() or (props > self.property_max).any())
+            else:
+                valid = all(self.test_property_validity(p) for p in props.ravel())
+            if not valid:
+                raise ValueError('One of the properties specified are not feasible')
         if not all(b > a for a, b in zip(Ts, Ts[1:])):
             raise ValueError('Temperatures are not sorted in increasing order')
         if not all(b > a for a, b in zip(Ps, Ps[1:])):
@@ -401,14 +417,16 @@ class TPDependentProperty(TDependentProperty):
         validity : bool
             Whether or not a specifid method is valid
         '''
-        if method in self.tabular_data_P:
+        # NEGLECT_P is the most common method and is checked first
+        if method == NEGLECT_P:
+            return self.test_method_validity(T, self._method) if self._method else False
+        tabular_data_P = self.tabular_data_P
+        if method in tabular_data_P:
             if self.tabular_extrapolation_permitted:
                 validity = True
             else:
-                Ts, Ps, properties = self.tabular_data_P[method]
+                Ts, Ps, _ = tabular_data_P[method]
                 validity = Ts[0] < T < Ts[-1] and Ps[0] < P < Ps[-1]
-        elif method == NEGLECT_P:
-            return self.test_method_validity(T, self._method) if self._method else False
         elif method in self.all_methods_P:
             Tmin, Tmax = self.T_limits[method]
             validity = Tmin < T < Tmax
@@ -422,14 +440,16 @@ class TPDependentProperty(TDependentProperty):
         interpolators the first time it is used on a property set, and store
         them for quick future use.
 
-        Interpolation is cubic-spline based if 5 or more points are available,
-        and linearly interpolated if not. Extrapolation is always performed
-        linearly. This function uses the transforms :obj:`interpolation_T`,
-        :obj:`interpolation_P`,
+        Interpolation is cubic-spline based if 5 or more temperatures and 5 or
+        more pressures are available, and linearly interpolated if not.
+        Extrapolation is always performed linearly. This function uses the
+        transforms :obj:`interpolation_T`, :obj:`interpolation_P`,
         :obj:`interpolation_property`, and :obj:`interpolation_property_inv` if set. If
         any of these are changed after the interpolators were first created,
         new interpolators are created with the new transforms.
-        All interpolation is performed via the `interp2d` function.
+        The splines are SciPy `RectBivariateSpline` instances; linear
+        interpolation and extrapolation is performed on the stored grid with
+        :obj:`fluids.numerics.interp2d_linear`.
 
         Parameters
         ----------
@@ -445,7 +465,9 @@ class TPDependentProperty(TDependentProperty):
         prop : float
             Calculated property, [`units`]
         '''
-        key = (name, self.interpolation_T, id(self.interpolation_P), id(self.interpolation_property), id(self.interpolation_property_inv))
+        interpolation_T, interpolation_P = self.interpolation_T, self.interpolation_P
+        interpolation_property = self.interpolation_property
+        key = (name, interpolation_T, id(interpolation_P), id(interpolation_property), id(self.interpolation_property_inv))
         Ts, Ps, properties = self.tabular_data_P[name]
         if not self.tabular_extrapolation_permitted:
             if T < Ts[0] or T > Ts[-1] or P < Ps[0] or P > Ps[-1]:
@@ -455,17 +477,17 @@ class TPDependentProperty(TDependentProperty):
         if key in self.tabular_data_interpolators_P:
             extrapolator, spline = self.tabular_data_interpolators_P[key]
         else:
-            from scipy.interpolate import RectBivariateSpline, RegularGridInterpolator
-            if self.interpolation_T:  # Transform ths Ts with interpolation_T if set
-                Ts2 = [self.interpolation_T(T2) for T2 in Ts]
+            from scipy.interpolate import RectBivariateSpline
+            if interpolation_T:  # Transform ths Ts with interpolation_T if set
+                Ts2 = [interpolation_T(T2) for T2 in Ts]
             else:
                 Ts2 = Ts
-            if self.interpolation_P:  # Transform ths Ts with interpolation_T if set
-                Ps2 = [self.interpolation_P(P2) for P2 in Ps]
+            if interpolation_P:  # Transform ths Ts with interpolation_T if set
+                Ps2 = [interpolation_P(P2) for P2 in Ps]
             else:
                 Ps2 = Ps
-            if self.interpolation_property:  # Transform ths props with interpolation_property if set
-                properties2 = [[self.interpolation_property(p) for p in r] for r in properties]
+            if interpolation_property:  # Transform ths props with interpolation_property if set
+                properties2 = [[interpolation_property(p) for p in r] for r in properties]
             else:
                 properties2 = properties
 
@@ -483,32 +505,31 @@ class TPDependentProperty(TDependentProperty):
 
 
 
-            # Only allow linear extrapolation, but with whatever transforms are specified
-            # extrapolator = RectBivariateSpline(Ts2_sorted, Ps2_sorted, properties2_sorted.T, kx=1, ky=1, s=0)  # interpolation if fill value is missing
-            extrapolator = RegularGridInterpolator((Ts2_sorted, Ps2_sorted), properties2_sorted.T, method='linear', fill_value=None, bounds_error=False)  # interpolation if fill value is missing
-            # If more than 5 property points, create a spline interpolation
-            if len(properties) >= 5:
+            # Only allow linear extrapolation, but with whatever transforms are specified.
+            # The grid is stored as lists for `interp2d_linear`, which gives the same
+            # bilinear interpolation and extrapolation as a `RegularGridInterpolator`
+            # with fill_value=None without its per-call overhead
+            extrapolator = (Ts2_sorted.tolist(), Ps2_sorted.tolist(), properties2_sorted.tolist())
+            # If at least 5 points in each direction, create a spline interpolation
+            if len(Ts2_sorted) >= 5 and len(Ps2_sorted) >= 5:
                 spline = RectBivariateSpline(Ts2_sorted, Ps2_sorted, properties2_sorted.T, kx=3, ky=3, s=0)
             else:
                 spline = None
             self.tabular_data_interpolators_P[key] = (extrapolator, spline)
 
-        # Load the stores values, tor checking which interpolation strategy to
-        # use.
-        Ts, Ps, properties = self.tabular_data_P[name]
+        # Check which interpolation strategy to use with the untransformed values
+        use_spline = not (T < Ts[0] or T > Ts[-1] or spline is None or P < Ps[0] or P > Ps[-1])
 
-        if T < Ts[0] or T > Ts[-1] or spline is None or P < Ps[0] or P > Ps[-1]:
-            tool = extrapolator
+        if interpolation_T:
+            T = interpolation_T(T)
+        if interpolation_P:
+            P = interpolation_P(P)
+        if use_spline:
+            prop = spline.ev(T, P)
         else:
-            tool = spline
+            prop = interp2d_linear(T, P, *extrapolator)
 
-        if self.interpolation_T:
-            T = self.interpolation_T(T)
-        if self.interpolation_P:
-            P = self.interpolation_P(P)
-        prop = tool([T, P])[0] # either spline, or linear interpolation
-
-        if self.interpolation_property:
+        if interpolation_property:
             prop = self.interpolation_property_inv(prop)
 
         return float(prop)
@@ -575,7 +596,7 @@ class TPDependentProperty(TDependentProperty):
                             if self.test_property_validity(p):
                                 properties.append(p)
                                 Ps2.append(P)
-                        except:
+                        except Exception:
                             pass
                 plt.plot(Ps2, properties, label=method_P)
             else:
@@ -656,7 +677,7 @@ class TPDependentProperty(TDependentProperty):
                             if self.test_property_validity(p):
                                 properties.append(p)
                                 Ts2.append(T)
-                        except:
+                        except Exception:
                             pass
                 plt.plot(Ts2, properties, label=method_P)
             else:
@@ -664,8 +685,7 @@ class TPDependentProperty(TDependentProperty):
                 for T in Ts:
                     if P_changes:
                         P = P_func(T)
-                properties.append(self.calculate_P(T, P, method_P))
-
+                    properties.append(self.calculate_P(T, P, method_P))
                 plt.plot(Ts, properties, label=method_P)
         plt.legend(loc='best')
         plt.ylabel(self.name + ', ' + self.units)
@@ -741,34 +761,35 @@ class TPDependentProperty(TDependentProperty):
             methods_P = self.all_methods_P
         Ps = np.linspace(Pmin, Pmax, pts)
         Ts = np.linspace(Tmin, Tmax, pts)
-        Ts_mesh, Ps_mesh = np.meshgrid(Ts, Ps)
+        # Views of the axes; no pts x pts copies are made
+        Ts_mesh, Ps_mesh = np.broadcast_arrays(Ts[np.newaxis, :], Ps[:, np.newaxis])
         fig = plt.figure()
         ax = fig.add_subplot(1,1,1,projection="3d")
 
+        calculate_P = self.calculate_P
+        test_method_validity_P = self.test_method_validity_P
+        test_property_validity = self.test_property_validity
         handles = []
+        # C-ordered buffer reused for every method; rows are pressures, columns
+        # temperatures. plot_surface copies the values into its polygons.
+        properties = np.empty(Ts_mesh.shape, dtype=np.float64)
         for method_P in methods_P:
-            if only_valid:
-                properties = []
-                for T in Ts:
-                    T_props = []
-                    for P in Ps:
-                        if self.test_method_validity_P(T, P, method_P):
+            properties.fill(np.nan)
+            for j, P in enumerate(Ps):
+                row = properties[j]
+                for i, T in enumerate(Ts):
+                    if only_valid:
+                        if test_method_validity_P(T, P, method_P):
                             try:
-                                p = self.calculate_P(T, P, method_P)
-                                if self.test_property_validity(p):
-                                    T_props.append(p)
-                                else:
-                                    T_props.append(None)
-                            except:
-                                T_props.append(None)
-                        else:
-                            T_props.append(None)
-                    properties.append(T_props)
-                properties = ma.masked_invalid(np.array(properties, dtype=np.float64).T)
-                handles.append(ax.plot_surface(Ts_mesh, Ps_mesh, properties, cstride=1, rstride=1, alpha=0.5))
-            else:
-                properties = np.array([[self.calculate_P(T, P, method_P) for T in Ts] for P in Ps])
-                handles.append(ax.plot_surface(Ts_mesh, Ps_mesh, properties, cstride=1, rstride=1, alpha=0.5))
+                                p = calculate_P(T, P, method_P)
+                            except Exception:
+                                continue
+                            if test_property_validity(p):
+                                row[i] = p
+                    else:
+                        row[i] = calculate_P(T, P, method_P)
+            Zs = ma.masked_invalid(properties, copy=False) if only_valid else properties
+            handles.append(ax.plot_surface(Ts_mesh, Ps_mesh, Zs, cstride=1, rstride=1, alpha=0.5))
 
         ax.yaxis.set_major_formatter(FormatStrFormatter('%.4g'))
         ax.zaxis.set_major_formatter(FormatStrFormatter('%.4g'))
@@ -809,6 +830,10 @@ class TPDependentProperty(TDependentProperty):
             Calculated derivative property at constant pressure,
             [`units/K^order`]
         '''
+        if order == 1:
+            # Same 3-point central difference as `derivative`, without its overhead
+            calculate_P = self.calculate_P
+            return (0.5*calculate_P(T + 1e-6, P, method) - 0.5*calculate_P(T - 1e-6, P, method))*1e6
         return derivative(self.calculate_P, T, dx=1e-6, args=[P, method], n=order, order=1+order*2)
 
     def calculate_derivative_P(self, P, T, method, order=1):
@@ -841,7 +866,11 @@ class TPDependentProperty(TDependentProperty):
             Calculated derivative property at constant temperature,
             [`units/Pa^order`]
         '''
-        f = lambda P: self.calculate_P(T, P, method)
+        calculate_P = self.calculate_P
+        if order == 1:
+            # Same 3-point central difference as `derivative`, without its overhead
+            return (0.5*calculate_P(T, P + 1e-2, method) - 0.5*calculate_P(T, P - 1e-2, method))*100.0
+        f = lambda P: calculate_P(T, P, method)
         return derivative(f, P, dx=1e-2, n=order, order=1+order*2)
 
     def TP_dependent_property_derivative_T(self, T, P, order=1):
@@ -869,11 +898,13 @@ class TPDependentProperty(TDependentProperty):
         dprop_dT_P : float
             Calculated derivative property, [`units/K^order`]
         '''
+        method_P = self._method_P
+        if method_P is None:
+            return None
         try:
-            return self.calculate_derivative_T(T, P, self._method_P, order)
-        except:
-            pass
-        return None
+            return self.calculate_derivative_T(T, P, method_P, order)
+        except Exception:
+            return None
 
     def TP_dependent_property_derivative_P(self, T, P, order=1):
         r'''Method to calculate a derivative of a temperature and pressure
@@ -900,9 +931,11 @@ class TPDependentProperty(TDependentProperty):
         dprop_dP_T : float
             Calculated derivative property, [`units/Pa^order`]
         '''
+        method_P = self._method_P
+        if method_P is None:
+            return None
         try:
-            return self.calculate_derivative_P(P, T, self._method_P, order)
-        except:
-            pass
-        return None
+            return self.calculate_derivative_P(P, T, method_P, order)
+        except Exception:
+            return None
 
@@ -57,6 +57,8 @@ from thermo.activity import GibbsExcess, d2interaction_exp_dT2, d3interaction_ex
 
 try:
     array, zeros, npsum, nplog, ones = np.array, np.zeros, np.sum, np.log, np.ones
+    npexp, ascontiguousarray, dot = np.exp, np.ascontiguousarray, np.dot
+    npempty_like, npmultiply = np.empty_like, np.multiply
 except (ImportError, AttributeError):
     pass
 
@@ -97,24 +99,17 @@ def wilson_d2GE_dT2(xs, T, N, xj_Lambda_ijs_inv, xj_dLambda_dTijs, xj_d2Lambda_d
 
 def wilson_d3GE_dT3(xs, T, N, xj_Lambda_ijs_inv, xj_dLambda_dTijs, xj_d2Lambda_dT2ijs, xj_d3Lambda_dT3ijs):
     #Term is directly from the one above it
-    sum0 = 0.0
+    # All four sums are accumulated in one pass over the components
+    sum0 = sum_d3 = sum_comb = sum_last = 0.0
     for i in range(N):
-        sum0 += xj_Lambda_ijs_inv[i]*xs[i]*(xj_d2Lambda_dT2ijs[i]
-                - xj_dLambda_dTijs[i]*xj_dLambda_dTijs[i]*xj_Lambda_ijs_inv[i])
-
-    sum_d3 = 0.0
-    for i in range(N):
-        sum_d3 += xs[i]*xj_d3Lambda_dT3ijs[i]*xj_Lambda_ijs_inv[i]
-
-    sum_comb = 0.0
-    for i in range(N):
-        sum_comb += xs[i]*xj_d2Lambda_dT2ijs[i]*xj_dLambda_dTijs[i]*xj_Lambda_ijs_inv[i]*xj_Lambda_ijs_inv[i]
+        x, inv = xs[i], xj_Lambda_ijs_inv[i]
+        d1, d2 = xj_dLambda_dTijs[i], xj_d2Lambda_dT2ijs[i]
+        sum0 += inv*x*(d2 - d1*d1*inv)
+        sum_d3 += x*xj_d3Lambda_dT3ijs[i]*inv
+        sum_comb += x*d2*d1*inv*inv
+        v = d1*inv
+        sum_last += x*v*v*v
     sum_comb *= 3.0
-
-    sum_last = 0.0
-    for i in range(N):
-        v = xj_dLambda_dTijs[i]*xj_Lambda_ijs_inv[i]
-        sum_last += xs[i]*v*v*v
     sum_last *= 2.0
 
     d3GE_dT3 = -R*(3.0*sum0 + T*(sum_d3 - sum_comb + sum_last))
@@ -125,12 +120,17 @@ def wilson_d2GE_dTdxs(xs, T, N, log_xj_Lambda_ijs, lambdas, dlambdas_dT,
     if d2GE_dTdxs is None:
         d2GE_dTdxs = [0.0]*N
 
+    xs_invs = [0.0]*N # numba: delete
+#    xs_invs = zeros(N) # numba: uncomment
+    for j in range(N):
+        xs_invs[j] = xs[j]*xj_Lambda_ijs_inv[j]
+
     for i in range(N):
         tot1 = xj_dLambda_dTijs[i]*xj_Lambda_ijs_inv[i]
         tot2 = 0.0
         for j in range(N):
             t1 = lambdas[j][i]*xj_Lambda_ijs_inv[j]
-            tot1 += xs[j]*xj_Lambda_ijs_inv[j]*(dlambdas_dT[j][i] - xj_dLambda_dTijs[j]*t1)
+            tot1 += xs_invs[j]*(dlambdas_dT[j][i] - xj_dLambda_dTijs[j]*t1)
             tot2 += xs[j]*t1
 
         dG = -R*(T*tot1 + log_xj_Lambda_ijs[i] + tot2)
@@ -143,10 +143,14 @@ def wilson_dGE_dxs(xs, T, N, log_xj_Lambda_ijs, lambdas, xj_Lambda_ijs_inv, dGE_
     if dGE_dxs is None:
         dGE_dxs = [0.0]*N
     mRT = -T*R
+    xs_invs = [0.0]*N # numba: delete
+#    xs_invs = zeros(N) # numba: uncomment
+    for i in range(N):
+        xs_invs[i] = xs[i]*xj_Lambda_ijs_inv[i]
     for k in range(N):
         tot = log_xj_Lambda_ijs[k]
         for i in range(N):
-            tot += xs[i]*lambdas[i][k]*xj_Lambda_ijs_inv[i]
+            tot += xs_invs[i]*lambdas[i][k]
         dGE_dxs[k] = mRT*tot
     return dGE_dxs
 
@@ -156,12 +160,16 @@ def wilson_d2GE_dxixjs(xs, T, N, lambdas, xj_Lambda_ijs_inv, d2GE_dxixjs=None):
 #        d2GE_dxixjs = zeros((N, N)) # numba: uncomment
 
     RT = R*T
+    xs_inv2s = [0.0]*N # numba: delete
+#    xs_inv2s = zeros(N) # numba: uncomment
+    for i in range(N):
+        xs_inv2s[i] = xs[i]*(xj_Lambda_ijs_inv[i]*xj_Lambda_ijs_inv[i])
     for k in range(N):
         dG_row = d2GE_dxixjs[k]
         for m in range(N):
             tot = 0.0
             for i in range(N):
-                tot += xs[i]*lambdas[i][k]*lambdas[i][m]*(xj_Lambda_ijs_inv[i]*xj_Lambda_ijs_inv[i])
+                tot += xs_inv2s[i]*lambdas[i][k]*lambdas[i][m]
             tot -= lambdas[k][m]*xj_Lambda_ijs_inv[k]
             tot -= lambdas[m][k]*xj_Lambda_ijs_inv[m]
             dG_row[m] = RT*tot
@@ -174,22 +182,33 @@ def wilson_d3GE_dxixjxks(xs, T, N, lambdas, xj_Lambda_ijs_inv, d3GE_dxixjxks=Non
 #        d3GE_dxixjxks = zeros((N, N, N)) # numba: uncomment
 
     nRT = -R*T
+    inv2s = [0.0]*N # numba: delete
+#    inv2s = zeros(N) # numba: uncomment
+    xs_inv3s2 = [0.0]*N # numba: delete
+#    xs_inv3s2 = zeros(N) # numba: uncomment
+    for i in range(N):
+        inv2s[i] = xj_Lambda_ijs_inv[i]*xj_Lambda_ijs_inv[i]
+        xs_inv3s2[i] = 2.0*xs[i]*inv2s[i]*xj_Lambda_ijs_inv[i]
+
+    # The tensor is symmetric in (k, m, n); compute k <= m <= n and mirror it
     for k in range(N):
-        dG_matrix = d3GE_dxixjxks[k]
-        for m in range(N):
-            dG_row = dG_matrix[m]
-            for n in range(N):
+        for m in range(k, N):
+            for n in range(m, N):
                 tot = 0.0
                 for i in range(N):
-                    num = xs[i]*lambdas[i][k]*lambdas[i][m]*lambdas[i][n]
-                    den = xj_Lambda_ijs_inv[i]*xj_Lambda_ijs_inv[i]*xj_Lambda_ijs_inv[i]
-                    tot += num*den
-                tot *= 2.0
-
-                tot -= lambdas[k][m]*lambdas[k][n]*xj_Lambda_ijs_inv[k]*xj_Lambda_ijs_inv[k]
-                tot -= lambdas[m][k]*lambdas[m][n]*xj_Lambda_ijs_inv[m]*xj_Lambda_ijs_inv[m]
-                tot -= lambdas[n][m]*lambdas[n][k]*xj_Lambda_ijs_inv[n]*xj_Lambda_ijs_inv[n]
-                dG_row[n] = nRT*tot
+                    lambdasi = lambdas[i]
+                    tot += xs_inv3s2[i]*lambdasi[k]*lambdasi[m]*lambdasi[n]
+
+                tot -= lambdas[k][m]*lambdas[k][n]*inv2s[k]
+                tot -= lambdas[m][k]*lambdas[m][n]*inv2s[m]
+                tot -= lambdas[n][m]*lambdas[n][k]*inv2s[n]
+                tot *= nRT
+                d3GE_dxixjxks[k][m][n] = tot
+                d3GE_dxixjxks[k][n][m] = tot
+                d3GE_dxixjxks[m][k][n] = tot
+                d3GE_dxixjxks[m][n][k] = tot
+                d3GE_dxixjxks[n][k][m] = tot
+                d3GE_dxixjxks[n][m][k] = tot
 
     return d3GE_dxixjxks
 
@@ -581,7 +600,7 @@ class Wilson(GibbsExcess):
                         'lambda_ds', 'lambda_es', 'lambda_fs')
     _cached_calculated_attributes = ('_d3GE_dxixjxks', '_xj_dLambda_dTijs', '_xj_Lambda_ijs', '_log_xj_Lambda_ijs',
                                      '_dlambdas_dT', '_lambdas', '_d3GE_dT3', '_xj_d2Lambda_dT2ijs', '_xj_Lambda_ijs_inv',
-                                     '_d2lambdas_dT2', '_d3lambdas_dT3', '_xj_d3Lambda_dT3ijs')
+                                     '_d2lambdas_dT2', '_d3lambdas_dT3', '_xj_d3Lambda_dT3ijs', '_dlnlambdas_dT')
 
     __slots__ = GibbsExcess.__slots__ + _model_attributes + _cached_calculated_attributes + ('lambda_coeffs_nonzero',)
     recalculable_attributes = _cached_calculated_attributes + GibbsExcess.recalculable_attributes
@@ -720,7 +739,6 @@ class Wilson(GibbsExcess):
             `f` parameters in :obj:`Wilson` form, [1/K^2]
         '''
         N = len(Vs)
-        cmps = range(N)
         if ais is None:
             ais = [[0.0]*N for _ in range(N)]
         if bis is None:
@@ -734,9 +752,9 @@ class Wilson(GibbsExcess):
         if fis is None:
             fis = [[0.0]*N for _ in range(N)]
         a_mat, b_mat, c_mat, d_mat, e_mat, f_mat = [], [], [], [], [], []
-        for i in cmps:
+        for i in range(N):
             a_row, b_row, c_row, d_row, e_row, f_row = [], [], [], [], [], []
-            for j in cmps:
+            for j in range(N):
                 a, b, c, d, e, f = Wilson.from_DDBST(Vs[i], Vs[j], ais[i][j],
                                               bis[i][j], cis[i][j], dis[i][j],
                                               eis[i][j], fis[i][j],
@@ -823,6 +841,14 @@ class Wilson(GibbsExcess):
                 self.lambda_fs = zero_coeffs
             else:
                 self.lambda_fs = ABCDEF[5]
+            if vectorized:
+                # Coefficients are combined with array arithmetic in `lambdas`
+                self.lambda_as = ascontiguousarray(self.lambda_as, dtype=float)
+                self.lambda_bs = ascontiguousarray(self.lambda_bs, dtype=float)
+                self.lambda_cs = ascontiguousarray(self.lambda_cs, dtype=float)
+                self.lambda_ds = ascontiguousarray(self.lambda_ds, dtype=float)
+                self.lambda_es = ascontiguousarray(self.lambda_es, dtype=float)
+                self.lambda_fs = ascontiguousarray(self.lambda_fs, dtype=float)
 
         # Make an array of values identifying what coefficients are zero.
         # This may be useful for performance optimization in the future but is
@@ -898,6 +924,11 @@ class Wilson(GibbsExcess):
             except AttributeError:
                 pass
 
+            try:
+                new._dlnlambdas_dT = self._dlnlambdas_dT
+            except AttributeError:
+                pass
+
             try:
                 new._d2lambdas_dT2 = self._d2lambdas_dT2
             except AttributeError:
@@ -931,15 +962,31 @@ class Wilson(GibbsExcess):
         except AttributeError:
             pass
 
-        N = self.N
         if self.vectorized:
-            lambdas = zeros((N, N))
+            # One array expression; the terms with all-zero coefficients are skipped
+            T = self.T
+            Tinv = 1.0/T
+            A, B, C, D, E, F = self.lambda_coeffs_nonzero
+            # Assembled in place with one scratch buffer; exp writes over the argument
+            arg = self.lambda_as.copy() if A else zeros((self.N, self.N))
+            work = npempty_like(arg)
+            for nonzero, coeffs, factor in ((B, self.lambda_bs, Tinv), (C, self.lambda_cs, log(T)),
+                                            (D, self.lambda_ds, T), (E, self.lambda_es, Tinv*Tinv),
+                                            (F, self.lambda_fs, T*T)):
+                if nonzero:
+                    arg += npmultiply(coeffs, factor, out=work)
+            lambdas = npexp(arg, out=arg)
+        elif not any(self.lambda_coeffs_nonzero[2:]):
+            # Common two-parameter form, exp(a_ij + b_ij/T)
+            Tinv = 1.0/self.T
+            lambdas = [[exp(a + b*Tinv) for a, b in zip(As, Bs)]
+                       for As, Bs in zip(self.lambda_as, self.lambda_bs)]
         else:
-            lambdas = [[0.0]*N for _ in range(N)]
-
-        lambdas = interaction_exp(self.T, N, self.lambda_as, self.lambda_bs,
-                                  self.lambda_cs, self.lambda_ds,
-                                  self.lambda_es, self.lambda_fs, lambdas)
+            N = self.N
+            lambdas = interaction_exp(self.T, N, self.lambda_as, self.lambda_bs,
+                                      self.lambda_cs, self.lambda_ds,
+                                      self.lambda_es, self.lambda_fs,
+                                      [[0.0]*N for _ in range(N)])
         self._lambdas = lambdas
         return lambdas
 
@@ -980,13 +1027,24 @@ class Wilson(GibbsExcess):
         except AttributeError:
             lambdas = self.lambdas()
         if self.vectorized:
-            dlambdas_dT = zeros((N, N))
-        else:
-            dlambdas_dT = [[0.0]*N for _ in range(N)]
+            Tinv = 1.0/T
+            nT2inv = -Tinv*Tinv
+            # The bracket is d(ln lambda)/dT; it is kept for the higher derivatives
+            self._dlnlambdas_dT = dlnlambdas_dT = (T*2.0*F + D + C*Tinv + B*nT2inv + E*(2.0*nT2inv*Tinv))
+            self._dlambdas_dT = dlambdas_dT = dlnlambdas_dT*lambdas
+            return dlambdas_dT
+        dlambdas_dT = [[0.0]*N for _ in range(N)]
 
         self._dlambdas_dT = dinteraction_exp_dT(T, N, B, C, D, E, F, lambdas, dlambdas_dT)
         return dlambdas_dT
 
+    def _dlnlambdas_dT_vectorized(self, lambdas, dlambdas_dT):
+        try:
+            return self._dlnlambdas_dT
+        except AttributeError:
+            # `dlambdas_dT` was not calculated by the vectorized branch
+            return dlambdas_dT/lambdas
+
     def d2lambdas_dT2(self):
         r'''Calculate and return the second temperature derivative of the
         `lambda` termsfor the Wilson model at the system temperature.
@@ -1025,10 +1083,17 @@ class Wilson(GibbsExcess):
         except AttributeError:
             dlambdas_dT = self.dlambdas_dT()
 
-        if not self.vectorized:
-            d2lambdas_dT2 = [[0.0]*N for _ in range(N)]
-        else:
-            d2lambdas_dT2 = zeros((N, N))
+        if self.vectorized:
+            Tinv = 1.0/T
+            nT2inv = -Tinv*Tinv
+            T3inv2 = -2.0*nT2inv*Tinv
+            dlnlambdas_dT = self._dlnlambdas_dT_vectorized(lambdas, dlambdas_dT)
+            d2lambdas_dT2 = (2.0*self.lambda_fs + nT2inv*self.lambda_cs + T3inv2*self.lambda_bs
+                             + (3.0*T3inv2*Tinv)*self.lambda_es + dlnlambdas_dT*dlnlambdas_dT)
+            d2lambdas_dT2 *= lambdas
+            self._d2lambdas_dT2 = d2lambdas_dT2
+            return d2lambdas_dT2
+        d2lambdas_dT2 = [[0.0]*N for _ in range(N)]
 
         self._d2lambdas_dT2 = d2interaction_exp_dT2(T, N, self.lambda_bs,
                                                                      self.lambda_cs,
@@ -1082,10 +1147,18 @@ class Wilson(GibbsExcess):
         except AttributeError:
             dlambdas_dT = self.dlambdas_dT()
 
-        if not self.vectorized:
-            d3lambdas_dT3s = [[0.0]*N for _ in range(N)]
-        else:
-            d3lambdas_dT3s = zeros((N, N))
+        if self.vectorized:
+            Tinv = 1.0/T
+            nT2inv = -Tinv*Tinv
+            T3inv = -nT2inv*Tinv
+            T3inv2 = T3inv + T3inv
+            term2 = lambda_fs + (0.5*nT2inv)*lambda_cs + T3inv*lambda_bs + (1.5*T3inv2*Tinv)*lambda_es
+            term3 = self._dlnlambdas_dT_vectorized(lambdas, dlambdas_dT)
+            term4 = T3inv2*(lambda_cs - (3.0*Tinv)*lambda_bs + (12.0*nT2inv)*lambda_es)
+            d3lambdas_dT3s = (term3*(6.0*term2 + term3*term3) + term4)*lambdas
+            self._d3lambdas_dT3 = d3lambdas_dT3s
+            return d3lambdas_dT3s
+        d3lambdas_dT3s = [[0.0]*N for _ in range(N)]
 
         self._d3lambdas_dT3 = d3interaction_exp_dT3(T, N, lambda_bs, lambda_cs, lambda_es,
                                                     lambda_fs, lambdas, dlambdas_dT, d3lambdas_dT3s)
@@ -1103,10 +1176,11 @@ class Wilson(GibbsExcess):
         except AttributeError:
             lambdas = self.lambdas()
 
-        if not self.vectorized:
-            xj_Lambda_ijs = [0.0]*self.N
-        else:
-            xj_Lambda_ijs = zeros(self.N)
+        if self.vectorized:
+            # Matrix-vector product, dispatched to BLAS
+            self._xj_Lambda_ijs = xj_Lambda_ijs = dot(lambdas, self.xs)
+            return xj_Lambda_ijs
+        xj_Lambda_ijs = [0.0]*self.N
 
         self._xj_Lambda_ijs = wilson_xj_Lambda_ijs(self.xs, lambdas, self.N, xj_Lambda_ijs)
         return xj_Lambda_ijs
@@ -1159,10 +1233,11 @@ class Wilson(GibbsExcess):
         except AttributeError:
             dlambdas_dT = self.dlambdas_dT()
 
-        if not self.vectorized:
-            xj_dLambda_dTijs = [0.0]*self.N
-        else:
-            xj_dLambda_dTijs = zeros(self.N)
+        if self.vectorized:
+            # Matrix-vector product, dispatched to BLAS
+            self._xj_dLambda_dTijs = xj_dLambda_dTijs = dot(dlambdas_dT, self.xs)
+            return xj_dLambda_dTijs
+        xj_dLambda_dTijs = [0.0]*self.N
 
         self._xj_dLambda_dTijs = wilson_xj_Lambda_ijs(self.xs, dlambdas_dT, self.N, xj_dLambda_dTijs)
         return xj_dLambda_dTijs
@@ -1180,10 +1255,11 @@ class Wilson(GibbsExcess):
         except AttributeError:
             d2lambdas_dT2 = self.d2lambdas_dT2()
 
-        if not self.vectorized:
-            xj_d2Lambda_dT2ijs = [0.0]*self.N
-        else:
-            xj_d2Lambda_dT2ijs = zeros(self.N)
+        if self.vectorized:
+            # Matrix-vector product, dispatched to BLAS
+            self._xj_d2Lambda_dT2ijs = xj_d2Lambda_dT2ijs = dot(d2lambdas_dT2, self.xs)
+            return xj_d2Lambda_dT2ijs
+        xj_d2Lambda_dT2ijs = [0.0]*self.N
 
         self._xj_d2Lambda_dT2ijs = wilson_xj_Lambda_ijs(self.xs, d2lambdas_dT2, self.N, xj_d2Lambda_dT2ijs)
         return xj_d2Lambda_dT2ijs
@@ -1200,10 +1276,11 @@ class Wilson(GibbsExcess):
         except AttributeError:
             d3lambdas_dT3 = self.d3lambdas_dT3()
 
-        if not self.vectorized:
-            xj_d3Lambda_dT3ijs = [0.0]*self.N
-        else:
-            xj_d3Lambda_dT3ijs = zeros(self.N)
+        if self.vectorized:
+            # Matrix-vector product, dispatched to BLAS
+            self._xj_d3Lambda_dT3ijs = xj_d3Lambda_dT3ijs = dot(d3lambdas_dT3, self.xs)
+            return xj_d3Lambda_dT3ijs
+        xj_d3Lambda_dT3ijs = [0.0]*self.N
 
         self._xj_d3Lambda_dT3ijs = wilson_xj_Lambda_ijs(self.xs, d3lambdas_dT3, self.N, xj_d3Lambda_dT3ijs)
         return xj_d3Lambda_dT3ijs
@@ -1546,10 +1623,17 @@ class Wilson(GibbsExcess):
         except AttributeError:
             xj_Lambda_ijs_inv = self.xj_Lambda_ijs_inv()
         N = self.N
-        if not self.vectorized:
-            d2GE_dxixjs = [[0.0]*N for _ in range(N)]
-        else:
-            d2GE_dxixjs = zeros((N, N))
+        if self.vectorized:
+            # lambdas.T @ diag(xs/S^2) @ lambdas, less the two correction terms
+            weighted = (self.xs*xj_Lambda_ijs_inv*xj_Lambda_ijs_inv)[:, None]*lambdas
+            d2GE_dxixjs = dot(weighted.T, lambdas)
+            corr = lambdas*xj_Lambda_ijs_inv[:, None]
+            d2GE_dxixjs -= corr
+            d2GE_dxixjs -= corr.T
+            d2GE_dxixjs *= R*self.T
+            self._d2GE_dxixjs = d2GE_dxixjs
+            return d2GE_dxixjs
+        d2GE_dxixjs = [[0.0]*N for _ in range(N)]
 
         d2GE_dxixjs = wilson_d2GE_dxixjs(self.xs, self.T, N, lambdas, xj_Lambda_ijs_inv, d2GE_dxixjs)
         self._d2GE_dxixjs = d2GE_dxixjs
@@ -1588,12 +1672,24 @@ class Wilson(GibbsExcess):
             xj_Lambda_ijs_inv = self.xj_Lambda_ijs_inv()
 
         N = self.N
-        if not self.vectorized:
-            d3GE_dxixjxks = [[[0.0]*N for _ in range(N)] for _ in range(N)]
-        else:
-            d3GE_dxixjxks = zeros((N, N, N))
-
-        # all the same: analytical[i][j][k] = analytical[i][k][j] = analytical[j][i][k] = analytical[j][k][i] = analytical[k][i][j] = analytical[k][j][i] = float(v)
+        if self.vectorized:
+            # The sum over i of the first term is one matrix product against
+            # the outer products lambdas[i, m]*lambdas[i, n]; the three
+            # corrections are permutations of corr[a, b, c] = lambdas[a, b]*lambdas[a, c]/S_a^2
+            inv2s = xj_Lambda_ijs_inv*xj_Lambda_ijs_inv
+            outer = lambdas[:, :, None]*lambdas[:, None, :]
+            weighted = (2.0*self.xs*inv2s*xj_Lambda_ijs_inv)[:, None]*lambdas
+            d3GE_dxixjxks = dot(weighted.T, outer.reshape(N, N*N)).reshape(N, N, N)
+            corr = outer*inv2s[:, None, None]
+            d3GE_dxixjxks -= corr
+            d3GE_dxixjxks -= corr.transpose(1, 0, 2)
+            d3GE_dxixjxks -= corr.transpose(2, 1, 0)
+            d3GE_dxixjxks *= -R*self.T
+            self._d3GE_dxixjxks = d3GE_dxixjxks
+            return d3GE_dxixjxks
+        d3GE_dxixjxks = [[[0.0]*N for _ in range(N)] for _ in range(N)]
+
+        # Symmetric: analytical[i][j][k] = analytical[i][k][j] = analytical[j][i][k] = analytical[j][k][i] = analytical[k][i][j] = analytical[k][j][i]
         d3GE_dxixjxks = wilson_d3GE_dxixjxks(self.xs, self.T, self.N, lambdas, xj_Lambda_ijs_inv, d3GE_dxixjxks)
         self._d3GE_dxixjxks = d3GE_dxixjxks
         return d3GE_dxixjxks
@@ -1617,15 +1713,80 @@ class Wilson(GibbsExcess):
         except AttributeError:
             xj_Lambda_ijs_inv = self.xj_Lambda_ijs_inv()
 
-        if not self.vectorized:
-            gammas = [0.0]*self.N
+        if self.vectorized:
+            # One matrix-vector product and a single exp call
+            gammas = dot(self.xs*xj_Lambda_ijs_inv, lambdas)
+            gammas -= 1.0
+            gammas = npexp(-gammas, out=gammas)
+            gammas *= xj_Lambda_ijs_inv
         else:
-            gammas = zeros(self.N)
-
-        wilson_gammas(self.xs, self.N, lambdas, xj_Lambda_ijs_inv, gammas)
+            gammas = [0.0]*self.N
+            wilson_gammas(self.xs, self.N, lambdas, xj_Lambda_ijs_inv, gammas)
         self._gammas = gammas
         return gammas
 
+    @classmethod
+    def GE_from_arrays(cls, Ts, xss, lambda_as=None, lambda_bs=None, lambda_cs=None,
+                       lambda_ds=None, lambda_es=None, lambda_fs=None):
+        r'''Calculate the excess Gibbs energy of many liquid states sharing
+        one set of Wilson parameters, without constructing a model object for
+        each state. All `M` lambda matrices are evaluated with NumPy at once.
+        Requires NumPy.
+
+        .. math::
+            G^E = -RT\sum_i x_i \ln\left(\sum_j x_j \Lambda_{ij}\right)
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures of the `M` states, [K]
+        xss : list[list[float]]
+            Mole fractions of each component in each state, (`M`, `N`) [-]
+        lambda_as : list[list[float]], optional
+            `a` parameters used in calculating :obj:`Wilson.lambdas`, [-]
+        lambda_bs : list[list[float]], optional
+            `b` parameters used in calculating :obj:`Wilson.lambdas`, [K]
+        lambda_cs : list[list[float]], optional
+            `c` parameters used in calculating :obj:`Wilson.lambdas`, [-]
+        lambda_ds : list[list[float]], optional
+            `d` paraemeters used in calculating :obj:`Wilson.lambdas`, [1/K]
+        lambda_es : list[list[float]], optional
+            `e` parameters used in calculating :obj:`Wilson.lambdas`, [K^2]
+        lambda_fs : list[list[float]], optional
+            `f` parameters used in calculating :obj:`Wilson.lambdas`, [1/K^2]
+
+        Returns
+        -------
+        GEs : ndarray
+            Excess Gibbs energy of each state, (`M`,) [J/mol]
+
+        Examples
+        --------
+        >>> lambda_as = [[0, log(0.154)], [log(0.888), 0]]
+        >>> Wilson.GE_from_arrays([300.0, 350.0], [[0.252, 0.748], [0.5, 0.5]], lambda_as=lambda_as).tolist()
+        [683.166, 883.993]
+        '''
+        Ts = array(Ts, dtype=float)
+        xss = array(xss, dtype=float)
+        M, N = xss.shape
+        T = Ts[:, None, None]
+        arg = zeros((M, N, N))
+        if lambda_as is not None:
+            arg += array(lambda_as, dtype=float)
+        if lambda_bs is not None:
+            arg += array(lambda_bs, dtype=float)/T
+        if lambda_cs is not None:
+            arg += array(lambda_cs, dtype=float)*nplog(T)
+        if lambda_ds is not None:
+            arg += array(lambda_ds, dtype=float)*T
+        if lambda_es is not None:
+            arg += array(lambda_es, dtype=float)/(T*T)
+        if lambda_fs is not None:
+            arg += array(lambda_fs, dtype=float)*(T*T)
+        lambdas = npexp(arg, out=arg)
+        xj_Lambda_ijs = np.matmul(lambdas, xss[:, :, None])[:, :, 0]
+        return -R*Ts*npsum(xss*nplog(xj_Lambda_ijs), axis=1)
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, use_numba=False,
                                   do_statistics=True, **kwargs):
@@ -1768,19 +1929,19 @@ def Wilson_gammas(xs, params):
        Wiley-VCH, 2012.
     '''
     gammas = []
-    cmps = range(len(xs))
+    N = len(xs)
 
     sums0 = []
-    for j in cmps:
+    for j in range(N):
         tot = 0.0
         paramsj = params[j]
-        for k in cmps:
+        for k in range(N):
             tot += paramsj[k]*xs[k]
         sums0.append(tot)
 
-    for i in cmps:
+    for i in range(N):
         tot2 = 0.
-        for j in cmps:
+        for j in range(N):
             tot2 += params[j][i]*xs[j]/sums0[j]
 
         gamma = exp(1. - log(sums0[i]) - tot2)